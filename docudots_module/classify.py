@@ -0,0 +1,107 @@
+"""
+Heading level classification kernel for DocuDots PDF Analysis Module
+====================================================================
+"""
+
+import numpy as np
+
+
+# Inputs smaller than this never pay numba's import and JIT/cache-load cost
+COMPILED_MIN_BLOCKS = 4096
+
+# Compiled kernel: None until first needed, False if numba is unavailable
+_compiled_loop = None
+
+
+# Size-ratio thresholds used by the cascade; a block's bucket is the number it reaches
+SIZE_RATIO_THRESHOLDS = np.array([0.95, 1.05, 1.15, 1.2, 1.5])
+
+
+def _classify_level(size_ratio: float, is_bold: bool, is_short: bool, is_capitalized: bool) -> int:
+    """Reference classification cascade for a single block."""
+    if size_ratio >= 1.5 or (size_ratio >= 1.2 and is_bold):
+        return 1
+    if size_ratio >= 1.15 or (size_ratio >= 1.05 and is_bold) or (is_capitalized and is_short):
+        return 2
+    if is_bold and is_short and size_ratio >= 0.95:
+        return 3
+    return 0
+
+
+# Level for every (size bucket, bold, short, capitalized) key; each bucket is
+# represented by its lower threshold (or 0 below the first one)
+LEVEL_TABLE = np.array([
+    _classify_level(bucket_ratio, bool(key & 4), bool(key & 2), bool(key & 1))
+    for bucket_ratio in np.concatenate(([0.0], SIZE_RATIO_THRESHOLDS))
+    for key in range(8)
+], dtype=np.int8)
+
+
+def _classify_levels_numpy(sizes: np.ndarray, flags: np.ndarray, is_short: np.ndarray,
+                           is_capitalized: np.ndarray, body_size: float) -> np.ndarray:
+    """Branchless NumPy implementation: bucket each block, then gather its level from LEVEL_TABLE."""
+    # Factor 1: Font size relative to body text
+    size_bucket = np.searchsorted(SIZE_RATIO_THRESHOLDS, sizes / body_size, side='right')
+
+    # Factor 2: Font weight (bold)
+    is_bold = (flags & 0x10) != 0
+
+    key = (size_bucket << 3) | (is_bold << 2) | (is_short << 1) | is_capitalized
+    return LEVEL_TABLE[key]
+
+
+def _classify_levels_loop(sizes, flags, is_short, is_capitalized, body_size):
+    """Single-pass loop implementation of the classification cascade, compiled with numba."""
+    n = sizes.shape[0]
+    levels = np.zeros(n, dtype=np.int8)
+
+    for i in range(n):
+        size_ratio = sizes[i] / body_size
+        is_bold = (flags[i] & 0x10) != 0
+
+        if size_ratio >= 1.5 or (size_ratio >= 1.2 and is_bold):
+            levels[i] = 1
+        elif size_ratio >= 1.15 or (size_ratio >= 1.05 and is_bold) or (is_capitalized[i] and is_short[i]):
+            levels[i] = 2
+        elif is_bold and is_short[i] and size_ratio >= 0.95:
+            levels[i] = 3
+
+    return levels
+
+
+def _get_compiled_loop():
+    """Import numba and compile the loop kernel on first use."""
+    global _compiled_loop
+
+    if _compiled_loop is None:
+        try:
+            from numba import njit
+            _compiled_loop = njit(cache=True, boundscheck=False, nogil=True)(_classify_levels_loop)
+        except ImportError:
+            # numba not available, use the NumPy implementation
+            _compiled_loop = False
+
+    return _compiled_loop
+
+
+def classify_levels(sizes: np.ndarray, flags: np.ndarray, is_short: np.ndarray,
+                    is_capitalized: np.ndarray, body_size: float) -> np.ndarray:
+    """
+    Assign a heading level to every text block.
+
+    Args:
+        sizes (np.ndarray): Font size of each block
+        flags (np.ndarray): PyMuPDF span flags of each block
+        is_short (np.ndarray): Whether each block has at most 8 words
+        is_capitalized (np.ndarray): Whether each block is upper or title case
+        body_size (float): Body text font size
+
+    Returns:
+        np.ndarray: Level of each block (1-3, 0 = not a heading)
+    """
+    if sizes.shape[0] >= COMPILED_MIN_BLOCKS:
+        compiled_loop = _get_compiled_loop()
+        if compiled_loop:
+            return compiled_loop(sizes, flags, is_short, is_capitalized, float(body_size))
+
+    return _classify_levels_numpy(sizes, flags, is_short, is_capitalized, body_size)
@@ -4,6 +4,7 @@ Configuration management for DocuDots PDF Analysis Module
 """
 
 import os
+import functools
 from typing import Dict, Any
 
 
@@ -24,6 +25,13 @@ class Config:
         self.MAX_PROCESSING_TIME_SECONDS = int(os.getenv('DOCUDOTS_MAX_PROCESSING_TIME', '300'))
         self.MAX_HEADINGS_PER_DOCUMENT = int(os.getenv('DOCUDOTS_MAX_HEADINGS', '50'))
         self.MAX_TEXT_BLOCKS = int(os.getenv('DOCUDOTS_MAX_TEXT_BLOCKS', '10000'))
+        self.EXTRACT_WORKERS = int(os.getenv('DOCUDOTS_EXTRACT_WORKERS', str(os.cpu_count() or 1)))
+        # Page extraction of one document is sharded across processes only when this
+        # is raised above 1: the per-page work is small next to starting the workers
+        self.PAGE_WORKERS = int(os.getenv('DOCUDOTS_PAGE_WORKERS', '1'))
+        self.POOL_MAX_BUFFERS = int(os.getenv('DOCUDOTS_POOL_MAX_BUFFERS', '2'))
+        self.PREFETCH_FILES = int(os.getenv('DOCUDOTS_PREFETCH_FILES', '2'))
+        self.RESULT_CACHE_SIZE = int(os.getenv('DOCUDOTS_RESULT_CACHE_SIZE', '64'))
         
         # Heading detection parameters
         self.HEADING_SCORE_THRESHOLD = int(os.getenv('DOCUDOTS_HEADING_THRESHOLD', '25'))
@@ -71,6 +79,23 @@ class Config:
         self.OUTPUT_ENCODING = os.getenv('DOCUDOTS_OUTPUT_ENCODING', 'utf-8')
         self.JSON_INDENT = int(os.getenv('DOCUDOTS_JSON_INDENT', '2'))
         
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def default(cls) -> 'Config':
+        """
+        Get the shared, validated configuration built from the environment.
+        
+        The environment is read once per process. The returned instance is
+        shared by every caller and must not be modified; create a ``Config()``
+        to customize settings.
+        
+        Returns:
+            Config: Shared default configuration
+        """
+        config = cls()
+        config.validate()
+        return config
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert configuration to dictionary.
@@ -84,7 +109,12 @@ class Config:
                 'max_pages': self.MAX_PAGES,
                 'max_processing_time_seconds': self.MAX_PROCESSING_TIME_SECONDS,
                 'max_headings_per_document': self.MAX_HEADINGS_PER_DOCUMENT,
-                'max_text_blocks': self.MAX_TEXT_BLOCKS
+                'max_text_blocks': self.MAX_TEXT_BLOCKS,
+                'extract_workers': self.EXTRACT_WORKERS,
+                'page_workers': self.PAGE_WORKERS,
+                'pool_max_buffers': self.POOL_MAX_BUFFERS,
+                'prefetch_files': self.PREFETCH_FILES,
+                'result_cache_size': self.RESULT_CACHE_SIZE
             },
             'heading_detection': {
                 'score_threshold': self.HEADING_SCORE_THRESHOLD,
@@ -137,6 +167,21 @@ class Config:
         if self.MAX_PROCESSING_TIME_SECONDS <= 0:
             raise ValueError("MAX_PROCESSING_TIME_SECONDS must be positive")
         
+        if self.EXTRACT_WORKERS < 1:
+            raise ValueError("EXTRACT_WORKERS must be at least 1")
+        
+        if self.PAGE_WORKERS < 1:
+            raise ValueError("PAGE_WORKERS must be at least 1")
+        
+        if self.POOL_MAX_BUFFERS < 0:
+            raise ValueError("POOL_MAX_BUFFERS must be non-negative")
+        
+        if self.PREFETCH_FILES < 0:
+            raise ValueError("PREFETCH_FILES must be non-negative")
+        
+        if self.RESULT_CACHE_SIZE < 0:
+            raise ValueError("RESULT_CACHE_SIZE must be non-negative")
+        
         if not all(ratio > 0 for ratio in self.FONT_SIZE_RATIOS.values()):
             raise ValueError("All font size ratios must be positive")
         
@@ -6,13 +6,26 @@ Main PDFAnalyzer class that provides the public API for PDF structure extraction
 """
 
 import os
+import copy
 import json
+import hashlib
 import time
 import logging
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, Iterator, List, Optional, Union, Any
 
 import fitz  # PyMuPDF
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    # orjson not available, use the standard library encoder
+    orjson = None
 
 from exceptions import (
     PDFAnalysisError,
@@ -27,7 +40,23 @@ from config import Config
 from validators import InputValidator
 from retry import with_retry, with_timeout
 from multilingual import MultilingualProcessor
+from text_blocks import Span, TextBlocks
+from classify import classify_levels
+
+
+# Shared formatter for the analyzer's log handler
+LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# Pages per worker when a large document is extracted in parallel;
+# documents with fewer than two tasks' worth of pages are extracted in-process
+PAGES_PER_EXTRACT_TASK = 16
+
+# Start method of all worker processes: pools may be started while the with_timeout
+# or prefetch threads are running, and forking a process with other threads is unsafe
+WORKER_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
 
+# Typical number of text spans per page, used to pre-size block stores
+EXPECTED_SPANS_PER_PAGE = 80
 
 class PDFAnalyzer:
     """
@@ -49,32 +78,39 @@ class PDFAnalyzer:
         Initialize the PDF analyzer.
         
         Args:
-            config (Optional[Config]): Configuration object. If None, uses default config.
+            config (Optional[Config]): Configuration object. If None, uses the shared default config.
         """
-        self.config = config or Config()
+        self.config = config or Config.default()
         self.validator = InputValidator(self.config)
         self.multilingual = MultilingualProcessor()
+        self.extract_workers = self.config.PAGE_WORKERS
+        self.result_cache_size = self.config.RESULT_CACHE_SIZE
+        
+        # Block stores kept between documents to avoid reallocating arrays
+        self._text_block_pool: List[TextBlocks] = []
+        
+        # Recent analysis results keyed by content digest (least recently used first)
+        self._result_cache: OrderedDict = OrderedDict()
         
         # Setup logging
         self.logger = logging.getLogger(__name__)
         if not self.logger.handlers:
             handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
+            handler.setFormatter(LOG_FORMATTER)
             self.logger.addHandler(handler)
             self.logger.setLevel(getattr(logging, self.config.LOG_LEVEL))
     
     def analyze_pdf(self, 
                    pdf_path: Union[str, Path], 
-                   output_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+                   output_path: Optional[Union[str, Path]] = None,
+                   data: Optional[bytes] = None) -> Dict[str, Any]:
         """
         Analyze a PDF file and extract its structural outline.
         
         Args:
             pdf_path (Union[str, Path]): Path to the PDF file to analyze
             output_path (Optional[Union[str, Path]]): Optional path to save JSON output
+            data (Optional[bytes]): Content of the PDF file if already read into memory
             
         Returns:
             Dict[str, Any]: Dictionary containing:
@@ -86,31 +122,45 @@ class PDFAnalyzer:
             PDFAnalysisError: If analysis fails
             AnalysisTimeoutError: If analysis times out
         """
-        pdf_path = Path(pdf_path)
+        if not isinstance(pdf_path, Path):
+            pdf_path = Path(pdf_path)
         
-        self.logger.info(f"Starting analysis of PDF: {pdf_path.name}")
+        self.logger.info("Starting analysis of PDF: %s", pdf_path.name)
         start_time = time.time()
         
         try:
-            # Validate input
-            self.validator.validate_pdf_file(pdf_path)
+            # Validate input; the document opened for validation is handed to the
+            # first analysis attempt, whichever side takes it from the list closes it
+            opened_docs = [self.validator.open_validated_pdf(pdf_path, data)]
             
-            # Perform analysis with timeout and retry
-            result = self._analyze_pdf_with_retry(pdf_path)
+            try:
+                # Reuse the result of an identical document analyzed earlier
+                cache_key = self._result_cache_key(pdf_path, data) if self.result_cache_size > 0 else None
+                cached = self._cached_result(cache_key)
+                
+                if cached is not None:
+                    result = copy.deepcopy(cached)
+                    self.logger.info("Using cached analysis result for %s", pdf_path.name)
+                else:
+                    # Perform analysis with timeout and retry
+                    result = self._analyze_pdf_with_retry(pdf_path, data, opened_docs)
+                    self._store_result(cache_key, result)
+            finally:
+                _close_unclaimed(opened_docs)
             
             # Save output if requested
             if output_path:
                 output_path = Path(output_path)
                 self._save_json_output(result, output_path)
-                self.logger.info(f"Saved output to: {output_path}")
+                self.logger.info("Saved output to: %s", output_path)
             
             elapsed = time.time() - start_time
-            self.logger.info(f"Analysis complete - Title: '{result['title'][:20]}...' (took {elapsed:.2f}s)")
+            self.logger.info("Analysis complete - Title: '%s...' (took %.2fs)", result['title'][:20], elapsed)
             
             return result
             
         except Exception as e:
-            self.logger.error(f"Analysis failed for {pdf_path.name}: {str(e)}")
+            self.logger.error("Analysis failed for %s: %s", pdf_path.name, e)
             raise
     
     def analyze_multiple_pdfs(self, 
@@ -124,7 +174,9 @@ class PDFAnalyzer:
             output_dir (Optional[Union[str, Path]]): Directory to save JSON outputs
             
         Returns:
-            Dict[str, Any]: Summary of processing results
+            Dict[str, Any]: Summary of processing results. When ``output_dir`` is
+            given, "results" maps each file name to its output path instead of
+            holding every analysis result in memory.
         """
         results = {
             "total_files": len(pdf_paths),
@@ -136,30 +188,90 @@ class PDFAnalyzer:
         }
         
         start_time = time.time()
+        pdf_paths = [Path(pdf_path) for pdf_path in pdf_paths]
+        output_dir = Path(output_dir) if output_dir else None
+        workers = min(self.config.EXTRACT_WORKERS, len(pdf_paths))
         
-        for pdf_path in pdf_paths:
-            pdf_path = Path(pdf_path)
-            try:
-                # Analyze PDF
-                result = self.analyze_pdf(pdf_path)
-                
-                # Save output if directory specified
-                if output_dir:
-                    output_path = Path(output_dir) / f"{pdf_path.stem}.json"
-                    self._save_json_output(result, output_path)
-                
-                results["results"][pdf_path.name] = result
-                results["processed"] += 1
-                
-            except Exception as e:
-                results["errors"] += 1
-                error_info = {
-                    "file": pdf_path.name,
-                    "error": str(e),
-                    "type": type(e).__name__
-                }
-                results["error_details"].append(error_info)
-                self.logger.error(f"Failed to process {pdf_path.name}: {str(e)}")
+        with ExitStack() as stack:
+            if workers > 1:
+                # Files are independent: analyze them in worker processes. The result
+                # cache is consulted here, so files analyzed before are not submitted
+                # and files with identical content share one worker task
+                mp_context = multiprocessing.get_context(WORKER_START_METHOD)
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers, mp_context=mp_context))
+                futures = []
+                cached_results = []
+                cache_keys = []
+                submitted = {}
+                # Tasks whose result was already taken by an earlier file
+                claimed = set()
+                for pdf_path in pdf_paths:
+                    cache_key = self._result_cache_key(pdf_path) if self.result_cache_size > 0 else None
+                    cached = self._cached_result(cache_key)
+                    future = None
+                    if cached is None:
+                        future = submitted.get(cache_key)
+                        if future is None:
+                            future = executor.submit(_analyze_pdf_worker, self.config, pdf_path)
+                            if cache_key:
+                                submitted[cache_key] = future
+                    futures.append(future)
+                    cached_results.append(cached)
+                    cache_keys.append(cache_key)
+            else:
+                futures = None
+                reads = [None] * len(pdf_paths)
+                prefetch_depth = self.config.PREFETCH_FILES
+                if prefetch_depth > 0:
+                    # Read upcoming files in the background while the current one is analyzed
+                    reader = stack.enter_context(ThreadPoolExecutor(max_workers=prefetch_depth))
+                    for index in range(min(prefetch_depth, len(pdf_paths))):
+                        reads[index] = reader.submit(self._read_pdf_bytes, pdf_paths[index])
+            
+            for index, pdf_path in enumerate(pdf_paths):
+                try:
+                    # Analyze PDF
+                    if futures is None:
+                        data = None
+                        if reads[index] is not None:
+                            data = reads[index].result()
+                            reads[index] = None
+                            next_index = index + prefetch_depth
+                            if next_index < len(pdf_paths):
+                                reads[next_index] = reader.submit(self._read_pdf_bytes, pdf_paths[next_index])
+                        result = self.analyze_pdf(pdf_path, data=data)
+                    elif cached_results[index] is not None:
+                        result = copy.deepcopy(cached_results[index])
+                        cached_results[index] = None
+                        self.logger.info("Using cached analysis result for %s", pdf_path.name)
+                    else:
+                        result = futures[index].result()
+                        if futures[index] in claimed:
+                            # A duplicate of an earlier file in this batch: same task, own copy
+                            result = copy.deepcopy(result)
+                        else:
+                            claimed.add(futures[index])
+                            self._store_result(cache_keys[index], result)
+                        futures[index] = None
+                    
+                    # Save output if directory specified; only the path is kept in the summary
+                    if output_dir:
+                        output_path = output_dir / f"{pdf_path.stem}.json"
+                        self._save_json_output(result, output_path)
+                        results["results"][pdf_path.name] = str(output_path)
+                    else:
+                        results["results"][pdf_path.name] = result
+                    results["processed"] += 1
+                    
+                except Exception as e:
+                    results["errors"] += 1
+                    error_info = {
+                        "file": pdf_path.name,
+                        "error": str(e),
+                        "type": type(e).__name__
+                    }
+                    results["error_details"].append(error_info)
+                    self.logger.error("Failed to process %s: %s", pdf_path.name, e)
         
         # Calculate final stats
         results["success_rate"] = (results["processed"] / results["total_files"]) * 100
@@ -169,67 +281,69 @@ class PDFAnalyzer:
     
     @with_timeout(300)  # 5 minute timeout
     @with_retry(max_attempts=3, delay=1.0, backoff=2.0)
-    def _analyze_pdf_with_retry(self, pdf_path: Path) -> Dict[str, Any]:
+    def _analyze_pdf_with_retry(self, pdf_path: Path, data: Optional[bytes] = None,
+                                opened_docs: Optional[List[fitz.Document]] = None) -> Dict[str, Any]:
         """
         Internal method to analyze PDF with retry logic.
         
         Args:
             pdf_path (Path): Path to PDF file
+            data (Optional[bytes]): Content of the PDF file if already read into memory
+            opened_docs (Optional[List[fitz.Document]]): Already opened document to claim
             
         Returns:
             Dict[str, Any]: Analysis result
         """
-        return self._analyze_pdf_structure(pdf_path)
+        return self._analyze_pdf_structure(pdf_path, data, opened_docs)
     
-    def _analyze_pdf_structure(self, pdf_path: Path) -> Dict[str, Any]:
+    def _analyze_pdf_structure(self, pdf_path: Path, data: Optional[bytes] = None,
+                               opened_docs: Optional[List[fitz.Document]] = None) -> Dict[str, Any]:
         """
         Core PDF analysis logic.
         
         Args:
             pdf_path (Path): Path to PDF file
+            data (Optional[bytes]): Content of the PDF file if already read into memory
+            opened_docs (Optional[List[fitz.Document]]): Already opened document to claim;
+                retries find the list empty and open the file again
             
         Returns:
             Dict[str, Any]: Dictionary with title and outline
         """
+        doc = None
         try:
-            # Open PDF
-            doc = fitz.open(str(pdf_path))
-            self.logger.info(f"Successfully opened PDF with {len(doc)} pages")
+            # Open PDF, unless validation already did
+            doc = _claim_document(opened_docs)
+            if doc is None and data is not None:
+                doc = fitz.open(stream=data, filetype="pdf")
+            elif doc is None:
+                doc = fitz.open(str(pdf_path))
+            self.logger.info("Successfully opened PDF with %d pages", len(doc))
             
-            # Extract text blocks
+            # Extract text blocks (multi-lingual normalization is applied while streaming)
             self.logger.info("Extracting text blocks from PDF...")
-            all_blocks = []
+            page_count = len(doc)
+            workers = min(self.extract_workers, page_count // PAGES_PER_EXTRACT_TASK)
             
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                blocks = page.get_text("dict")["blocks"]
-                
-                for block in blocks:
-                    if "lines" in block:
-                        for line in block["lines"]:
-                            for span in line["spans"]:
-                                if span["text"].strip():
-                                    all_blocks.append({
-                                        "text": span["text"].strip(),
-                                        "page": page_num,
-                                        "font_size": span["size"],
-                                        "font_flags": span["flags"],
-                                        "bbox": span["bbox"]
-                                    })
+            if workers > 1:
+                # PyMuPDF documents are not fork-safe: each worker reopens the file
+                doc.close()
+                all_blocks = self._extract_text_blocks_parallel(pdf_path, page_count, workers)
+            else:
+                all_blocks = self._acquire_text_blocks()
+                all_blocks.reserve(page_count * EXPECTED_SPANS_PER_PAGE)
+                all_blocks = _extract_text_blocks(doc, range(page_count), all_blocks, self.multilingual)
+                doc.close()
             
-            doc.close()
+            if all_blocks.truncated:
+                self.logger.warning("Text blocks exceed limit (%d). Truncating...", self.config.MAX_TEXT_BLOCKS)
             
-            self.logger.info(f"Extracted {len(all_blocks)} text blocks from document")
-            
-            # Apply multilingual processing
-            self.logger.info("Applying multi-lingual text processing...")
-            all_blocks = self.multilingual.process_text_blocks(all_blocks)
-            
-            self.logger.info(f"Total text blocks extracted: {len(all_blocks)}")
+            self.logger.info("Extracted %d text blocks from document", len(all_blocks))
             
             # Identify title and headings
             self.logger.info("Performing heading identification and classification...")
             title, headings = self._identify_headings(all_blocks)
+            self._release_text_blocks(all_blocks)
             
             # Create final result
             result = {
@@ -237,120 +351,226 @@ class PDFAnalyzer:
                 "outline": headings
             }
             
-            self.logger.info(f"Final headings count: {len(headings)}")
+            self.logger.info("Final headings count: %d", len(headings))
             
             return result
             
         except Exception as e:
+            if doc is not None and not doc.is_closed:
+                doc.close()
             raise PDFAnalysisError(f"Failed to analyze PDF structure: {str(e)}") from e
     
-    def _identify_headings(self, blocks: List[Dict]) -> tuple[str, List[Dict]]:
+    def _result_cache_key(self, pdf_path: Path, data: Optional[bytes] = None) -> Optional[str]:
+        """
+        Compute the result cache key of a PDF from its content.
+        
+        Args:
+            pdf_path (Path): Path to PDF file
+            data (Optional[bytes]): Content of the PDF file if already read into memory
+            
+        Returns:
+            Optional[str]: Content digest, or None if the file cannot be read
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        
+        if data is not None:
+            digest.update(data)
+        else:
+            try:
+                with open(pdf_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                        digest.update(chunk)
+            except OSError:
+                return None
+        
+        return digest.hexdigest()
+    
+    def _cached_result(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached analysis result, marking it as recently used.
+        
+        Args:
+            cache_key (Optional[str]): Result cache key, or None if the document has none
+            
+        Returns:
+            Optional[Dict[str, Any]]: The cached result (callers copy it), or None
+        """
+        cached = self._result_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+        return cached
+    
+    def _store_result(self, cache_key: Optional[str], result: Dict[str, Any]) -> None:
+        """
+        Cache a copy of an analysis result, evicting the least recently used one when full.
+        
+        Args:
+            cache_key (Optional[str]): Result cache key, or None if the document has none
+            result (Dict[str, Any]): Analysis result
+        """
+        if not cache_key:
+            return
+        self._result_cache[cache_key] = copy.deepcopy(result)
+        self._result_cache.move_to_end(cache_key)
+        if len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+    
+    def _read_pdf_bytes(self, pdf_path: Path) -> Optional[bytes]:
+        """
+        Read a PDF file into memory for prefetching.
+        
+        Args:
+            pdf_path (Path): Path to PDF file
+            
+        Returns:
+            Optional[bytes]: File content, or None if it cannot or should not be
+            prefetched (errors are then reported by validation)
+        """
+        try:
+            if pdf_path.stat().st_size > self.config.MAX_FILE_SIZE_MB * 1024 * 1024:
+                return None
+            return pdf_path.read_bytes()
+        except OSError:
+            return None
+    
+    def _acquire_text_blocks(self) -> TextBlocks:
+        """
+        Get an empty block store, reusing a pooled one when available.
+        
+        Returns:
+            TextBlocks: Empty block store limited to MAX_TEXT_BLOCKS
+        """
+        if self._text_block_pool:
+            return self._text_block_pool.pop()
+        return TextBlocks(max_blocks=self.config.MAX_TEXT_BLOCKS)
+    
+    def _release_text_blocks(self, blocks: TextBlocks) -> None:
+        """
+        Return a block store to the pool, keeping its allocated capacity.
+        
+        Args:
+            blocks (TextBlocks): Block store no longer in use
+        """
+        if (len(self._text_block_pool) < self.config.POOL_MAX_BUFFERS
+                and blocks.max_blocks == self.config.MAX_TEXT_BLOCKS):
+            blocks.clear()
+            self._text_block_pool.append(blocks)
+    
+    def _extract_text_blocks_parallel(self, pdf_path: Path, page_count: int, workers: int) -> TextBlocks:
+        """
+        Extract text blocks with page ranges sharded across worker processes.
+        
+        Args:
+            pdf_path (Path): Path to PDF file
+            page_count (int): Number of pages in the document
+            workers (int): Number of worker processes
+            
+        Returns:
+            TextBlocks: Text blocks of all pages in document order
+        """
+        bounds = np.linspace(0, page_count, workers + 1).astype(int)
+        max_blocks = self.config.MAX_TEXT_BLOCKS
+        
+        self.logger.info("Extracting %d pages with %d worker processes", page_count, workers)
+        
+        mp_context = multiprocessing.get_context(WORKER_START_METHOD)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+            parts = list(executor.map(
+                _extract_page_range,
+                [str(pdf_path)] * workers,
+                bounds[:-1].tolist(),
+                bounds[1:].tolist(),
+                [max_blocks] * workers
+            ))
+        
+        return TextBlocks.concatenate(parts, max_blocks=max_blocks)
+    
+    def _identify_headings(self, blocks: TextBlocks) -> tuple[str, List[Dict]]:
         """
         Identify document title and headings from text blocks.
         
+        Heading rules are evaluated as vectorized comparisons over the block
+        columns; dictionaries are only materialized for the headings that make
+        it into the output.
+        
         Args:
-            blocks (List[Dict]): List of text blocks
+            blocks (TextBlocks): Columnar text blocks
             
         Returns:
             tuple: (title, headings_list)
         """
-        if not blocks:
+        if not len(blocks):
             return "Untitled Document", []
         
         self.logger.info("Starting comprehensive heading analysis...")
         
-        # Analyze font characteristics
-        font_sizes = [block["font_size"] for block in blocks]
-        avg_font_size = sum(font_sizes) / len(font_sizes)
+        n = len(blocks)
+        sizes = blocks.font_sizes
+        flags = blocks.font_flags
+        pages = blocks.pages
+        raw_texts = np.empty(n, dtype=object)
+        raw_texts[:] = blocks.texts
+        texts = [text.strip() for text in raw_texts]
         
-        # Identify body text size (most common size)
-        size_counts = {}
-        for size in font_sizes:
-            size_counts[size] = size_counts.get(size, 0) + 1
-        body_text_size = max(size_counts, key=size_counts.get)
+        # Identify body text size (most common size, earliest seen wins ties)
+        unique_sizes, first_index, counts = np.unique(sizes, return_index=True, return_counts=True)
+        most_common = counts == counts.max()
+        body_text_size = float(unique_sizes[most_common][np.argmin(first_index[most_common])])
         
-        min_size = min(font_sizes)
-        max_size = max(font_sizes)
+        # Font statistics are only needed for the log message
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Font analysis - Body text size: %s, Average: %.2f, Range: %s-%s",
+                             body_text_size, sizes.mean(), unique_sizes[0], unique_sizes[-1])
         
-        self.logger.info(f"Font analysis - Body text size: {body_text_size}, Average: {avg_font_size:.2f}, Range: {min_size}-{max_size}")
-        
-        # Find title (largest text on first page, usually)
-        first_page_blocks = [b for b in blocks if b["page"] == 0]
-        if first_page_blocks:
-            title_block = max(first_page_blocks, key=lambda x: x["font_size"])
-            title = title_block["text"]
+        # Find title (largest text on first page, usually; tracked during extraction)
+        if blocks.title_index >= 0:
+            title = raw_texts[blocks.title_index]
         else:
             title = "Untitled Document"
         
-        # Identify heading candidates
-        heading_candidates = []
-        for block in blocks:
-            # Skip if it's the title
-            if block["text"] == title:
-                continue
-                
-            # Multi-factor heading detection
-            is_heading = False
-            heading_level = "H3"  # default
-            
-            # Factor 1: Font size relative to body text
-            size_ratio = block["font_size"] / body_text_size
-            
-            # Factor 2: Font weight (bold)
-            is_bold = bool(block["font_flags"] & 2**4)  # Bold flag
-            
-            # Factor 3: Text characteristics
-            text = block["text"].strip()
-            is_short = len(text.split()) <= 8
-            is_capitalized = text.isupper() or text.istitle()
-            
-            # Heading classification logic
-            if size_ratio >= 1.5 or (size_ratio >= 1.2 and is_bold):
-                is_heading = True
-                heading_level = "H1"
-            elif size_ratio >= 1.15 or (size_ratio >= 1.05 and is_bold) or (is_capitalized and is_short):
-                is_heading = True
-                heading_level = "H2"
-            elif is_bold and is_short and size_ratio >= 0.95:
-                is_heading = True
-                heading_level = "H3"
-            
-            if is_heading:
-                heading_candidates.append({
-                    "level": heading_level,
-                    "text": text,
-                    "page": block["page"],
-                    "font_size": block["font_size"],
-                    "size_ratio": size_ratio,
-                    "is_bold": is_bold
-                })
-        
-        self.logger.info(f"Identified {len(heading_candidates)} heading candidates")
+        # Text characteristics (string checks stay in Python; the numeric cascade is compiled when numba is available).
+        # Texts are whitespace-normalized, so counting single spaces gives the word count without splitting.
+        is_short = np.fromiter((text.count(' ') < 8 for text in texts), dtype=bool, count=n)
+        is_capitalized = np.fromiter((text.isupper() or text.istitle() for text in texts), dtype=bool, count=n)
         
-        # Sort by page and position
-        heading_candidates.sort(key=lambda x: (x["page"], -x["font_size"]))
+        # Heading classification logic (0 = not a heading)
+        levels = classify_levels(sizes, flags, is_short, is_capitalized, body_text_size)
         
-        # Limit headings and create final list
-        max_headings = self.config.MAX_HEADINGS_PER_DOCUMENT
-        final_headings = heading_candidates[:max_headings]
+        # Skip the title itself
+        levels[raw_texts == title] = 0
         
-        # Count by level for logging
-        level_counts = {}
-        for h in final_headings:
-            level_counts[h["level"]] = level_counts.get(h["level"], 0) + 1
+        candidates = np.flatnonzero(levels)
+        self.logger.info("Identified %d heading candidates", candidates.size)
         
-        self.logger.info(f"Heading classification: {level_counts}")
+        # Limit headings: blocks are stored in page order, so only candidates up to the
+        # page of the last kept heading can make the cut and need to be sorted
+        max_headings = self.config.MAX_HEADINGS_PER_DOCUMENT
+        if 0 < max_headings < candidates.size:
+            candidate_pages = pages[candidates]
+            cutoff = np.searchsorted(candidate_pages, candidate_pages[max_headings - 1], side='right')
+            candidates = candidates[:cutoff]
+        
+        # Sort by page and position
+        order = candidates[np.lexsort((-sizes[candidates], pages[candidates]))]
+        final_indices = order[:max_headings]
         
         # Create clean output format
-        clean_headings = []
-        for heading in final_headings:
-            clean_headings.append({
-                "level": heading["level"],
-                "text": heading["text"],
-                "page": heading["page"]
-            })
+        clean_headings = [
+            {
+                "level": f"H{levels[i]}",
+                "text": texts[i],
+                "page": int(pages[i])
+            }
+            for i in final_indices
+        ]
         
-        self.logger.info(f"Final results - Title: '{title[:20]}...', Headings: {len(clean_headings)}")
+        if self.logger.isEnabledFor(logging.INFO):
+            level_counts = {}
+            for heading in clean_headings:
+                level_counts[heading["level"]] = level_counts.get(heading["level"], 0) + 1
+            self.logger.info("Heading classification: %s", level_counts)
+        
+        self.logger.info("Final results - Title: '%s...', Headings: %d", title[:20], len(clean_headings))
         
         return title, clean_headings
     
@@ -365,8 +585,134 @@ class PDFAnalyzer:
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                output_path.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(result, f, indent=2, ensure_ascii=False)
                 
         except Exception as e:
             raise PDFAnalysisError(f"Failed to save JSON output: {str(e)}") from e
+
+
+def _claim_document(opened_docs: Optional[List[fitz.Document]]) -> Optional[fitz.Document]:
+    """
+    Take ownership of an already opened document, if one is still available.
+    
+    ``list.pop`` is atomic, so exactly one of the analysis thread and the
+    caller ends up with the document (and is responsible for closing it).
+    
+    Args:
+        opened_docs (Optional[List[fitz.Document]]): Holder of at most one open document
+        
+    Returns:
+        Optional[fitz.Document]: The document, or None if there is none to claim
+    """
+    try:
+        return opened_docs.pop() if opened_docs else None
+    except IndexError:
+        return None
+
+
+def _close_unclaimed(opened_docs: List[fitz.Document]) -> None:
+    """Close the document held in ``opened_docs`` if no analysis attempt claimed it."""
+    doc = _claim_document(opened_docs)
+    if doc is not None:
+        doc.close()
+
+
+def _iter_spans(doc: fitz.Document, page_numbers: range) -> Iterator[Span]:
+    """
+    Stream non-empty text spans from the given pages, one page at a time.
+    
+    Only the current page's text dictionary is alive at any moment.
+    
+    Args:
+        doc (fitz.Document): Open PyMuPDF document
+        page_numbers (range): Pages to extract, in order
+        
+    Yields:
+        Span: Stripped text, page, font size and font flags of each span
+    """
+    for page_num in page_numbers:
+        page = doc.load_page(page_num)
+        blocks = page.get_text("dict")["blocks"]
+        
+        for block in blocks:
+            if "lines" in block:
+                for line in block["lines"]:
+                    for span in line["spans"]:
+                        text = span["text"].strip()
+                        if text:
+                            yield Span(text, page_num, span["size"], span["flags"])
+
+
+def _extract_text_blocks(doc: fitz.Document, page_numbers: range, all_blocks: TextBlocks,
+                         multilingual: MultilingualProcessor) -> TextBlocks:
+    """
+    Extract and normalize text spans from the given pages of an open document.
+    
+    Text is normalized while streaming, so raw span dictionaries and
+    unnormalized texts are never held for the whole document.
+    
+    Args:
+        doc (fitz.Document): Open PyMuPDF document
+        page_numbers (range): Pages to extract, in order
+        all_blocks (TextBlocks): Empty block store to fill
+        multilingual (MultilingualProcessor): Text normalizer
+        
+    Returns:
+        TextBlocks: ``all_blocks``, filled with the extracted text blocks
+    """
+    for span in _iter_spans(doc, page_numbers):
+        text = multilingual.normalize_text(span.text)
+        if not all_blocks.append(text, span.page, span.size, span.flags):
+            break
+    
+    return all_blocks
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int, max_blocks: int) -> TextBlocks:
+    """
+    Worker entry point: open the PDF and extract pages ``start`` to ``stop``.
+    
+    Args:
+        pdf_path (str): Path to PDF file
+        start (int): First page (inclusive)
+        stop (int): Last page (exclusive)
+        max_blocks (int): Maximum number of blocks to keep
+        
+    Returns:
+        TextBlocks: Extracted text blocks, trimmed to size
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        all_blocks = _extract_text_blocks(
+            doc, range(start, stop),
+            TextBlocks(capacity=(stop - start) * EXPECTED_SPANS_PER_PAGE, max_blocks=max_blocks),
+            MultilingualProcessor()
+        )
+    finally:
+        doc.close()
+    
+    all_blocks.trim()
+    return all_blocks
+
+
+def _analyze_pdf_worker(config: Config, pdf_path: Path) -> Dict[str, Any]:
+    """
+    Worker entry point: analyze a single PDF in a separate process.
+    
+    Args:
+        config (Config): Configuration of the parent analyzer
+        pdf_path (Path): Path to PDF file
+        
+    Returns:
+        Dict[str, Any]: Analysis result
+    """
+    analyzer = PDFAnalyzer(config)
+    # Already running inside a worker process: extract pages serially
+    analyzer.extract_workers = 1
+    # The analyzer only lives for this file; the parent process caches the results
+    analyzer.result_cache_size = 0
+    return analyzer.analyze_pdf(pdf_path)
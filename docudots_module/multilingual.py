@@ -4,272 +4,504 @@ Multi-lingual support utilities for DocuDots PDF Analysis Module
 """
 
 import re
+import sys
+import functools
 import unicodedata
-from typing import Dict, List, Optional, Any
+from collections import Counter
+from typing import Dict, List, Optional, Any, Tuple
 
+import numpy as np
 
-class MultilingualProcessor:
+
+# Maximum number of distinct characters whose script classification is memoized
+_CHAR_SCRIPT_CACHE_SIZE = 65536
+
+# Per-text result caches: maximum entries, and longest text worth caching
+_RESULT_CACHE_SIZE = 4096
+_CACHEABLE_TEXT_LENGTH = 256
+
+# Texts at least this long are classified with a vectorized code point histogram
+_HISTOGRAM_MIN_LENGTH = 128
+
+# str.translate table mapping full-width ASCII (U+FF01-U+FF5E) to ASCII
+_FULLWIDTH_TABLE = {code: code - 0xFEE0 for code in range(0xFF01, 0xFF5F)}
+
+# str.translate table mapping precomposed Latin-1 Supplement and Latin Extended-A
+# letters that decompose to an ASCII letter plus nonspacing marks to that letter
+_LATIN_DEACCENT_TABLE = {
+    code: decomposed[0]
+    for code, decomposed in (
+        (code, unicodedata.normalize('NFD', chr(code))) for code in range(0xC0, 0x180)
+    )
+    if decomposed[0].isascii() and len(decomposed) > 1
+    and all(unicodedata.category(mark) == 'Mn' for mark in decomposed[1:])
+}
+
+# Characters that mark a bullet point when followed by whitespace
+_BULLET_CHARS = frozenset('•·▪▫◦‣⁃')
+
+
+@functools.lru_cache(maxsize=None)
+def _nonspacing_mark_table() -> Dict[int, None]:
+    """str.translate table deleting every nonspacing mark (category Mn); built on first use."""
+    return {
+        code: None for code in range(sys.maxunicode + 1)
+        if unicodedata.category(chr(code)) == 'Mn'
+    }
+
+
+# Common heading patterns across languages
+HEADING_PATTERNS = {
+    'english': [
+        r'\b(chapter|section|part|introduction|conclusion|summary|overview|abstract)\b',
+        r'\b(table of contents|contents|index|references|bibliography|appendix)\b',
+        r'\b\d+\.\s*[A-Z]',  # Numbered sections like "1. Introduction"
+    ],
+    'spanish': [
+        r'\b(capítulo|sección|parte|introducción|conclusión|resumen|índice)\b',
+        r'\b(contenido|referencias|bibliografía|apéndice)\b',
+    ],
+    'french': [
+        r'\b(chapitre|section|partie|introduction|conclusion|résumé|index)\b',
+        r'\b(contenu|références|bibliographie|annexe)\b',
+    ],
+    'german': [
+        r'\b(kapitel|abschnitt|teil|einführung|fazit|zusammenfassung|index)\b',
+        r'\b(inhalt|verzeichnis|literatur|anhang)\b',
+    ],
+    'chinese': [
+        r'第[一二三四五六七八九十\d]+章',  # Chapter markers
+        r'(?:目录|索引|摘要|总结|结论|附录)',
+    ],
+    'japanese': [
+        r'第[一二三四五六七八九十\d]+章',
+        r'(?:目次|索引|要約|結論|付録)',
+    ],
+    'arabic': [
+        r'الفصل\s+[\d\u0660-\u0669]+',  # Arabic numerals
+        r'(?:المحتويات|الفهرس|الملخص|الخاتمة|المراجع)',
+    ],
+    'hindi': [
+        r'अध्याय\s+[\d०-९]+',
+        r'(?:सूची|सारांश|निष्कर्ष|संदर्भ)',
+    ],
+}
+
+# Script detection patterns
+SCRIPT_PATTERNS = {
+    'latin': r'[A-Za-z]',
+    'cyrillic': r'[\u0400-\u04FF]',
+    'arabic': r'[\u0600-\u06FF]',
+    'chinese': r'[\u4e00-\u9fff]',
+    'japanese_hiragana': r'[\u3040-\u309F]',
+    'japanese_katakana': r'[\u30A0-\u30FF]',
+    'korean': r'[\uAC00-\uD7AF]',
+    'devanagari': r'[\u0900-\u097F]',  # Hindi and other Devanagari scripts
+    'thai': r'[\u0E00-\u0E7F]',
+    'hebrew': r'[\u0590-\u05FF]',
+}
+
+# Language-specific text normalization rules
+NORMALIZATION_RULES = {
+    'arabic': {
+        'direction': 'rtl',
+        'remove_diacritics': True,
+        'normalize_numbers': True
+    },
+    'hebrew': {
+        'direction': 'rtl',
+        'remove_diacritics': True
+    },
+    'chinese': {
+        'simplify_traditional': True,
+        'remove_spaces': True
+    },
+    'japanese': {
+        'normalize_width': True,
+        'remove_spaces': True
+    }
+}
+
+# Map each script to its language family
+_SCRIPT_TO_LANGUAGE = {
+    'latin': 'latin',
+    'cyrillic': 'cyrillic',
+    'arabic': 'arabic',
+    'chinese': 'chinese',
+    'japanese_hiragana': 'japanese',
+    'japanese_katakana': 'japanese',
+    'korean': 'korean',
+    'devanagari': 'hindi',
+    'thai': 'thai',
+    'hebrew': 'hebrew'
+}
+
+# Pre-compiled patterns (flags match the module-level re calls they replace)
+# One alternation per language: a language scores once if any of its patterns matches
+_HEADING_PATTERNS_COMPILED = {
+    language: re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+    for language, patterns in HEADING_PATTERNS.items()
+}
+_LATIN_HEADING_LANGUAGES = ('english', 'spanish', 'french', 'german')
+_SCRIPT_NAMES = tuple(SCRIPT_PATTERNS)
+_SCRIPT_INDEX = {name: index for index, name in enumerate(_SCRIPT_NAMES)}
+# The script classes are disjoint, so one alternation classifies a character in a single match
+_ALL_SCRIPTS_RE = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in SCRIPT_PATTERNS.items()),
+    re.IGNORECASE
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@functools.lru_cache(maxsize=None)
+def _bmp_script_table() -> np.ndarray:
     """
-    Provides multi-lingual text processing capabilities for PDF extraction.
-    Supports text normalization, script detection, and language-aware processing.
+    Script index of every Basic Multilingual Plane code point; built on first use.
+    
+    Entry 0x10000 stands for every code point beyond the BMP, none of which
+    belongs to a script. The "no script" index is len(_SCRIPT_NAMES).
+    """
+    no_script = len(_SCRIPT_NAMES)
+    table = np.full(0x10001, no_script, dtype=np.uint8)
+    for code in range(0x10000):
+        match = _ALL_SCRIPTS_RE.match(chr(code))
+        if match:
+            table[code] = _SCRIPT_INDEX[match.lastgroup]
+    return table
+
+# Script index of each character seen so far (-1 for no script)
+_char_script_cache: Dict[str, int] = {}
+
+# Per-text result caches: headers, footers and labels repeat across pages
+_normalize_cache: Dict[str, Tuple[str, str]] = {}
+_script_cache: Dict[str, str] = {}
+_heading_score_cache: Dict[str, int] = {}
+
+
+def process_text_blocks(blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
+    Process text blocks with multilingual support.
     
-    def __init__(self):
-        """Initialize multilingual processor with language patterns."""
-        
-        # Common heading patterns across languages
-        self.heading_patterns = {
-            'english': [
-                r'\b(chapter|section|part|introduction|conclusion|summary|overview|abstract)\b',
-                r'\b(table of contents|contents|index|references|bibliography|appendix)\b',
-                r'\b\d+\.\s*[A-Z]',  # Numbered sections like "1. Introduction"
-            ],
-            'spanish': [
-                r'\b(capítulo|sección|parte|introducción|conclusión|resumen|índice)\b',
-                r'\b(contenido|referencias|bibliografía|apéndice)\b',
-            ],
-            'french': [
-                r'\b(chapitre|section|partie|introduction|conclusion|résumé|index)\b',
-                r'\b(contenu|références|bibliographie|annexe)\b',
-            ],
-            'german': [
-                r'\b(kapitel|abschnitt|teil|einführung|fazit|zusammenfassung|index)\b',
-                r'\b(inhalt|verzeichnis|literatur|anhang)\b',
-            ],
-            'chinese': [
-                r'第[一二三四五六七八九十\d]+章',  # Chapter markers
-                r'[目录|索引|摘要|总结|结论|附录]',
-            ],
-            'japanese': [
-                r'第[一二三四五六七八九十\d]+章',
-                r'[目次|索引|要約|結論|付録]',
-            ],
-            'arabic': [
-                r'الفصل\s+[\d\u0660-\u0669]+',  # Arabic numerals
-                r'[المحتويات|الفهرس|الملخص|الخاتمة|المراجع]',
-            ],
-            'hindi': [
-                r'अध्याय\s+[\d०-९]+',
-                r'[सूची|सारांश|निष्कर्ष|संदर्भ]',
-            ],
-        }
-        
-        # Script detection patterns
-        self.script_patterns = {
-            'latin': r'[A-Za-z]',
-            'cyrillic': r'[\u0400-\u04FF]',
-            'arabic': r'[\u0600-\u06FF]',
-            'chinese': r'[\u4e00-\u9fff]',
-            'japanese_hiragana': r'[\u3040-\u309F]',
-            'japanese_katakana': r'[\u30A0-\u30FF]',
-            'korean': r'[\uAC00-\uD7AF]',
-            'devanagari': r'[\u0900-\u097F]',  # Hindi and other Devanagari scripts
-            'thai': r'[\u0E00-\u0E7F]',
-            'hebrew': r'[\u0590-\u05FF]',
-        }
-        
-        # Language-specific text normalization rules
-        self.normalization_rules = {
-            'arabic': {
-                'direction': 'rtl',
-                'remove_diacritics': True,
-                'normalize_numbers': True
-            },
-            'hebrew': {
-                'direction': 'rtl',
-                'remove_diacritics': True
-            },
-            'chinese': {
-                'simplify_traditional': True,
-                'remove_spaces': True
-            },
-            'japanese': {
-                'normalize_width': True,
-                'remove_spaces': True
-            }
-        }
-    
-    def process_text_blocks(self, blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """
-        Process text blocks with multilingual support.
+    Blocks are updated in place (no per-block copy); callers that need the
+    unprocessed dictionaries must copy them first. ``original_text`` is only
+    set when normalization changed the text, so read it with
+    ``block.get('original_text', block['text'])``.
+    
+    Args:
+        blocks: List of text blocks from PDF extraction
         
-        Args:
-            blocks: List of text blocks from PDF extraction
-            
-        Returns:
-            List of processed text blocks
-        """
-        processed_blocks = []
+    Returns:
+        The same list, with each block processed
+    """
+    for block in blocks:
+        # Normalize text and detect script/language
+        original_text = block['text']
+        normalized_text, script = _normalize_with_script(original_text)
+        if normalized_text != original_text:
+            block['text'] = normalized_text
+            block['original_text'] = original_text  # Keep original
+        block['script'] = script
         
-        for block in blocks:
-            processed_block = block.copy()
-            
-            # Normalize text
-            normalized_text = self.normalize_text(block['text'])
-            processed_block['text'] = normalized_text
-            processed_block['original_text'] = block['text']  # Keep original
-            
-            # Detect script/language
-            script = self.detect_script(normalized_text)
-            processed_block['script'] = script
-            
-            # Check if text matches heading patterns
-            heading_score = self.calculate_heading_score(normalized_text)
-            processed_block['heading_score'] = heading_score
-            
-            processed_blocks.append(processed_block)
+        # Check if text matches heading patterns
+        block['heading_score'] = calculate_heading_score(normalized_text)
+    
+    return blocks
+
+
+def process_texts(texts: List[str]) -> Tuple[List[str], List[str], List[int]]:
+    """
+    Process a column of texts with multilingual support.
+    
+    Column-oriented counterpart of process_text_blocks for callers that
+    keep block properties in parallel arrays instead of dictionaries.
+    
+    Args:
+        texts: List of block texts
         
-        return processed_blocks
+    Returns:
+        Tuple of (normalized_texts, scripts, heading_scores)
+    """
+    normalized_texts = []
+    scripts = []
+    heading_scores = []
+    
+    for text in texts:
+        normalized_text, script = _normalize_with_script(text)
+        normalized_texts.append(normalized_text)
+        scripts.append(script)
+        heading_scores.append(calculate_heading_score(normalized_text))
+    
+    return normalized_texts, scripts, heading_scores
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for better processing across languages.
     
-    def normalize_text(self, text: str) -> str:
-        """
-        Normalize text for better processing across languages.
+    Args:
+        text: Input text
         
-        Args:
-            text: Input text
-            
-        Returns:
-            Normalized text
-        """
-        if not text:
-            return text
+    Returns:
+        Normalized text
+    """
+    return _normalize_with_script(text)[0]
+
+
+def _normalize_with_script(text: str) -> Tuple[str, str]:
+    """
+    Normalize text and detect the script of the result, detecting it only once
+    unless the script-specific normalization changed the text.
+    
+    Args:
+        text: Input text
         
-        # Unicode normalization
+    Returns:
+        Tuple of (normalized_text, script)
+    """
+    if not text:
+        return text, 'unknown'
+    
+    # ASCII fast path: ASCII is NFKC-stable and always detected as Latin,
+    # so only whitespace needs collapsing (and often not even that)
+    if text.isascii():
+        if not (text.isprintable() and '  ' not in text and text[0] != ' ' and text[-1] != ' '):
+            text = _WHITESPACE_RE.sub(' ', text).strip()
+        return text, 'latin' if text else 'unknown'
+    
+    cached = _normalize_cache.get(text)
+    if cached is not None:
+        return cached
+    
+    # Unicode normalization (the quick check avoids copying already-normalized text)
+    if unicodedata.is_normalized('NFKC', text):
+        normalized = text
+    else:
         normalized = unicodedata.normalize('NFKC', text)
-        
-        # Remove excessive whitespace
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        
-        # Detect script and apply script-specific normalization
-        script = self.detect_script(normalized)
-        
-        if script in ['arabic', 'hebrew']:
-            # Remove diacritics for RTL languages
-            normalized = self._remove_diacritics(normalized)
-        elif script in ['chinese', 'japanese']:
-            # Normalize width characters
-            normalized = self._normalize_width(normalized)
-        
-        return normalized
     
-    def detect_script(self, text: str) -> str:
-        """
-        Detect the primary script of the text.
-        
-        Args:
-            text: Input text
-            
-        Returns:
-            Detected script name
-        """
-        if not text:
-            return 'unknown'
-        
-        script_scores = {}
-        text_length = len(text)
-        
-        for script_name, pattern in self.script_patterns.items():
-            matches = len(re.findall(pattern, text, re.IGNORECASE))
-            if text_length > 0:
-                script_scores[script_name] = matches / text_length
-        
-        if not script_scores:
-            return 'unknown'
-        
-        # Return script with highest score
-        primary_script = max(script_scores, key=script_scores.get)
-        
-        # Map script to language family
-        script_to_language = {
-            'latin': 'latin',
-            'cyrillic': 'cyrillic',
-            'arabic': 'arabic',
-            'chinese': 'chinese',
-            'japanese_hiragana': 'japanese',
-            'japanese_katakana': 'japanese',
-            'korean': 'korean',
-            'devanagari': 'hindi',
-            'thai': 'thai',
-            'hebrew': 'hebrew'
-        }
-        
-        return script_to_language.get(primary_script, primary_script)
+    # Remove excessive whitespace
+    normalized = _WHITESPACE_RE.sub(' ', normalized).strip()
     
-    def calculate_heading_score(self, text: str) -> int:
-        """
-        Calculate heading likelihood score for text.
-        
-        Args:
-            text: Input text
-            
-        Returns:
-            Heading score (0-100)
-        """
-        if not text:
-            return 0
-        
-        score = 0
-        text_lower = text.lower()
-        
-        # Check against language-specific heading patterns
-        for language, patterns in self.heading_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    score += 30
-                    break  # Don't double-count for same language
-        
-        # Additional scoring factors
-        if len(text.split()) <= 8:  # Short text
-            score += 10
-        
-        if text.isupper() or text.istitle():  # Capitalization
-            score += 15
+    # Detect script and apply script-specific normalization
+    script = detect_script(normalized)
+    
+    if script in ['arabic', 'hebrew']:
+        # Remove diacritics for RTL languages
+        result = _remove_diacritics(normalized)
+    elif script in ['chinese', 'japanese']:
+        # Normalize width characters
+        result = _normalize_width(normalized)
+    else:
+        result = normalized
+    
+    if result != normalized:
+        script = detect_script(result)
+    
+    _cache_result(_normalize_cache, text, (result, script))
+    return result, script
+
+
+def detect_script(text: str) -> str:
+    """
+    Detect the primary script of the text.
+    
+    Args:
+        text: Input text
         
-        if re.match(r'^\d+[\.\)]\s', text):  # Numbered headings
-            score += 20
+    Returns:
+        Detected script name
+    """
+    if not text:
+        return 'unknown'
+    
+    # ASCII text can only score as Latin (which also wins the all-zero tie)
+    if text.isascii():
+        return 'latin'
+    
+    cached = _script_cache.get(text)
+    if cached is not None:
+        return cached
+    
+    if len(text) >= _HISTOGRAM_MIN_LENGTH:
+        script_counts = _script_histogram(text)
+    else:
+        # Single pass over the distinct characters: each one is classified once
+        # (memoized, -1 for no script) and weighted by its count
+        script_counts = [0] * len(_SCRIPT_NAMES)
+        char_scripts = _char_script_cache
         
-        if re.match(r'^[•·▪▫◦‣⁃]\s', text):  # Bullet points
-            score += 10
+        for char, count in Counter(text).items():
+            matched = char_scripts.get(char)
+            if matched is None:
+                if len(char_scripts) >= _CHAR_SCRIPT_CACHE_SIZE:
+                    char_scripts.clear()
+                match = _ALL_SCRIPTS_RE.match(char)
+                matched = char_scripts[char] = _SCRIPT_INDEX[match.lastgroup] if match else -1
+            if matched >= 0:
+                script_counts[matched] += count
+    
+    # Return script with highest score (first one wins ties)
+    primary_script = _SCRIPT_NAMES[max(range(len(script_counts)), key=script_counts.__getitem__)]
+    
+    script = _SCRIPT_TO_LANGUAGE.get(primary_script, primary_script)
+    _cache_result(_script_cache, text, script)
+    return script
+
+
+def _script_histogram(text: str) -> List[int]:
+    """
+    Count the characters of each script in one vectorized pass over the code points.
+    
+    Args:
+        text: Input text
         
-        return min(score, 100)  # Cap at 100
-    
-    def _remove_diacritics(self, text: str) -> str:
-        """Remove diacritics from text."""
-        return ''.join(
-            char for char in unicodedata.normalize('NFD', text)
-            if unicodedata.category(char) != 'Mn'
-        )
-    
-    def _normalize_width(self, text: str) -> str:
-        """Normalize full-width and half-width characters."""
-        # Convert full-width to half-width for ASCII characters
-        normalized = ''
-        for char in text:
-            code = ord(char)
-            if 0xFF01 <= code <= 0xFF5E:  # Full-width ASCII range
-                normalized += chr(code - 0xFEE0)
-            else:
-                normalized += char
-        return normalized
-    
-    def get_language_info(self, text: str) -> Dict[str, Any]:
-        """
-        Get comprehensive language information for text.
+    Returns:
+        Number of characters of each script, in _SCRIPT_NAMES order
+    """
+    codes = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    scripts = _bmp_script_table()[np.minimum(codes, 0x10000)]
+    return np.bincount(scripts, minlength=len(_SCRIPT_NAMES) + 1)[:-1].tolist()
+
+
+def calculate_heading_score(text: str) -> int:
+    """
+    Calculate heading likelihood score for text.
+    
+    Args:
+        text: Input text
         
-        Args:
-            text: Input text
-            
-        Returns:
-            Dictionary with language information
-        """
-        script = self.detect_script(text)
-        heading_score = self.calculate_heading_score(text)
+    Returns:
+        Heading score (0-100)
+    """
+    if not text:
+        return 0
+    
+    cached = _heading_score_cache.get(text)
+    if cached is not None:
+        return cached
+    
+    score = _compute_heading_score(text)
+    _cache_result(_heading_score_cache, text, score)
+    return score
+
+
+def _compute_heading_score(text: str) -> int:
+    """Uncached implementation of calculate_heading_score."""
+    score = 0
+    text_lower = text.lower()
+    
+    # Every alternative of the non-Latin patterns needs a non-ASCII literal,
+    # so ASCII text can skip them
+    if text_lower.isascii():
+        languages = _LATIN_HEADING_LANGUAGES
+    else:
+        languages = _HEADING_PATTERNS_COMPILED
+    
+    # Check against language-specific heading patterns
+    for language in languages:
+        if _HEADING_PATTERNS_COMPILED[language].search(text_lower):
+            score += 30
+            if score >= 100:
+                return 100
+    
+    # Additional scoring factors
+    if len(text.split()) <= 8:  # Short text
+        score += 10
+    
+    if text.isupper() or text.istitle():  # Capitalization
+        score += 15
+    
+    if _is_numbered_heading(text):  # Numbered headings
+        score += 20
+    
+    if len(text) >= 2 and text[0] in _BULLET_CHARS and text[1].isspace():  # Bullet points
+        score += 10
+    
+    return min(score, 100)  # Cap at 100
+
+
+def _is_numbered_heading(text: str) -> bool:
+    """Check whether text starts with decimal digits, then '.' or ')', then whitespace."""
+    i = 0
+    end = len(text)
+    while i < end and text[i].isdecimal():
+        i += 1
+    return 0 < i < end - 1 and text[i] in '.)' and text[i + 1].isspace()
+
+
+def _cache_result(cache: Dict[str, Any], text: str, result: Any) -> None:
+    """Memoize a per-text result; long texts are not cached and a full cache is reset."""
+    if len(text) > _CACHEABLE_TEXT_LENGTH:
+        return
+    if len(cache) >= _RESULT_CACHE_SIZE:
+        cache.clear()
+    cache[text] = result
+
+
+def _remove_diacritics(text: str) -> str:
+    """Remove diacritics from text."""
+    if text.isascii():
+        return text
+    # Common accented Latin letters: one table lookup each, no decomposition
+    deaccented = text.translate(_LATIN_DEACCENT_TABLE)
+    if deaccented.isascii():
+        return deaccented
+    if not unicodedata.is_normalized('NFD', text):
+        text = unicodedata.normalize('NFD', text)
+    return text.translate(_nonspacing_mark_table())
+
+
+def _normalize_width(text: str) -> str:
+    """Normalize full-width and half-width characters."""
+    if text.isascii():
+        return text
+    # Convert full-width to half-width for ASCII characters
+    return text.translate(_FULLWIDTH_TABLE)
+
+
+def get_language_info(text: str) -> Dict[str, Any]:
+    """
+    Get comprehensive language information for text.
+    
+    Args:
+        text: Input text
         
-        return {
-            'script': script,
-            'heading_score': heading_score,
-            'is_rtl': script in ['arabic', 'hebrew'],
-            'normalized_text': self.normalize_text(text),
-            'character_count': len(text),
-            'word_count': len(text.split()) if script in ['latin', 'cyrillic'] else None
-        }
+    Returns:
+        Dictionary with language information
+    """
+    # The script of the normalized text is that of the input whenever normalization
+    # left the text unchanged, so the input is only scanned again otherwise
+    normalized_text, script = _normalize_with_script(text)
+    if normalized_text != text:
+        script = detect_script(text)
+    heading_score = calculate_heading_score(text)
+    
+    return {
+        'script': script,
+        'heading_score': heading_score,
+        'is_rtl': script in ['arabic', 'hebrew'],
+        'normalized_text': normalized_text,
+        'character_count': len(text),
+        'word_count': len(text.split()) if script in ['latin', 'cyrillic'] else None
+    }
+
+
+class MultilingualProcessor:
+    """
+    Provides multi-lingual text processing capabilities for PDF extraction.
+    Supports text normalization, script detection, and language-aware processing.
+    
+    Stateless: the lookup tables and result caches live at module level and
+    every method delegates to the module function of the same name.
+    """
+    
+    # Language tables, kept as attributes for backward compatibility
+    heading_patterns = HEADING_PATTERNS
+    script_patterns = SCRIPT_PATTERNS
+    normalization_rules = NORMALIZATION_RULES
+    
+    process_text_blocks = staticmethod(process_text_blocks)
+    process_texts = staticmethod(process_texts)
+    normalize_text = staticmethod(normalize_text)
+    detect_script = staticmethod(detect_script)
+    calculate_heading_score = staticmethod(calculate_heading_score)
+    get_language_info = staticmethod(get_language_info)
@@ -3,10 +3,12 @@ Retry and timeout utilities for DocuDots PDF Analysis Module
 ============================================================
 """
 
+import os
 import time
-import signal
 import functools
 import logging
+import threading
+import concurrent.futures
 from typing import Callable, Any, Type, Tuple, Optional
 
 from exceptions import AnalysisTimeoutError, CircuitBreakerOpenError
@@ -26,21 +28,25 @@ def with_retry(max_attempts: int = 3,
         exceptions: Tuple of exceptions to retry on
     """
     def decorator(func: Callable) -> Callable:
+        logger = logging.getLogger(func.__module__)
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            logger = logging.getLogger(func.__module__)
             last_exception = None
             
             for attempt in range(max_attempts):
                 try:
-                    start_time = time.time()
+                    if not logger.isEnabledFor(logging.INFO):
+                        return func(*args, **kwargs)
+                    
+                    start_time = time.perf_counter()
                     result = func(*args, **kwargs)
-                    elapsed = time.time() - start_time
+                    elapsed = time.perf_counter() - start_time
                     
                     if attempt > 0:  # Log successful retry
-                        logger.info(f"Retry: {func.__name__} succeeded on attempt {attempt + 1}")
+                        logger.info("Retry: %s succeeded on attempt %d", func.__name__, attempt + 1)
                     
-                    logger.info(f"Performance: {func.__name__} completed in {elapsed:.2f}s")
+                    logger.info("Performance: %s completed in %.2fs", func.__name__, elapsed)
                     return result
                 
                 except exceptions as e:
@@ -67,44 +73,64 @@ def with_retry(max_attempts: int = 3,
 
 def with_timeout(timeout_seconds: int):
     """
-    Timeout decorator using signal alarm.
+    Timeout decorator running the call on a shared worker thread pool.
+    
+    Works on every platform and from any thread. A call that times out is
+    abandoned rather than interrupted: it finishes in the background while
+    the caller receives AnalysisTimeoutError.
     
     Args:
         timeout_seconds: Timeout in seconds
     """
     def decorator(func: Callable) -> Callable:
+        logger = logging.getLogger(func.__module__)
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            logger = logging.getLogger(func.__module__)
-            
-            def timeout_handler(signum, frame):
-                raise AnalysisTimeoutError(f"Function {func.__name__} timed out after {timeout_seconds}s")
+            future = _get_timeout_executor().submit(func, *args, **kwargs)
             
-            # Set up timeout (Unix-like systems only)
-            old_handler = None
             try:
-                if hasattr(signal, 'SIGALRM'):
-                    old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-                    signal.alarm(timeout_seconds)
-                
-                result = func(*args, **kwargs)
-                return result
+                return future.result(timeout=timeout_seconds)
             
-            except AnalysisTimeoutError:
+            except concurrent.futures.TimeoutError:
+                future.cancel()
                 logger.error(f"Timeout: {func.__name__} exceeded {timeout_seconds}s limit")
-                raise
-            
-            finally:
-                # Clean up timeout
-                if hasattr(signal, 'SIGALRM'):
-                    signal.alarm(0)
-                    if old_handler:
-                        signal.signal(signal.SIGALRM, old_handler)
+                raise AnalysisTimeoutError(
+                    f"Function {func.__name__} timed out after {timeout_seconds}s"
+                ) from None
         
         return wrapper
     return decorator
 
 
+_timeout_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_timeout_executor_lock = threading.Lock()
+
+
+def _get_timeout_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the thread pool shared by all with_timeout calls, creating it on first use."""
+    global _timeout_executor
+    
+    if _timeout_executor is None:
+        with _timeout_executor_lock:
+            if _timeout_executor is None:
+                _timeout_executor = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix="docudots-timeout"
+                )
+    return _timeout_executor
+
+
+def _reset_timeout_executor() -> None:
+    """Drop the inherited pool in a forked child: its worker threads do not exist there."""
+    global _timeout_executor, _timeout_executor_lock
+    _timeout_executor = None
+    _timeout_executor_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_timeout_executor)
+
+
 class CircuitBreaker:
     """
     Circuit breaker pattern implementation.
@@ -38,6 +38,10 @@ setup(
             "flake8>=5.0.0",
             "mypy>=1.0.0",
         ],
+        "speedups": [
+            "numba>=0.56.0",
+            "orjson>=3.6.0",
+        ],
     },
     include_package_data=True,
     zip_safe=False,
@@ -0,0 +1,181 @@
+"""
+Columnar text block storage for DocuDots PDF Analysis Module
+============================================================
+"""
+
+from typing import List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+
+class Span(NamedTuple):
+    """A single text span as extracted from a PDF page."""
+
+    text: str
+    page: int
+    size: float
+    flags: int
+
+
+class TextBlocks:
+    """
+    Struct-of-arrays container for text spans extracted from a PDF.
+
+    Instead of one dictionary per span, span properties are kept in parallel
+    NumPy arrays (page, font size, font flags) plus a list of texts.
+    Arrays are preallocated and grown by doubling, never beyond ``max_blocks``.
+    """
+
+    def __init__(self, capacity: int = 1024, max_blocks: Optional[int] = None):
+        """
+        Initialize an empty block store.
+
+        Args:
+            capacity: Initial number of rows to allocate
+            max_blocks: Hard limit on the number of rows (None for unlimited)
+        """
+        self.max_blocks = max_blocks
+        if max_blocks is not None:
+            capacity = min(capacity, max_blocks)
+        capacity = max(capacity, 1)
+
+        self.texts: List[str] = []
+        self._pages = np.empty(capacity, dtype=np.int32)
+        self._font_sizes = np.empty(capacity, dtype=np.float64)
+        self._font_flags = np.empty(capacity, dtype=np.int32)
+        self._size = 0
+        self.truncated = False
+
+        # Index of the first largest block on page 0 (-1 if none), tracked on append
+        self.title_index = -1
+        self._title_size = 0.0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Number of rows currently allocated."""
+        return self._pages.shape[0]
+
+    @property
+    def pages(self) -> np.ndarray:
+        """0-indexed page number of each block."""
+        return self._pages[:self._size]
+
+    @property
+    def font_sizes(self) -> np.ndarray:
+        """Font size of each block."""
+        return self._font_sizes[:self._size]
+
+    @property
+    def font_flags(self) -> np.ndarray:
+        """PyMuPDF span flags of each block."""
+        return self._font_flags[:self._size]
+
+    def append(self, text: str, page: int, font_size: float, font_flags: int) -> bool:
+        """
+        Append a single text block.
+
+        Args:
+            text: Span text
+            page: 0-indexed page number
+            font_size: Font size
+            font_flags: PyMuPDF span flags
+
+        Returns:
+            bool: False if the block was dropped because ``max_blocks`` is reached
+        """
+        i = self._size
+        if i == self.capacity and not self._grow():
+            self.truncated = True
+            return False
+
+        self.texts.append(text)
+        self._pages[i] = page
+        self._font_sizes[i] = font_size
+        self._font_flags[i] = font_flags
+        self._size = i + 1
+
+        if page == 0 and (self.title_index < 0 or font_size > self._title_size):
+            self.title_index = i
+            self._title_size = font_size
+        return True
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Allocate room for at least ``capacity`` rows (capped at ``max_blocks``) in one step.
+
+        Args:
+            capacity: Expected number of rows
+        """
+        if self.max_blocks is not None:
+            capacity = min(capacity, self.max_blocks)
+        if capacity > self.capacity:
+            self._resize(capacity)
+
+    def clear(self) -> None:
+        """Remove all blocks while keeping the allocated capacity."""
+        self.texts = []
+        self._size = 0
+        self.truncated = False
+        self.title_index = -1
+        self._title_size = 0.0
+
+    def trim(self) -> None:
+        """Release unused capacity so the store is compact (e.g. for pickling)."""
+        size = max(self._size, 1)
+        self._pages = self._pages[:size].copy()
+        self._font_sizes = self._font_sizes[:size].copy()
+        self._font_flags = self._font_flags[:size].copy()
+
+    @classmethod
+    def concatenate(cls, parts: Sequence["TextBlocks"],
+                    max_blocks: Optional[int] = None) -> "TextBlocks":
+        """
+        Merge several block stores, in order, into a new one.
+
+        Args:
+            parts: Block stores to merge
+            max_blocks: Hard limit on the number of rows of the result
+
+        Returns:
+            TextBlocks: Merged block store
+        """
+        total = sum(len(part) for part in parts)
+        size = total if max_blocks is None else min(total, max_blocks)
+
+        merged = cls(capacity=size, max_blocks=max_blocks)
+        merged.texts = [text for part in parts for text in part.texts][:size]
+        if parts:
+            merged._pages = np.concatenate([part.pages for part in parts])[:size]
+            merged._font_sizes = np.concatenate([part.font_sizes for part in parts])[:size]
+            merged._font_flags = np.concatenate([part.font_flags for part in parts])[:size]
+        merged._size = size
+        merged.truncated = size < total or any(part.truncated for part in parts)
+
+        offset = 0
+        for part in parts:
+            if 0 <= part.title_index and offset + part.title_index < size and (
+                    merged.title_index < 0 or part._title_size > merged._title_size):
+                merged.title_index = offset + part.title_index
+                merged._title_size = part._title_size
+            offset += len(part)
+        return merged
+
+    def _grow(self) -> bool:
+        """Double the allocated capacity, respecting ``max_blocks``."""
+        new_capacity = self.capacity * 2
+        if self.max_blocks is not None:
+            new_capacity = min(new_capacity, self.max_blocks)
+        if new_capacity <= self.capacity:
+            return False
+
+        self._resize(new_capacity)
+        return True
+
+    def _resize(self, capacity: int) -> None:
+        """Reallocate the column arrays to ``capacity`` rows."""
+        self._pages = np.resize(self._pages, capacity)
+        self._font_sizes = np.resize(self._font_sizes, capacity)
+        self._font_flags = np.resize(self._font_flags, capacity)
@@ -4,6 +4,11 @@ Input validation utilities for DocuDots PDF Analysis Module
 """
 
 import os
+import sys
+import stat
+import time
+import errno
+import tempfile
 from pathlib import Path
 from typing import Optional, Tuple
 import logging
@@ -21,6 +26,10 @@ from exceptions import (
 from config import Config
 
 
+# stat() errors that mean the path does not exist (mirrors Path.exists())
+_MISSING_PATH_ERRNOS = (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP)
+
+
 class InputValidator:
     """
     Comprehensive input validation for PDF files and system resources.
@@ -29,6 +38,12 @@ class InputValidator:
     structure integrity, size limits, and content accessibility.
     """
     
+    # Seconds a CPU usage reading is reused by validate_system_resources
+    CPU_CHECK_TTL = 5.0
+    
+    # (timestamp, cpu_percent) of the last CPU usage reading, shared by all validators
+    _last_cpu_check: Optional[Tuple[float, float]] = None
+    
     def __init__(self, config: Config):
         """
         Initialize validator with configuration.
@@ -49,19 +64,46 @@ class InputValidator:
         Returns:
             bool: True if validation passes
             
+        Raises:
+            PDFValidationError: If validation fails
+        """
+        self.open_validated_pdf(pdf_path).close()
+        return True
+    
+    def open_validated_pdf(self, pdf_path: Path, data: Optional[bytes] = None) -> fitz.Document:
+        """
+        Validate a PDF file and return the document opened for validation.
+        
+        Lets the analysis pipeline reuse the parsed document instead of
+        opening the file a second time. The caller must close it.
+        
+        Args:
+            pdf_path (Path): Path to the PDF file
+            data (Optional[bytes]): Content of the PDF file if already read into memory
+            
+        Returns:
+            fitz.Document: The opened, validated document
+            
         Raises:
             PDFValidationError: If validation fails
         """
         try:
-            # Check if file exists
-            if not pdf_path.exists():
+            # Check if file exists (a single stat call serves all metadata checks)
+            try:
+                file_stat = pdf_path.stat()
+            except OSError as e:
+                if e.errno not in _MISSING_PATH_ERRNOS:
+                    raise
+                file_stat = None
+            
+            if file_stat is None:
                 raise PDFValidationError(
                     f"PDF file does not exist: {pdf_path}",
                     filename=pdf_path.name
                 )
             
             # Check if it's a file (not directory)
-            if not pdf_path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 raise PDFValidationError(
                     f"Path is not a file: {pdf_path}",
                     filename=pdf_path.name
@@ -76,7 +118,7 @@ class InputValidator:
                 )
             
             # Check file size
-            file_size = pdf_path.stat().st_size
+            file_size = file_stat.st_size
             max_size_bytes = self.config.MAX_FILE_SIZE_MB * 1024 * 1024
             
             if file_size == 0:
@@ -95,12 +137,12 @@ class InputValidator:
                 )
             
             # Validate PDF structure and content
-            self._validate_pdf_structure(pdf_path)
+            doc = self._validate_pdf_structure(pdf_path, data)
             
             self.logger.info(f"PDF validation passed: {pdf_path.name} "
                            f"({file_size / (1024*1024):.1f}MB)")
             
-            return True
+            return doc
             
         except (PDFValidationError, ResourceLimitError) as e:
             self.logger.error(f"PDF validation failed for {pdf_path.name}: {e}")
@@ -111,12 +153,16 @@ class InputValidator:
             self.logger.error(f"PDF validation failed for {pdf_path.name}: {error_msg}")
             raise PDFValidationError(error_msg, filename=pdf_path.name) from e
     
-    def _validate_pdf_structure(self, pdf_path: Path) -> None:
+    def _validate_pdf_structure(self, pdf_path: Path, data: Optional[bytes] = None) -> fitz.Document:
         """
         Validate internal PDF structure using PyMuPDF.
         
         Args:
             pdf_path (Path): Path to PDF file
+            data (Optional[bytes]): Content of the PDF file if already read into memory
+            
+        Returns:
+            fitz.Document: The opened document (closed if validation fails)
             
         Raises:
             PDFCorruptError: If PDF is corrupted
@@ -124,9 +170,13 @@ class InputValidator:
             PDFValidationError: If PDF has other structural issues
         """
         doc = None
+        validated = False
         try:
             # Try to open the PDF
-            doc = fitz.open(str(pdf_path))
+            if data is not None:
+                doc = fitz.open(stream=data, filetype="pdf")
+            else:
+                doc = fitz.open(str(pdf_path))
             
             # Check if password protected
             if doc.needs_pass:
@@ -157,8 +207,8 @@ class InputValidator:
                 text = first_page.get_text()
                 
                 # Check if document has any extractable content
-                total_chars = 0
-                for page_num in range(min(3, page_count)):  # Check first 3 pages
+                total_chars = len(text.strip())
+                for page_num in range(1, min(3, page_count)):  # Check first 3 pages
                     page = doc.load_page(page_num)
                     page_text = page.get_text().strip()
                     total_chars += len(page_text)
@@ -172,6 +222,9 @@ class InputValidator:
                     filename=pdf_path.name
                 ) from e
             
+            validated = True
+            return doc
+            
         except fitz.FileDataError as e:
             raise PDFCorruptError(
                 f"PDF file is corrupted or invalid: {e}",
@@ -195,7 +248,7 @@ class InputValidator:
             ) from e
         
         finally:
-            if doc:
+            if doc and not validated:
                 doc.close()
     
     def validate_output_directory(self, output_dir: Path) -> bool:
@@ -216,14 +269,20 @@ class InputValidator:
             output_dir.mkdir(parents=True, exist_ok=True)
             
             # Check if we can write to the directory
-            test_file = output_dir / ".write_test"
-            try:
-                test_file.write_text("test")
-                test_file.unlink()  # Delete test file
-            except Exception as e:
+            if not os.access(output_dir, os.W_OK):
                 raise PDFValidationError(
-                    f"Cannot write to output directory: {output_dir} - {e}"
-                ) from e
+                    f"Cannot write to output directory: {output_dir} - permission denied"
+                )
+            
+            if sys.platform == 'win32':
+                # os.access ignores ACLs on Windows: probe with a real, self-deleting file
+                try:
+                    with tempfile.TemporaryFile(dir=output_dir):
+                        pass
+                except Exception as e:
+                    raise PDFValidationError(
+                        f"Cannot write to output directory: {output_dir} - {e}"
+                    ) from e
             
             self.logger.info(f"Output directory validated: {output_dir}")
             return True
@@ -258,7 +317,7 @@ class InputValidator:
                 )
             
             # Check CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = self._cpu_percent(psutil)
             if cpu_percent > self.config.CPU_USAGE_THRESHOLD:
                 self.logger.warning(f"High CPU usage detected: {cpu_percent:.1f}%")
             
@@ -273,3 +332,27 @@ class InputValidator:
         except Exception as e:
             self.logger.error(f"System resource validation failed: {e}")
             raise ResourceLimitError(f"System resource validation failed: {e}") from e
+    
+    @classmethod
+    def _cpu_percent(cls, psutil) -> float:
+        """
+        Get the system CPU usage, reusing a reading younger than CPU_CHECK_TTL.
+        
+        Only the very first reading blocks (briefly) to establish a baseline;
+        later ones measure the usage since the previous reading.
+        
+        Args:
+            psutil: The imported psutil module
+            
+        Returns:
+            float: CPU usage in percent
+        """
+        now = time.monotonic()
+        last_check = cls._last_cpu_check
+        
+        if last_check is not None and now - last_check[0] < cls.CPU_CHECK_TTL:
+            return last_check[1]
+        
+        cpu_percent = psutil.cpu_percent(interval=None if last_check else 0.1)
+        cls._last_cpu_check = (now, cpu_percent)
+        return cpu_percent
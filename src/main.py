@@ -16,10 +16,19 @@ import json
 import logging
 import time
 import re
+import multiprocessing
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from collections import Counter
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import fitz  # PyMuPDF
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    # orjson not available, use the standard library encoder
+    orjson = None
 
 # Import our new utilities
 from utils.exceptions import (
@@ -30,43 +39,166 @@ from utils.config import config
 from utils.validators import InputValidator
 from utils.retry import retry_pdf_operations, log_performance, timeout
 from utils.multilingual import MultilingualSupport
+from utils.text_blocks import TextBlocks, HeadingCandidate, round2
+from utils.pattern_matcher import SubstringMatcher
+from utils.scoring_kernels import score_heading_levels, score_title_candidates
+
+# Configure enhanced logging: a plain console format, and the full format
+# (with timestamps) only for the optional log file
+stdout_handler = logging.StreamHandler(sys.stdout)
+stdout_handler.setFormatter(logging.Formatter(config.logging_config.stdout_format))
+log_handlers = [stdout_handler]
+if config.logging_config.enable_file_logging:
+    Path(config.logging_config.log_file_path).parent.mkdir(parents=True, exist_ok=True)
+    file_handler = logging.FileHandler(config.logging_config.log_file_path, encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter(config.logging_config.format))
+    log_handlers.append(file_handler)
 
-# Configure enhanced logging
 logging.basicConfig(
     level=getattr(logging, config.logging_config.level),
-    format=config.logging_config.format,
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=log_handlers
 )
+
+# No format uses thread or process information; skip collecting it for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logger = logging.getLogger(__name__)
 
+# H1 indicators - Major document sections
+H1_PATTERNS = (
+    'abstract', 'introduction', 'conclusion', 'summary', 'overview',
+    'background', 'methodology', 'results', 'discussion', 'references',
+    'about', 'experience', 'education', 'skills', 'projects', 'contact',
+    'objective', 'profile', 'qualifications', 'achievements', 'awards'
+)
+
+# H2 indicators - Subsections and categories
+H2_PATTERNS = (
+    'work experience', 'employment history', 'professional experience',
+    'technical skills', 'core competencies', 'key skills', 'expertise',
+    'certifications', 'publications', 'research', 'languages',
+    'extracurricular', 'activities', 'volunteering', 'interests',
+    'tools', 'technologies', 'software', 'platforms'
+)
+
+# H3 indicators - Specific items and details
+H3_PATTERNS = (
+    'programming languages', 'frameworks', 'databases', 'operating systems',
+    'web technologies', 'mobile development', 'cloud platforms',
+    'project management', 'soft skills', 'leadership', 'communication'
+)
+
+# Professional titles and institutions
+TITLE_INDICATORS = (
+    'university', 'college', 'institute', 'company', 'corporation',
+    'ltd', 'inc', 'llc', 'technologies', 'systems', 'solutions'
+)
+
+# Obvious non-titles
+NON_TITLE_PATTERNS = (
+    "page", "figure", "table", "abstract", "introduction",
+    "www.", "http", "@", "copyright", "©"
+)
+
+# Metadata titles left by authoring tools rather than the author
+UNUSABLE_TITLE_PREFIXES = ("untitled", "microsoft word")
+FILE_NAME_TITLE_RE = re.compile(r'\.[A-Za-z0-9]{2,4}$')
+
+# Multi-lingual skip patterns for heading candidates
+SKIP_PATTERNS = {
+    'english': ("figure", "table", "page", "www.", "http", "@", "copyright", "©", "et al.", "ibid"),
+    'spanish': ("figura", "tabla", "página", "www.", "http", "@", "derechos", "©"),
+    'french': ("figure", "tableau", "page", "www.", "http", "@", "droits", "©"),
+    'german': ("abbildung", "tabelle", "seite", "www.", "http", "@", "urheberrecht", "©"),
+    'chinese': ("图", "表", "页", "www.", "http", "@", "©"),
+    'japanese': ("図", "表", "ページ", "www.", "http", "@", "©"),
+    'arabic': ("شكل", "جدول", "صفحة", "www.", "http", "@", "©"),
+    'hindi': ("चित्र", "तालिका", "पृष्ठ", "www.", "http", "@", "©"),
+}
+
+# Matchers over the pattern tables above, built once at import
+H1_MATCHER = SubstringMatcher(H1_PATTERNS)
+H2_MATCHER = SubstringMatcher(H2_PATTERNS)
+H3_MATCHER = SubstringMatcher(H3_PATTERNS)
+TITLE_INDICATOR_MATCHER = SubstringMatcher(TITLE_INDICATORS)
+NON_TITLE_MATCHER = SubstringMatcher(NON_TITLE_PATTERNS)
+SKIP_MATCHERS = {language: SubstringMatcher(patterns) for language, patterns in SKIP_PATTERNS.items()}
+
+# Numbered/lettered heading prefixes
+NUMBERED_HEADING_RE = re.compile(r'^[0-9]+\.?\s+')
+SUBNUMBERED_HEADING_RE = re.compile(r'^[0-9]+\.[0-9]+\.?\s+')
+LETTERED_HEADING_RE = re.compile(r'^[a-zA-Z][\)\.]\s+')
+ROMAN_HEADING_RE = re.compile(r'^[ivxlc]+\.?\s+', re.I)
+
+# Example of the output format, printed after a successful run
+EXAMPLE_OUTPUT_FORMAT = """
+Final JSON Output Format:
+   {
+     "title": "Document Title",
+     "outline": [
+       {"level": "H1", "text": "Heading Text", "page": 0},
+       {"level": "H2", "text": "Sub Heading", "page": 1}
+     ]
+   }"""
+
+# Files per worker task while many files remain (see _plan_batches)
+TARGET_BATCH_SIZE = 4
+
+# Number of input files read ahead of the one being analyzed
+PREFETCH_WINDOW = 4
+
+# Pages per worker when a large document is extracted in parallel;
+# documents with fewer than two tasks' worth of pages are extracted in-process
+PAGES_PER_EXTRACT_TASK = 16
+
+# Start method of page extraction workers: the prefetch and timeout threads may be
+# running when they start, and forking a process with other threads is unsafe
+EXTRACT_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# No score distinguishes word counts above this, so words are only counted up
+# to one past it (str.split with maxsplit stops splitting there)
+MAX_SCORED_WORDS = 12
+
 
 class PDFStructureAnalyzer:
     """
     Analyzes PDF files and extracts structural outline information.
     """
     
-    def __init__(self, input_dir: str = "/app/input", output_dir: str = "/app/output"):
+    def __init__(self, input_dir: str = "/app/input", output_dir: str = "/app/output",
+                 validate_environment: bool = True):
         """
         Initialize the PDF analyzer with enhanced validation and multi-lingual support.
         
         Args:
             input_dir: Directory containing input PDF files
             output_dir: Directory for output JSON files
+            validate_environment: Whether to validate the directories and system
+                resources; False when the caller has already done so
         """
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
         self.config = config
         self.validator = InputValidator()
         self.multilingual = MultilingualSupport()
+        # Worker processes used to extract the pages of a single large document; off
+        # by default, as starting them costs more than extracting typical documents
+        self.extract_workers = self.config.processing_limits.page_workers
+        # Sample text blocks are only kept in results of debug runs
+        self.debug = self.config.logging_config.level == "DEBUG"
+        # Per-file console output is only printed in verbose runs
+        self.verbose = self.config.logging_config.verbose
+        
+        if not validate_environment:
+            return
         
         # Validate and prepare directories
         try:
             self.validator.validate_processing_environment(self.input_dir, self.output_dir)
-            logger.info(f"Initialized PDF analyzer - Input: {self.input_dir}, Output: {self.output_dir}")
+            logger.info("Initialized PDF analyzer - Input: %s, Output: %s", self.input_dir, self.output_dir)
         except Exception as e:
-            logger.error(f"Failed to initialize PDF analyzer: {e}")
+            logger.error("Failed to initialize PDF analyzer: %s", e)
             raise PDFProcessingError(f"Initialization failed: {e}", stage="initialization")
     
     def get_pdf_files(self) -> List[Path]:
@@ -86,29 +218,30 @@ class PDFStructureAnalyzer:
             invalid_files = validation_summary['input_summary']['invalid_file_details']
             
             # Log validation results
-            logger.info(f"Found {len(valid_files)} valid PDF files in {self.input_dir}")
+            logger.info("Found %d valid PDF files in %s", len(valid_files), self.input_dir)
             
             if invalid_files:
-                logger.warning(f"Found {len(invalid_files)} invalid files:")
+                logger.warning("Found %d invalid files:", len(invalid_files))
                 for invalid_file in invalid_files:
-                    logger.warning(f"  - {invalid_file['file'].name}: {invalid_file['error']}")
+                    logger.warning("  - %s: %s", invalid_file['file'].name, invalid_file['error'])
             
             return valid_files
             
         except Exception as e:
-            logger.error(f"Error scanning PDF files: {e}")
+            logger.error("Error scanning PDF files: %s", e)
             return []
     
     @retry_pdf_operations
     @log_performance
     @timeout(seconds=config.processing_limits.max_processing_time_seconds)
-    def analyze_pdf_structure(self, pdf_path: Path) -> Dict[str, Any]:
+    def analyze_pdf_structure(self, pdf_path: Path, data: Optional[bytes] = None) -> Dict[str, Any]:
         """
         Analyze a single PDF file and extract its structural outline with enhanced error handling.
         This is the main method that orchestrates the complete analysis workflow.
         
         Args:
             pdf_path: Path to the PDF file
+            data: Contents of the file, if already read into memory (e.g. prefetched)
             
         Returns:
             Dictionary containing the complete analysis results
@@ -118,20 +251,23 @@ class PDFStructureAnalyzer:
             PDFProcessingError: If processing encounters an error
             ResourceLimitError: If resource limits are exceeded
         """
-        logger.info(f"Starting analysis of PDF: {pdf_path.name}")
+        logger.info("Starting analysis of PDF: %s", pdf_path.name)
         start_time = time.time()
         doc = None
         
         try:
             # Step 1: Validate the PDF file before processing
-            is_valid, error_msg = self.validator.pdf_validator.validate_pdf_file(pdf_path)
+            is_valid, error_msg = self.validator.pdf_validator.validate_pdf_file(pdf_path, data)
             if not is_valid:
                 raise PDFValidationError(error_msg, filename=pdf_path.name)
             
             # Step 2: Open the PDF document with error handling
             try:
-                doc = fitz.open(pdf_path)
-                logger.info(f"Successfully opened PDF with {len(doc)} pages")
+                if data is not None:
+                    doc = fitz.open(stream=data, filetype="pdf")
+                else:
+                    doc = fitz.open(pdf_path)
+                logger.info("Successfully opened PDF with %d pages", len(doc))
             except Exception as e:
                 raise PDFProcessingError(
                     f"Failed to open PDF: {e}",
@@ -157,21 +293,27 @@ class PDFStructureAnalyzer:
             # Step 4: Extract all text blocks with their properties
             logger.info("Extracting text blocks from PDF...")
             try:
-                text_blocks = self._extract_text_blocks(doc)
+                text_blocks = self._extract_text_blocks(doc, pdf_path)
                 
                 # Step 4.1: Enhance text blocks with multi-lingual support
                 logger.info("Applying multi-lingual text processing...")
-                text_blocks = self.multilingual.enhance_text_extraction(text_blocks)
+                text_blocks.set_language_info(*self.multilingual.process_texts(text_blocks.texts))
                 
                 # Check if we exceeded text block limits
                 if len(text_blocks) > self.config.processing_limits.max_text_blocks:
-                    logger.warning(f"Text blocks ({len(text_blocks)}) exceed limit "
-                                 f"({self.config.processing_limits.max_text_blocks}). Truncating...")
-                    text_blocks = text_blocks[:self.config.processing_limits.max_text_blocks]
+                    logger.warning("Text blocks (%d) exceed limit (%d). Truncating...",
+                                 len(text_blocks), self.config.processing_limits.max_text_blocks)
+                    text_blocks.truncate(self.config.processing_limits.max_text_blocks)
                 
                 # Print total number of text blocks found (confirmation output)
-                print(f"✅ Found {len(text_blocks)} text blocks in {pdf_path.name}")
-                logger.info(f"Total text blocks extracted: {len(text_blocks)}")
+                if self.verbose:
+                    print(f"✅ Found {len(text_blocks)} text blocks in {pdf_path.name}")
+                logger.info("Total text blocks extracted: %d", len(text_blocks))
+                
+                # Capture the text blocks summary now, so the blocks can be released
+                # as soon as headings are extracted
+                total_blocks = len(text_blocks)
+                sample_blocks = text_blocks.to_dicts(range(min(5, total_blocks))) if self.debug else []
                 
             except Exception as e:
                 raise PDFProcessingError(
@@ -183,8 +325,12 @@ class PDFStructureAnalyzer:
             # Step 5: Perform comprehensive heading identification and classification
             logger.info("Performing heading identification and classification...")
             try:
-                structural_outline = self._extract_headings_from_blocks(text_blocks)
+                metadata_title = ""
+                if self.config.heading_config.prefer_metadata_title:
+                    metadata_title = (doc.metadata or {}).get("title") or ""
+                structural_outline = self._extract_headings_from_blocks(text_blocks, metadata_title)
                 result["structural_outline"] = structural_outline
+                del text_blocks
                 
             except Exception as e:
                 raise HeadingDetectionError(
@@ -197,53 +343,59 @@ class PDFStructureAnalyzer:
             
             # Limit headings if needed
             if len(final_headings) > self.config.processing_limits.max_headings_per_document:
-                logger.warning(f"Limiting headings from {len(final_headings)} to "
-                             f"{self.config.processing_limits.max_headings_per_document}")
+                logger.warning("Limiting headings from %d to %d", len(final_headings),
+                             self.config.processing_limits.max_headings_per_document)
                 final_headings = final_headings[:self.config.processing_limits.max_headings_per_document]
                 structural_outline["headings"] = final_headings
+                if "heading_positions" in structural_outline:
+                    structural_outline["heading_positions"] = \
+                        structural_outline["heading_positions"][:len(final_headings)]
             
             # Update document info with extracted title
             result["document_info"]["title"] = final_title
             
             # Step 7: Log and display final results
             processing_time = time.time() - start_time
-            logger.info(f"Analysis complete - Title: '{final_title}' (took {processing_time:.2f}s)")
-            logger.info(f"Final headings count: {len(final_headings)}")
-            
-            # Print comprehensive summary to console
-            print(f"📋 Title: {final_title}")
-            print(f"📑 Found {len(final_headings)} classified headings:")
-            
-            # Display heading breakdown by level
-            level_counts = {"H1": 0, "H2": 0, "H3": 0}
-            for heading in final_headings:
-                level_counts[heading["level"]] += 1
-            
-            print(f"   Level distribution: H1({level_counts['H1']}) H2({level_counts['H2']}) H3({level_counts['H3']})")
-            
-            # Show sample of headings
-            for i, heading in enumerate(final_headings[:8], 1):  # Show first 8
-                text_preview = heading['text'][:60] + "..." if len(heading['text']) > 60 else heading['text']
-                print(f"   {i}. {heading['level']}: {text_preview} (Page {heading['page']})")
-            
-            if len(final_headings) > 8:
-                print(f"   ... and {len(final_headings) - 8} more headings")
+            logger.info("Analysis complete - Title: '%s' (took %.2fs)", final_title, processing_time)
+            logger.info("Final headings count: %d", len(final_headings))
+            
+            # Print comprehensive summary to console (verbose runs only), in a single write
+            if self.verbose:
+                summary_lines = [
+                    f"📋 Title: {final_title}",
+                    f"📑 Found {len(final_headings)} classified headings:"
+                ]
+                
+                # Display heading breakdown by level
+                level_counts = Counter(heading["level"] for heading in final_headings)
+                
+                summary_lines.append(f"   Level distribution: H1({level_counts['H1']}) H2({level_counts['H2']}) H3({level_counts['H3']})")
+                
+                # Show sample of headings
+                for i, heading in enumerate(final_headings[:8], 1):  # Show first 8
+                    text_preview = heading['text'][:60] + "..." if len(heading['text']) > 60 else heading['text']
+                    summary_lines.append(f"   {i}. {heading['level']}: {text_preview} (Page {heading['page']})")
+                
+                if len(final_headings) > 8:
+                    summary_lines.append(f"   ... and {len(final_headings) - 8} more headings")
+                
+                print("\n".join(summary_lines))
             
-            # Step 8: Store text blocks summary for debugging
+            # Step 8: Store text blocks summary (first 5 blocks as sample in debug runs)
             result["text_blocks_summary"] = {
-                "total_blocks": len(text_blocks),
-                "sample_blocks": text_blocks[:5]  # Store first 5 blocks as sample
+                "total_blocks": total_blocks,
+                "sample_blocks": sample_blocks
             }
             
             # Step 9: Close the document
             doc.close()
             
-            logger.info(f"Successfully completed analysis of {pdf_path.name}")
+            logger.info("Successfully completed analysis of %s", pdf_path.name)
             return result
             
         except (PDFValidationError, PDFProcessingError, ResourceLimitError, HeadingDetectionError) as e:
             # These are our custom exceptions - re-raise them
-            logger.error(f"Known error analyzing {pdf_path.name}: {e}")
+            logger.error("Known error analyzing %s: %s", pdf_path.name, e)
             if doc:
                 try:
                     doc.close()
@@ -253,7 +405,7 @@ class PDFStructureAnalyzer:
             
         except Exception as e:
             # Unexpected errors
-            logger.error(f"Unexpected error analyzing {pdf_path.name}: {str(e)}")
+            logger.error("Unexpected error analyzing %s: %s", pdf_path.name, e)
             if doc:
                 try:
                     doc.close()
@@ -308,94 +460,54 @@ class PDFStructureAnalyzer:
                     return largest_text
                     
         except Exception as e:
-            logger.warning(f"Could not extract title from first page: {str(e)}")
+            logger.warning("Could not extract title from first page: %s", e)
         
         return "Untitled Document"
     
-    def _extract_text_blocks(self, doc: fitz.Document) -> List[Dict[str, Any]]:
+    def _extract_text_blocks(self, doc: fitz.Document, pdf_path: Optional[Path] = None) -> TextBlocks:
         """
         Extract all text blocks from the PDF with their properties.
         
         Args:
             doc: PyMuPDF document object
+            pdf_path: Path the document was read from (needed for parallel
+                extraction when it was opened from memory)
             
         Returns:
-            List of dictionaries containing text block properties
+            Columnar store of the text block properties
         """
-        text_blocks = []
-        
         try:
-            # Iterate through each page
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                
-                # Get text blocks with detailed formatting information
-                # Using get_text("dict") to get detailed formatting data
-                text_dict = page.get_text("dict")
-                
-                # Process each block in the page
-                for block in text_dict["blocks"]:
-                    # Skip image blocks, only process text blocks
-                    if "lines" not in block:
-                        continue
-                    
-                    # Process each line in the block
-                    for line in block["lines"]:
-                        # Process each span (text with consistent formatting) in the line
-                        for span in line["spans"]:
-                            # Extract text content
-                            text_content = span["text"].strip()
-                            
-                            # Skip empty text spans
-                            if not text_content:
-                                continue
-                            
-                            # Extract font properties
-                            font_name = span.get("font", "")
-                            font_size = span.get("size", 0)
-                            font_flags = span.get("flags", 0)
-                            
-                            # Determine if text is bold
-                            # Font flags bit 4 (16) indicates bold
-                            is_bold = bool(font_flags & 16)
-                            
-                            # Get text position (bbox: [x0, y0, x1, y1])
-                            bbox = span.get("bbox", [0, 0, 0, 0])
-                            
-                            # Create text block dictionary
-                            text_block = {
-                                "text": text_content,
-                                "font_size": round(font_size, 2),
-                                "font_name": font_name,
-                                "is_bold": is_bold,
-                                "page_number": page_num,  # 0-indexed page numbers
-                                "position": {
-                                    "x": round(bbox[0], 2),
-                                    "y": round(bbox[1], 2),
-                                    "width": round(bbox[2] - bbox[0], 2),
-                                    "height": round(bbox[3] - bbox[1], 2)
-                                },
-                                "bbox": [round(coord, 2) for coord in bbox]
-                            }
-                            
-                            text_blocks.append(text_block)
+            page_count = len(doc)
+            workers = min(self.extract_workers, page_count // PAGES_PER_EXTRACT_TASK)
+            source = str(pdf_path) if pdf_path else doc.name
+            
+            if workers > 1 and source:
+                # MuPDF is not thread-safe: split the pages into ranges that worker
+                # processes extract from their own copy of the document
+                bounds = [page_count * k // workers for k in range(workers + 1)]
+                mp_context = multiprocessing.get_context(EXTRACT_START_METHOD)
+                with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+                    parts = executor.map(_extract_page_range, [source] * workers, bounds[:-1], bounds[1:])
+                    text_blocks = TextBlocks.concatenate(list(parts))
+            else:
+                text_blocks = _extract_pages(doc, range(page_count))
             
-            logger.info(f"Extracted {len(text_blocks)} text blocks from document")
+            logger.info("Extracted %d text blocks from document", len(text_blocks))
             return text_blocks
             
         except Exception as e:
-            logger.error(f"Error extracting text blocks: {str(e)}")
+            logger.error("Error extracting text blocks: %s", e)
             raise PDFProcessingError(
                 f"Text block extraction failed: {e}",
                 stage="text_extraction"
             )
-
-    def _analyze_font_styles(self, text_blocks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    
+    def _analyze_font_styles(self, text_blocks: TextBlocks) -> Dict[str, Any]:
         """
         Analyze font styles to determine body text characteristics.
         
         Args:
-            text_blocks: List of text block dictionaries
+            text_blocks: Columnar store of the text blocks
             
         Returns:
             Dictionary containing font analysis results
@@ -409,24 +521,36 @@ class PDFStructureAnalyzer:
             }
         
         # Collect font statistics
-        font_sizes = [block["font_size"] for block in text_blocks]
-        font_names = [block["font_name"] for block in text_blocks]
+        font_sizes = text_blocks.font_sizes
+        font_name_counts = Counter(text_blocks.font_names)
         
-        # Calculate font size frequency
-        from collections import Counter
-        font_size_counts = Counter(font_sizes)
-        font_name_counts = Counter(font_names)
+        # Calculate font size frequency, ordered like Counter.most_common:
+        # by count, ties broken by first occurrence
+        unique_sizes, first_indices, size_counts = np.unique(
+            font_sizes, return_index=True, return_counts=True
+        )
+        frequency_order = np.lexsort((first_indices, -size_counts))
         
         # Find most common font size (likely body text)
-        most_common_size = font_size_counts.most_common(1)[0][0] if font_size_counts else 12.0
+        most_common_size = unique_sizes[frequency_order[0]].item()
         most_common_font = font_name_counts.most_common(1)[0][0] if font_name_counts else "default"
         
-        # Calculate statistics
-        avg_font_size = sum(font_sizes) / len(font_sizes)
-        median_font_size = sorted(font_sizes)[len(font_sizes) // 2]
+        # Calculate statistics from the distinct (sorted) sizes
+        min_font_size = unique_sizes[0].item()
+        max_font_size = unique_sizes[-1].item()
+        # Sequential running sum, so the average matches summing in block order
+        avg_font_size = np.cumsum(font_sizes)[-1].item() / len(font_sizes)
+        
+        median_rank = len(font_sizes) // 2
+        median_index = np.searchsorted(np.cumsum(size_counts), median_rank, side='right')
+        median_font_size = unique_sizes[median_index].item()
         
         # Get common font sizes (top 5)
-        common_sizes = [size for size, count in font_size_counts.most_common(5)]
+        common_sizes = unique_sizes[frequency_order[:5]].tolist()
+        size_distribution = dict(zip(
+            unique_sizes[frequency_order[:10]].tolist(),
+            size_counts[frequency_order[:10]].tolist()
+        ))
         
         font_analysis = {
             "body_font_size": most_common_size,
@@ -435,26 +559,26 @@ class PDFStructureAnalyzer:
             "font_size_stats": {
                 "average": round(avg_font_size, 2),
                 "median": round(median_font_size, 2),
-                "min": min(font_sizes),
-                "max": max(font_sizes),
+                "min": min_font_size,
+                "max": max_font_size,
                 "most_common": most_common_size
             },
-            "total_unique_sizes": len(font_size_counts),
-            "size_distribution": dict(font_size_counts.most_common(10))
+            "total_unique_sizes": len(unique_sizes),
+            "size_distribution": size_distribution
         }
         
-        logger.info(f"Font analysis - Body text size: {most_common_size}, "
-                   f"Average: {avg_font_size:.2f}, Range: {min(font_sizes)}-{max(font_sizes)}")
+        logger.info("Font analysis - Body text size: %s, Average: %.2f, Range: %s-%s",
+                   most_common_size, avg_font_size, min_font_size, max_font_size)
         
         return font_analysis
-
-    def _filter_heading_candidates(self, text_blocks: List[Dict[str, Any]], 
-                                 font_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
+    
+    def _filter_heading_candidates(self, text_blocks: TextBlocks, 
+                                 font_analysis: Dict[str, Any]) -> List[HeadingCandidate]:
         """
         Filter text blocks to identify potential headings with multi-lingual support.
         
         Args:
-            text_blocks: List of all text blocks (enhanced with language info)
+            text_blocks: Columnar store of all text blocks (enhanced with language info)
             font_analysis: Results from font analysis
             
         Returns:
@@ -465,120 +589,120 @@ class PDFStructureAnalyzer:
         
         heading_candidates = []
         
-        for block in text_blocks:
-            text = block.get("text", "").strip()
-            normalized_text = block.get("normalized_text", text)
-            font_size = block["font_size"]
-            is_bold = block["is_bold"]
-            detected_language = block.get("detected_language", "english")
-            is_heading_candidate = block.get("is_heading_candidate", False)
-            
+        texts = text_blocks.texts
+        font_sizes = text_blocks.font_sizes
+        text_lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+        
+        # Multiple criteria for heading identification, evaluated for all blocks at once
+        size_threshold = max(body_font_size * 1.1, avg_font_size * 1.05)
+        
+        is_potential_heading = (
             # Skip very short or very long text
-            if len(text) < 3 or len(text) > 200:
-                continue
-            
-            # Multi-lingual skip patterns
-            skip_patterns = {
-                'english': ["figure", "table", "page", "www.", "http", "@", "copyright", "©", "et al.", "ibid"],
-                'spanish': ["figura", "tabla", "página", "www.", "http", "@", "derechos", "©"],
-                'french': ["figure", "tableau", "page", "www.", "http", "@", "droits", "©"],
-                'german': ["abbildung", "tabelle", "seite", "www.", "http", "@", "urheberrecht", "©"],
-                'chinese': ["图", "表", "页", "www.", "http", "@", "©"],
-                'japanese': ["図", "表", "ページ", "www.", "http", "@", "©"],
-                'arabic': ["شكل", "جدول", "صفحة", "www.", "http", "@", "©"],
-                'hindi': ["चित्र", "तालिका", "पृष्ठ", "www.", "http", "@", "©"],
-            }
-            
-            current_skip_patterns = skip_patterns.get(detected_language, skip_patterns['english'])
-            if any(pattern in text.lower() for pattern in current_skip_patterns):
-                continue
-            
-            # Multiple criteria for heading identification
-            size_threshold = max(body_font_size * 1.1, avg_font_size * 1.05)
-            
-            is_potential_heading = (
+            (text_lengths >= 3) & (text_lengths <= 200) & (
                 # Larger than body text
-                font_size > size_threshold or
+                (font_sizes > size_threshold) |
                 # Bold text with reasonable size
-                (is_bold and font_size >= body_font_size * 0.9) or
+                (text_blocks.is_bold & (font_sizes >= body_font_size * 0.9)) |
                 # Significantly larger than average
-                font_size > avg_font_size * 1.3 or
+                (font_sizes > avg_font_size * 1.3) |
                 # Multilingual heading pattern detected
-                is_heading_candidate
+                text_blocks.heading_flags
             )
+        )
+        
+        font_size_values = font_sizes.tolist()
+        is_bold_values = text_blocks.is_bold.tolist()
+        
+        for index in np.flatnonzero(is_potential_heading).tolist():
+            text = texts[index]
+            font_size = font_size_values[index]
+            is_bold = is_bold_values[index]
+            detected_language = text_blocks.languages[index]
+            is_heading_candidate = bool(text_blocks.heading_flags[index])
             
-            # Additional filters for better heading detection
-            if is_potential_heading:
-                # Check text characteristics (language-aware)
-                language_config = self.multilingual.get_language_config(detected_language)
-                word_separator = language_config.get('word_separator', ' ')
-                
-                if word_separator:
-                    word_count = len(text.split(word_separator))
-                else:
-                    # For languages without word separators (Chinese, Japanese)
-                    word_count = len(text)
-                
-                # Language-specific sentence ending patterns
-                punctuation_pattern = language_config.get('punctuation', r'[.!?;:]')
-                has_sentence_ending = bool(re.search(punctuation_pattern + r'$', text))
-                
-                is_all_caps = text.isupper() and len(text) > 3
-                starts_with_number = text.split('.')[0].replace(' ', '').isdigit()
-                
-                # Heading likelihood score
-                heading_score = 0
-                
-                # Font size factor (0-40 points)
-                size_ratio = font_size / body_font_size
-                heading_score += min(40, (size_ratio - 1) * 20)
-                
-                # Bold factor (0-20 points)
-                if is_bold:
-                    heading_score += 20
-                
-                # Length factor (language-aware, 0-20 points)
-                if detected_language in ['chinese', 'japanese']:
-                    # Character-based languages
-                    if len(text) <= 20:
-                        heading_score += 20 - len(text)
-                else:
-                    # Word-based languages
-                    if word_count <= 8:
-                        heading_score += 20 - (word_count * 2)
-                
-                # Position factor (early in page gets bonus, 0-10 points)
-                if block["position"]["y"] < 200:  # Top portion of page
-                    heading_score += 10
-                
-                # Multilingual pattern bonus (0-15 points)
-                if is_heading_candidate:
-                    heading_score += 15
-                
-                # Text pattern bonuses/penalties
-                if not has_sentence_ending:
-                    heading_score += 5  # Headings rarely end with periods
-                
-                if is_all_caps and len(text) < 50:
-                    heading_score += 10  # ALL CAPS headings
-                
-                if starts_with_number:
-                    heading_score += 8  # Numbered headings like "1. Introduction"
-                
-                # Only include if score is high enough
-                if heading_score >= 25:
-                    block_copy = block.copy()
-                    block_copy["heading_score"] = round(heading_score, 2)
-                    block_copy["detected_language"] = detected_language
-                    heading_candidates.append(block_copy)
+            text_lower = text.lower()
+            skip_matcher = SKIP_MATCHERS.get(detected_language, SKIP_MATCHERS['english'])
+            if skip_matcher.contains_any(text_lower):
+                continue
+            
+            # Check text characteristics (language-aware)
+            language_config = self.multilingual.get_language_config(detected_language)
+            word_separator = language_config.get('word_separator', ' ')
+            
+            if word_separator:
+                # Only counts up to 8 words score; stop splitting after that
+                word_count = len(text.split(word_separator, 8))
+            else:
+                # For languages without word separators (Chinese, Japanese)
+                word_count = len(text)
+            
+            # Language-specific sentence ending patterns
+            punctuation_pattern = language_config.get('punctuation', r'[.!?;:]')
+            has_sentence_ending = bool(re.search(punctuation_pattern + r'$', text))
+            
+            is_all_caps = text.isupper() and len(text) > 3
+            starts_with_number = text.partition('.')[0].replace(' ', '').isdigit()
+            
+            # Heading likelihood score
+            heading_score = 0
+            
+            # Font size factor (0-40 points)
+            size_ratio = font_size / body_font_size
+            heading_score += min(40, (size_ratio - 1) * 20)
+            
+            # Bold factor (0-20 points)
+            if is_bold:
+                heading_score += 20
+            
+            # Length factor (language-aware, 0-20 points)
+            if detected_language in ['chinese', 'japanese']:
+                # Character-based languages
+                if len(text) <= 20:
+                    heading_score += 20 - len(text)
+            else:
+                # Word-based languages
+                if word_count <= 8:
+                    heading_score += 20 - (word_count * 2)
+            
+            # Position factor (early in page gets bonus, 0-10 points)
+            if text_blocks.y_position(index) < 200:  # Top portion of page
+                heading_score += 10
+            
+            # Multilingual pattern bonus (0-15 points)
+            if is_heading_candidate:
+                heading_score += 15
+            
+            # Text pattern bonuses/penalties
+            if not has_sentence_ending:
+                heading_score += 5  # Headings rarely end with periods
+            
+            if is_all_caps and len(text) < 50:
+                heading_score += 10  # ALL CAPS headings
+            
+            if starts_with_number:
+                heading_score += 8  # Numbered headings like "1. Introduction"
+            
+            # Only include if score is high enough
+            if heading_score >= 25:
+                heading_candidates.append(HeadingCandidate(
+                    text=text,
+                    font_size=font_size,
+                    is_bold=is_bold,
+                    page_number=int(text_blocks.page_numbers[index]),
+                    position=text_blocks.position(index),
+                    heading_score=round(heading_score, 2),
+                    detected_language=detected_language,
+                    text_lower=text_lower,
+                    word_count=len(text.split(maxsplit=MAX_SCORED_WORDS))
+                ))
         
         # Sort by document order (page number, then Y position)
-        heading_candidates.sort(key=lambda x: (x["page_number"], x["position"]["y"]))
+        heading_candidates.sort(key=lambda x: (x.page_number, x.position["y"]))
         
-        logger.info(f"Identified {len(heading_candidates)} heading candidates")
+        logger.info("Identified %d heading candidates", len(heading_candidates))
         return heading_candidates
-
-    def _classify_heading_levels(self, heading_candidates: List[Dict[str, Any]], 
+    
+    def _classify_heading_levels(self, heading_candidates: List[HeadingCandidate], 
                                font_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Classify heading candidates into H1, H2, H3 levels using multiple factors.
@@ -591,7 +715,7 @@ class PDFStructureAnalyzer:
         - Hierarchy indicators (numbering, bullets, etc.)
         
         Args:
-            heading_candidates: List of heading candidate blocks
+            heading_candidates: List of heading candidate blocks (from _filter_heading_candidates)
             font_analysis: Results from font analysis
             
         Returns:
@@ -603,133 +727,48 @@ class PDFStructureAnalyzer:
         classified_headings = []
         body_font_size = font_analysis["body_font_size"]
         
-        for block in heading_candidates:
-            text = block["text"].strip()
-            font_size = block["font_size"]
-            is_bold = block["is_bold"]
-            position_y = block["position"]["y"]
-            heading_score = block["heading_score"]
-            
-            # Initialize level scoring system
+        texts = [candidate.text.strip() for candidate in heading_candidates]
+        font_sizes = np.array([candidate.font_size for candidate in heading_candidates], dtype=np.float64)
+        is_bold = np.array([candidate.is_bold for candidate in heading_candidates], dtype=bool)
+        position_y = np.array([candidate.position["y"] for candidate in heading_candidates], dtype=np.float64)
+        word_counts = np.array([candidate.word_count for candidate in heading_candidates], dtype=np.int64)
+        
+        # === STRUCTURAL AND TYPOGRAPHY ANALYSIS ===
+        
+        h1_scores, h2_scores, h3_scores = score_heading_levels(
+            font_sizes, is_bold, word_counts, position_y, body_font_size
+        )
+        size_ratios = font_sizes / body_font_size
+        
+        # === TEXT PATTERN AND CONTENT ANALYSIS ===
+        
+        for index, (candidate, text) in enumerate(zip(heading_candidates, texts)):
             h1_score = 0
             h2_score = 0
             h3_score = 0
+            text_lower = candidate.text_lower
             
-            # === TEXT PATTERN ANALYSIS ===
-            text_lower = text.lower()
-            text_length = len(text)
-            word_count = len(text.split())
-            
-            # H1 indicators - Major document sections
-            h1_patterns = [
-                'abstract', 'introduction', 'conclusion', 'summary', 'overview',
-                'background', 'methodology', 'results', 'discussion', 'references',
-                'about', 'experience', 'education', 'skills', 'projects', 'contact',
-                'objective', 'profile', 'qualifications', 'achievements', 'awards'
-            ]
-            
-            # H2 indicators - Subsections and categories
-            h2_patterns = [
-                'work experience', 'employment history', 'professional experience',
-                'technical skills', 'core competencies', 'key skills', 'expertise',
-                'certifications', 'publications', 'research', 'languages',
-                'extracurricular', 'activities', 'volunteering', 'interests',
-                'tools', 'technologies', 'software', 'platforms'
-            ]
-            
-            # H3 indicators - Specific items and details
-            h3_patterns = [
-                'programming languages', 'frameworks', 'databases', 'operating systems',
-                'web technologies', 'mobile development', 'cloud platforms',
-                'project management', 'soft skills', 'leadership', 'communication'
-            ]
-            
-            # Pattern matching scores
-            for pattern in h1_patterns:
-                if pattern in text_lower:
-                    h1_score += 25
-            
-            for pattern in h2_patterns:
-                if pattern in text_lower:
-                    h2_score += 20
-                    
-            for pattern in h3_patterns:
-                if pattern in text_lower:
-                    h3_score += 15
-            
-            # === STRUCTURAL ANALYSIS ===
-            
-            # Position-based scoring (earlier in document = higher level)
-            if position_y < 150:  # Very top of page
-                h1_score += 20
-            elif position_y < 300:  # Upper portion
-                h1_score += 10
-                h2_score += 15
-            elif position_y < 500:  # Middle portion
-                h2_score += 10
-                h3_score += 5
-            else:  # Lower portion
-                h3_score += 10
-            
-            # Text length analysis
-            if word_count == 1:  # Single word headings
-                h1_score += 15
-                h2_score += 10
-            elif word_count <= 3:  # Short phrases
-                h1_score += 10
-                h2_score += 15
-                h3_score += 5
-            elif word_count <= 6:  # Medium phrases
-                h2_score += 10
-                h3_score += 10
-            else:  # Long phrases (less likely to be major headings)
-                h3_score += 5
-            
-            # === TYPOGRAPHY ANALYSIS ===
-            
-            # Font size analysis (still considered but not primary)
-            size_ratio = font_size / body_font_size
-            
-            if size_ratio >= 2.0:
-                h1_score += 20
-            elif size_ratio >= 1.6:
-                h1_score += 15
-                h2_score += 10
-            elif size_ratio >= 1.3:
-                h1_score += 5
-                h2_score += 15
-                h3_score += 5
-            elif size_ratio >= 1.1:
-                h2_score += 10
-                h3_score += 10
-            else:
-                h3_score += 15
-            
-            # Bold formatting
-            if is_bold:
-                h1_score += 15
-                h2_score += 15
-                h3_score += 10
-            
-            # === CONTENT ANALYSIS ===
+            # Pattern matching scores (each pattern found counts once)
+            h1_score += 25 * H1_MATCHER.count(text_lower)
+            h2_score += 20 * H2_MATCHER.count(text_lower)
+            h3_score += 15 * H3_MATCHER.count(text_lower)
             
             # All caps text (often major headings)
-            if text.isupper() and text_length > 2:
+            if text.isupper() and len(text) > 2:
                 h1_score += 20
                 h2_score += 10
             
             # Numbered/lettered headings
-            import re
-            if re.match(r'^[0-9]+\.?\s+', text):  # "1. Introduction" or "1 Background"
+            if NUMBERED_HEADING_RE.match(text):  # "1. Introduction" or "1 Background"
                 h1_score += 15
                 h2_score += 20
-            elif re.match(r'^[0-9]+\.[0-9]+\.?\s+', text):  # "1.1 Overview"
+            elif SUBNUMBERED_HEADING_RE.match(text):  # "1.1 Overview"
                 h2_score += 25
                 h3_score += 10
-            elif re.match(r'^[a-zA-Z][\)\.]\s+', text):  # "a) Details" or "A. Section"
+            elif LETTERED_HEADING_RE.match(text):  # "a) Details" or "A. Section"
                 h2_score += 15
                 h3_score += 20
-            elif re.match(r'^[ivxlc]+\.?\s+', text, re.I):  # Roman numerals "i. item"
+            elif ROMAN_HEADING_RE.match(text):  # Roman numerals "i. item"
                 h2_score += 10
                 h3_score += 15
             
@@ -742,41 +781,39 @@ class PDFStructureAnalyzer:
                 h2_score += 20
             
             # Professional titles and institutions
-            title_indicators = ['university', 'college', 'institute', 'company', 'corporation', 
-                              'ltd', 'inc', 'llc', 'technologies', 'systems', 'solutions']
-            if any(indicator in text_lower for indicator in title_indicators):
+            if TITLE_INDICATOR_MATCHER.contains_any(text_lower):
                 h2_score += 15
                 h3_score += 10
             
-            # === FINAL CLASSIFICATION ===
-            
-            # Determine the level based on highest score
-            max_score = max(h1_score, h2_score, h3_score)
-            
-            if max_score == h1_score and h1_score >= 25:
-                level = "H1"
-            elif max_score == h2_score and h2_score >= 20:
-                level = "H2"
-            elif max_score == h3_score and h3_score >= 15:
-                level = "H3"
-            else:
-                # Fallback logic if scores are too low or tied
-                if size_ratio >= 1.5 or (is_bold and word_count <= 2):
-                    level = "H1"
-                elif size_ratio >= 1.2 or (is_bold and word_count <= 4):
-                    level = "H2"
-                else:
-                    level = "H3"
-            
+            h1_scores[index] += h1_score
+            h2_scores[index] += h2_score
+            h3_scores[index] += h3_score
+        
+        # === FINAL CLASSIFICATION ===
+        
+        # Determine the level based on highest score, with fallback logic
+        # if scores are too low or tied
+        max_scores = np.maximum(np.maximum(h1_scores, h2_scores), h3_scores)
+        levels = np.select([
+            (max_scores == h1_scores) & (h1_scores >= 25),
+            (max_scores == h2_scores) & (h2_scores >= 20),
+            (max_scores == h3_scores) & (h3_scores >= 15),
+            (size_ratios >= 1.5) | (is_bold & (word_counts <= 2)),
+            (size_ratios >= 1.2) | (is_bold & (word_counts <= 4)),
+        ], ["H1", "H2", "H3", "H1", "H2"], "H3")
+        
+        for candidate, text, level, size_ratio, h1_score, h2_score, h3_score, max_score in zip(
+                heading_candidates, texts, levels.tolist(), size_ratios.tolist(),
+                h1_scores.tolist(), h2_scores.tolist(), h3_scores.tolist(), max_scores.tolist()):
             # Create classified heading with detailed scoring info
             classified_heading = {
                 "level": level,
                 "text": text,
-                "page": block["page_number"],
-                "position": block["position"],
-                "font_size": font_size,
-                "is_bold": is_bold,
-                "heading_score": heading_score,
+                "page": candidate.page_number,
+                "position": candidate.position,
+                "font_size": candidate.font_size,
+                "is_bold": candidate.is_bold,
+                "heading_score": candidate.heading_score,
                 "size_ratio": round(size_ratio, 2),
                 "classification_scores": {
                     "h1": h1_score,
@@ -795,12 +832,9 @@ class PDFStructureAnalyzer:
         classified_headings = self._refine_heading_hierarchy(classified_headings)
         
         # Log level distribution
-        level_counts = {}
-        for heading in classified_headings:
-            level = heading["level"]
-            level_counts[level] = level_counts.get(level, 0) + 1
-        
-        logger.info(f"Heading classification: {level_counts}")
+        if logger.isEnabledFor(logging.INFO):
+            level_counts = Counter(heading["level"] for heading in classified_headings)
+            logger.info("Heading classification: %s", dict(level_counts))
         
         return classified_headings
     
@@ -844,13 +878,15 @@ class PDFStructureAnalyzer:
             refined_headings.append(heading)
         
         return refined_headings
-
-    def _identify_document_title(self, text_blocks: List[Dict[str, Any]]) -> str:
+    
+    def _identify_document_title(self, text_blocks: TextBlocks, metadata_title: str = "") -> str:
         """
         Identify the main document title from text blocks.
         
         Args:
-            text_blocks: List of all text blocks
+            text_blocks: Columnar store of all text blocks
+            metadata_title: Title from the PDF metadata; if usable it is returned
+                without scoring the text blocks
             
         Returns:
             Document title string
@@ -858,91 +894,70 @@ class PDFStructureAnalyzer:
         if not text_blocks:
             return "Untitled Document"
         
+        metadata_title = metadata_title.strip()
+        if (5 < len(metadata_title) < 150
+                and not metadata_title.lower().startswith(UNUSABLE_TITLE_PREFIXES)
+                and not FILE_NAME_TITLE_RE.search(metadata_title)):
+            return metadata_title
+        
         # Filter blocks from first two pages only
-        title_candidates = [
-            block for block in text_blocks 
-            if block["page_number"] <= 2
-        ]
+        title_candidates = np.flatnonzero(text_blocks.page_numbers <= 2)
         
-        if not title_candidates:
+        if not title_candidates.size:
             return "Untitled Document"
         
         # Find candidates with largest font size
-        max_font_size = max(block["font_size"] for block in title_candidates)
-        largest_text_blocks = [
-            block for block in title_candidates 
-            if block["font_size"] >= max_font_size * 0.95  # Within 95% of max size
-        ]
+        candidate_sizes = text_blocks.font_sizes[title_candidates]
+        max_font_size = candidate_sizes.max()
+        largest_text_blocks = title_candidates[
+            candidate_sizes >= max_font_size * 0.95  # Within 95% of max size
+        ].tolist()
         
-        # Score title candidates
-        best_title = ""
-        best_score = 0
+        if not largest_text_blocks:
+            return "Untitled Document"
         
-        for block in largest_text_blocks:
-            text = block["text"].strip()
-            font_size = block["font_size"]
-            is_bold = block["is_bold"]
-            page_num = block["page_number"]
-            y_position = block["position"]["y"]
-            
-            # Skip very short or very long text
-            if len(text) < 5 or len(text) > 150:
-                continue
-            
-            # Skip obvious non-titles
-            if any(pattern in text.lower() for pattern in [
-                "page", "figure", "table", "abstract", "introduction",
-                "www.", "http", "@", "copyright", "©"
-            ]):
-                continue
-            
-            # Calculate title score
-            title_score = 0
-            
-            # Font size (0-40 points)
-            title_score += min(40, font_size * 2)
-            
-            # Bold text bonus (0-20 points)
-            if is_bold:
-                title_score += 20
-            
-            # Page position bonus (0-20 points)
-            if page_num == 1:
-                title_score += 20
-            elif page_num == 2:
-                title_score += 10
-            
-            # Y-position bonus (higher on page = better, 0-15 points)
-            if y_position < 200:  # Top of page
-                title_score += 15
-            elif y_position < 400:  # Upper portion
-                title_score += 10
-            
-            # Text characteristics (0-15 points)
-            word_count = len(text.split())
-            if 2 <= word_count <= 12:  # Reasonable title length
-                title_score += 15 - abs(word_count - 6)
-            
-            # Check if it's a reasonable title
-            if not text.endswith('.') and not text.startswith(('Fig', 'Table')):
-                title_score += 10
-            
-            if title_score > best_score:
-                best_score = title_score
-                best_title = text
+        # Score title candidates, all at once
+        texts = [text_blocks.texts[index] for index in largest_text_blocks]
+        font_sizes = text_blocks.font_sizes[largest_text_blocks]
+        page_nums = text_blocks.page_numbers[largest_text_blocks]
+        y_positions = round2(text_blocks.bboxes[largest_text_blocks, 1])
+        word_counts = np.array([len(text.split(maxsplit=MAX_SCORED_WORDS)) for text in texts], dtype=np.int64)
+        
+        # Skip very short or very long text and obvious non-titles
+        is_eligible = np.array([
+            5 <= len(text) <= 150 and not NON_TITLE_MATCHER.contains_any(text.lower())
+            for text in texts
+        ], dtype=bool)
+        
+        # Font size, bold, page, position and length bonuses
+        title_scores = score_title_candidates(
+            font_sizes, text_blocks.is_bold[largest_text_blocks], page_nums, y_positions, word_counts
+        )
+        
+        # Check if it's a reasonable title
+        title_scores += np.array([
+            0 if text.endswith('.') or text.startswith(('Fig', 'Table')) else 10
+            for text in texts
+        ])
+        
+        # Best eligible title: the first highest score, if it is positive
+        title_scores[~is_eligible] = 0
+        best_position = int(np.argmax(title_scores))
+        best_title = texts[best_position] if title_scores[best_position] > 0 else ""
         
         # Fallback to first large text if no good title found
         if not best_title and largest_text_blocks:
-            best_title = largest_text_blocks[0]["text"].strip()
+            best_title = text_blocks.texts[largest_text_blocks[0]]
         
         return best_title if best_title else "Untitled Document"
-
-    def _extract_headings_from_blocks(self, text_blocks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    
+    def _extract_headings_from_blocks(self, text_blocks: TextBlocks, metadata_title: str = "") -> Dict[str, Any]:
         """
         Analyze text blocks to identify and classify headings and title.
         
         Args:
-            text_blocks: List of text block dictionaries
+            text_blocks: Columnar store of the text blocks
+            metadata_title: Title from the PDF metadata (empty to always score the text blocks)
             
         Returns:
             Dictionary containing structural outline with classified headings
@@ -965,30 +980,32 @@ class PDFStructureAnalyzer:
         classified_headings = self._classify_heading_levels(heading_candidates, font_analysis)
         
         # Step 4: Identify document title
-        document_title = self._identify_document_title(text_blocks)
+        document_title = self._identify_document_title(text_blocks, metadata_title)
         
-        # Limit headings to reasonable number and clean up
+        # Limit headings to reasonable number and build them in the output format
         # Filter out title from headings to avoid duplication
         final_headings = []
+        heading_positions = []
         for heading in classified_headings[:20]:  # Limit to top 20 headings
             # Skip this heading if its text matches the document title
             if heading["text"].strip() == document_title.strip():
                 continue
                 
             final_headings.append({
-                "level": heading["level"],
-                "text": heading["text"],
-                "page": heading["page"],
-                "position": {
+                "level": heading["level"],      # H1, H2, or H3
+                "text": heading["text"],        # Heading text content
+                "page": heading["page"]         # Page number (0-indexed)
+            })
+            if self.debug:
+                heading_positions.append({
                     "x": heading["position"]["x"],
                     "y": heading["position"]["y"]
-                }
-            })
+                })
         
-        logger.info(f"Final results - Title: '{document_title[:50]}...', "
-                   f"Headings: {len(final_headings)}")
+        logger.info("Final results - Title: '%.50s...', Headings: %d",
+                   document_title, len(final_headings))
         
-        return {
+        structural_outline = {
             "title": document_title,
             "headings": final_headings,
             "analysis_metadata": {
@@ -997,6 +1014,12 @@ class PDFStructureAnalyzer:
                 "final_heading_count": len(final_headings)
             }
         }
+        
+        # Heading positions are only kept for debugging, alongside the headings
+        if self.debug:
+            structural_outline["heading_positions"] = heading_positions
+        
+        return structural_outline
     
     def _create_error_result(self, filename: str, error_message: str) -> Dict[str, Any]:
         """
@@ -1034,7 +1057,8 @@ class PDFStructureAnalyzer:
         
         Args:
             title: Document title string
-            headings: List of classified heading dictionaries
+            headings: List of heading dictionaries, already in the output format
+                (see _extract_headings_from_blocks)
             
         Returns:
             Dictionary in the required JSON format with 'title' and 'outline' keys
@@ -1042,21 +1066,12 @@ class PDFStructureAnalyzer:
         # Create the exact JSON structure as required
         final_json = {
             "title": title,
-            "outline": []
+            "outline": headings
         }
         
-        # Process each heading to match required format
-        for heading in headings:
-            heading_object = {
-                "level": heading["level"],      # H1, H2, or H3
-                "text": heading["text"],        # Heading text content
-                "page": heading["page"]         # Page number (0-indexed)
-            }
-            final_json["outline"].append(heading_object)
-        
-        logger.info(f"Created final JSON with {len(final_json['outline'])} headings")
+        logger.info("Created final JSON with %d headings", len(final_json['outline']))
         return final_json
-
+    
     def save_result(self, result: Dict[str, Any], pdf_filename: str) -> bool:
         """
         Save the analysis result to a JSON file in the required format with error handling.
@@ -1072,8 +1087,8 @@ class PDFStructureAnalyzer:
             OutputGenerationError: If output generation fails
         """
         try:
-            # Create output filename by replacing .pdf with .json
-            output_filename = pdf_filename.replace('.pdf', '.json')
+            # Create output filename by replacing the .pdf extension with .json
+            output_filename = Path(pdf_filename).with_suffix('.json').name
             output_path = self.output_dir / output_filename
             
             # Extract title and headings from the analysis result
@@ -1084,29 +1099,38 @@ class PDFStructureAnalyzer:
             # Create the final JSON output in the required format
             final_json_output = self._create_final_json_output(title, headings)
             
-            # Validate JSON output before writing
+            # Serialize once with clean formatting; this also validates the output
             try:
-                json.dumps(final_json_output)  # Test serialization
+                if orjson is not None:
+                    output_data = orjson.dumps(final_json_output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                else:
+                    output_data = json.dumps(final_json_output, indent=2, ensure_ascii=False).encode('utf-8')
             except (TypeError, ValueError) as e:
                 raise OutputGenerationError(f"JSON serialization failed: {e}")
             
-            # Write JSON file with clean formatting
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(final_json_output, f, indent=2, ensure_ascii=False)
-            
-            # Verify file was written correctly
-            if not output_path.exists() or output_path.stat().st_size == 0:
+            # Verify there is output to write (without re-checking the file on disk)
+            if not output_data:
                 raise OutputGenerationError("Output file was not created or is empty")
             
-            logger.info(f"Saved final JSON output to {output_path}")
-            logger.info(f"Output contains: Title + {len(final_json_output['outline'])} headings")
+            # Write JSON file with raw system calls, with no file object around it;
+            # os.write may write only part of the buffer, so write until all of it is out
+            remaining = memoryview(output_data)
+            fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while remaining:
+                    remaining = remaining[os.write(fd, remaining):]
+            finally:
+                os.close(fd)
+            
+            logger.info("Saved final JSON output to %s", output_path)
+            logger.info("Output contains: Title + %d headings", len(final_json_output['outline']))
             
             return True
             
         except OutputGenerationError:
             raise
         except Exception as e:
-            logger.error(f"Error saving result for {pdf_filename}: {str(e)}")
+            logger.error("Error saving result for %s: %s", pdf_filename, e)
             raise OutputGenerationError(f"Failed to save output: {e}") from e
     
     def process_all_pdfs(self) -> Dict[str, Any]:
@@ -1125,35 +1149,67 @@ class PDFStructureAnalyzer:
             print(f"   Please add valid PDF files to: {self.input_dir}")
             return {"total_files": 0, "processed": 0, "errors": 0, "processing_time": 0}
         
-        print(f"\n🚀 Starting PDF Structure Analysis")
-        print(f"📁 Input directory: {self.input_dir}")
-        print(f"📁 Output directory: {self.output_dir}")
-        print(f"📄 Found {len(pdf_files)} valid PDF file(s) to process")
-        print("-" * 60)
+        print("\n".join([
+            "\n🚀 Starting PDF Structure Analysis",
+            f"📁 Input directory: {self.input_dir}",
+            f"📁 Output directory: {self.output_dir}",
+            f"📄 Found {len(pdf_files)} valid PDF file(s) to process",
+            "-" * 60
+        ]))
         
         processed_count = 0
         error_count = 0
         error_details = []
         
+        # Analyze and save files in worker processes when there is more than one;
+        # outcomes are still reported in input order
+        workers = min(self.config.processing_limits.max_workers, len(pdf_files))
+        executor = None
+        file_outcomes = []
+        prefetched = None
+        if workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(str(self.input_dir), str(self.output_dir))
+            )
+            # (batch future, index within the batch) of each file
+            for start, stop in _plan_batches(len(pdf_files), workers):
+                future = executor.submit(_process_batch, [str(pdf_file) for pdf_file in pdf_files[start:stop]])
+                file_outcomes.extend((future, offset) for offset in range(stop - start))
+        else:
+            # Read upcoming files in the background while the current one is analyzed
+            max_bytes = self.config.processing_limits.max_file_size_mb * 1024 * 1024
+            prefetched = _prefetch_files(pdf_files, max_bytes)
+        
         for i, pdf_file in enumerate(pdf_files, 1):
             file_start_time = time.time()
             try:
-                print(f"\n[{i}/{len(pdf_files)}] Processing: {pdf_file.name}")
-                print("=" * 50)
+                if self.verbose:
+                    print(f"\n[{i}/{len(pdf_files)}] Processing: {pdf_file.name}")
+                    print("=" * 50)
                 
                 # Perform complete analysis workflow with error handling
-                result = self.analyze_pdf_structure(pdf_file)
-                
-                # Save the final JSON output in required format
-                self.save_result(result, pdf_file.name)
+                if file_outcomes:
+                    # Analyzed and saved by a worker; only its outcome comes back
+                    future, offset = file_outcomes[i - 1]
+                    error = future.result()[offset]
+                    if error is not None:
+                        raise error
+                else:
+                    result = self.analyze_pdf_structure(pdf_file, next(prefetched))
+                    
+                    # Save the final JSON output in required format
+                    self.save_result(result, pdf_file.name)
                 processed_count += 1
                 
-                file_processing_time = time.time() - file_start_time
-                print(f"✅ Successfully processed {pdf_file.name} in {file_processing_time:.2f}s")
-                
-                # Show final output file info
-                output_filename = pdf_file.name.replace('.pdf', '.json')
-                print(f"📄 Output saved as: {output_filename}")
+                if self.verbose:
+                    file_processing_time = time.time() - file_start_time
+                    print(f"✅ Successfully processed {pdf_file.name} in {file_processing_time:.2f}s")
+                    
+                    # Show final output file info
+                    output_filename = pdf_file.with_suffix('.json').name
+                    print(f"📄 Output saved as: {output_filename}")
                 
             except (PDFValidationError, PDFProcessingError, ResourceLimitError, 
                     HeadingDetectionError, OutputGenerationError) as e:
@@ -1166,7 +1222,7 @@ class PDFStructureAnalyzer:
                 })
                 
                 print(f"❌ Failed to process {pdf_file.name}: {e}")
-                logger.error(f"Processing failed for {pdf_file.name}: {e}")
+                logger.error("Processing failed for %s: %s", pdf_file.name, e)
                 
             except KeyboardInterrupt:
                 print(f"\n⚠️  Processing interrupted by user")
@@ -1183,13 +1239,15 @@ class PDFStructureAnalyzer:
                 })
                 
                 print(f"❌ Unexpected error processing {pdf_file.name}: {e}")
-                logger.error(f"Unexpected error processing {pdf_file.name}: {str(e)}", exc_info=True)
+                logger.error("Unexpected error processing %s: %s", pdf_file.name, e, exc_info=True)
+        
+        if executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if prefetched:
+            prefetched.close()
         
         # Final summary
         total_time = time.time() - start_time
-        print("\n" + "=" * 60)
-        print("📊 PROCESSING SUMMARY")
-        print("-" * 30)
         
         summary = {
             "total_files": len(pdf_files),
@@ -1200,24 +1258,244 @@ class PDFStructureAnalyzer:
             "error_details": error_details
         }
         
-        print(f"Total files: {summary['total_files']}")
-        print(f"Successfully processed: {summary['processed']}")
-        print(f"Errors: {summary['errors']}")
-        print(f"Success rate: {summary['success_rate']}%")
-        print(f"Total processing time: {summary['processing_time']}s")
+        # Print the summary to console in a single write
+        summary_lines = [
+            "\n" + "=" * 60,
+            "📊 PROCESSING SUMMARY",
+            "-" * 30,
+            f"Total files: {summary['total_files']}",
+            f"Successfully processed: {summary['processed']}",
+            f"Errors: {summary['errors']}",
+            f"Success rate: {summary['success_rate']}%",
+            f"Total processing time: {summary['processing_time']}s"
+        ]
         
         if processed_count > 0:
-            print(f"\n✅ Results available in: {self.output_dir}")
+            summary_lines.append(f"\n✅ Results available in: {self.output_dir}")
         
         if error_details:
-            print(f"\n❌ Error Summary:")
-            for error in error_details:
-                print(f"  - {error['file']}: {error['error_type']} in {error['stage']}")
+            summary_lines.append("\n❌ Error Summary:")
+            summary_lines.extend(
+                f"  - {error['file']}: {error['error_type']} in {error['stage']}"
+                for error in error_details
+            )
         
-        logger.info(f"Processing complete: {summary}")
+        print("\n".join(summary_lines))
+        
+        logger.info("Processing complete: %s", summary)
         return summary
 
 
+def _read_file(path: Path, max_bytes: int) -> Optional[bytes]:
+    """
+    Read a whole file into memory.
+    
+    Args:
+        path: File to read
+        max_bytes: Files larger than this are not read
+        
+    Returns:
+        File contents, or None if the file is too large or cannot be read
+        (it is then opened from its path and validated as usual)
+    """
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > max_bytes:
+                return None
+            return f.read()
+    except OSError:
+        return None
+
+
+def _prefetch_files(paths: List[Path], max_bytes: int) -> Iterator[Optional[bytes]]:
+    """
+    Yield the contents of each file in order, reading up to PREFETCH_WINDOW files ahead
+    on a background thread.
+    
+    Args:
+        paths: Files to read
+        max_bytes: Files larger than this are yielded as None instead of being read
+        
+    Yields:
+        Contents of each file (see _read_file)
+    """
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="docudots-prefetch") as executor:
+        reads = deque()
+        for path in paths[:PREFETCH_WINDOW]:
+            reads.append(executor.submit(_read_file, path, max_bytes))
+        
+        for next_path in paths[PREFETCH_WINDOW:] + [None] * len(reads):
+            data = reads.popleft().result()
+            if next_path is not None:
+                reads.append(executor.submit(_read_file, next_path, max_bytes))
+            yield data
+
+
+def _extract_pages(doc: fitz.Document, page_numbers: range) -> TextBlocks:
+    """
+    Extract the text blocks of the given pages with their properties.
+    
+    Args:
+        doc: PyMuPDF document object
+        page_numbers: Pages to extract, in order
+        
+    Returns:
+        Columnar store of the text block properties
+    """
+    return TextBlocks.from_spans(_iter_spans(doc, page_numbers))
+
+
+def _iter_spans(doc: fitz.Document, page_numbers: range) -> Iterator[Tuple[Any, ...]]:
+    """
+    Yield the non-empty text spans of the given pages as flat tuples.
+    
+    Args:
+        doc: PyMuPDF document object
+        page_numbers: Pages to extract, in order
+        
+    Yields:
+        (text, font_name, font_size, is_bold, page_number, x0, y0, x1, y1) of each
+        span, unrounded (TextBlocks.from_spans rounds the font sizes in one pass)
+    """
+    for page_num in page_numbers:
+        page = doc[page_num]
+        
+        # Get text blocks with detailed formatting information
+        # Using get_text("dict") to get detailed formatting data
+        text_dict = page.get_text("dict")
+        
+        # Process each block in the page
+        for block in text_dict["blocks"]:
+            # Skip image blocks, only process text blocks
+            if "lines" not in block:
+                continue
+            
+            # Process each line in the block
+            for line in block["lines"]:
+                # Process each span (text with consistent formatting) in the line
+                for span in line["spans"]:
+                    # Extract text content
+                    text_content = span["text"].strip()
+                    
+                    # Skip empty text spans
+                    if not text_content:
+                        continue
+                    
+                    # Extract font properties
+                    font_size = span.get("size", 0)
+                    font_flags = span.get("flags", 0)
+                    
+                    # Get text position (bbox: [x0, y0, x1, y1])
+                    x0, y0, x1, y1 = span.get("bbox", (0, 0, 0, 0))
+                    
+                    # Font flags bit 4 (16) indicates bold; page numbers are 0-indexed
+                    yield (
+                        text_content, span.get("font", ""),
+                        font_size, font_flags & 16, page_num,
+                        x0, y0, x1, y1
+                    )
+        
+        # Release the page's text dictionary before moving on to the next page
+        del text_dict
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> TextBlocks:
+    """
+    Worker entry point: open the PDF and extract pages ``start`` to ``stop``.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        start: First page (inclusive)
+        stop: Last page (exclusive)
+        
+    Returns:
+        Columnar store of the text block properties
+    """
+    with fitz.open(pdf_path) as doc:
+        return _extract_pages(doc, range(start, stop))
+
+
+# Analyzer of the current worker process, created once by _init_worker
+_worker_analyzer: Optional[PDFStructureAnalyzer] = None
+
+
+def _init_worker(input_dir: str, output_dir: str) -> None:
+    """
+    Initialize a batch worker process with its own analyzer.
+    
+    Args:
+        input_dir: Directory containing input PDF files
+        output_dir: Directory for output JSON files
+    """
+    global _worker_analyzer
+    # The parent process validated the environment and every input file before
+    # starting the workers
+    _worker_analyzer = PDFStructureAnalyzer(input_dir, output_dir, validate_environment=False)
+    # Already running inside a worker process: extract pages in-process
+    _worker_analyzer.extract_workers = 1
+
+
+def _process_one(pdf_path: str) -> None:
+    """
+    Analyze a single PDF and save its JSON output in a batch worker process.
+    
+    The result is written by the worker itself, so it never has to be
+    pickled back to the parent process.
+    
+    Args:
+        pdf_path: Path to the PDF file (paths pickle cheaply, fitz documents do not)
+    """
+    pdf_file = Path(pdf_path)
+    result = _worker_analyzer.analyze_pdf_structure(pdf_file)
+    _worker_analyzer.save_result(result, pdf_file.name)
+
+
+def _process_batch(pdf_paths: List[str]) -> List[Optional[Exception]]:
+    """
+    Process several PDFs, in order, in a batch worker process.
+    
+    Args:
+        pdf_paths: Paths to the PDF files
+        
+    Returns:
+        None or the raised exception for each file, so that one failure
+        does not affect the other files of the batch
+    """
+    outcomes = []
+    for pdf_path in pdf_paths:
+        try:
+            _process_one(pdf_path)
+            outcomes.append(None)
+        except Exception as e:
+            outcomes.append(e)
+    return outcomes
+
+
+def _plan_batches(file_count: int, workers: int) -> List[Tuple[int, int]]:
+    """
+    Split the file list into worker tasks of adaptive size.
+    
+    While more than 2 * workers files remain, files are grouped into tasks of
+    TARGET_BATCH_SIZE to cut per-task scheduling overhead; the tail is submitted
+    one file per task so idle workers can pick up the work behind a straggler.
+    
+    Args:
+        file_count: Number of files to process
+        workers: Number of worker processes
+        
+    Returns:
+        (start, stop) index range of each task, in order
+    """
+    batches = []
+    start = 0
+    while start < file_count:
+        remaining = file_count - start
+        size = TARGET_BATCH_SIZE if remaining > 2 * workers else 1
+        batches.append((start, start + size))
+        start += size
+    return batches
+
+
 def main():
     """
     Main execution function - Complete PDF Structure Analysis Workflow.
@@ -1254,25 +1532,18 @@ def main():
         
         # Final status and exit
         if summary["errors"] > 0:
-            logger.warning(f"Completed with {summary['errors']} errors")
+            logger.warning("Completed with %d errors", summary['errors'])
             print(f"\n⚠️  Processing completed with {summary['errors']} errors")
             print("Check the logs for details on failed files")
             sys.exit(1)
         else:
             logger.info("All files processed successfully")
             print(f"\n🎉 All {summary['processed']} files processed successfully!")
-            print("\nFinal JSON Output Format:")
-            print('   {')
-            print('     "title": "Document Title",')
-            print('     "outline": [')
-            print('       {"level": "H1", "text": "Heading Text", "page": 0},')
-            print('       {"level": "H2", "text": "Sub Heading", "page": 1}')
-            print('     ]')
-            print('   }')
+            print(EXAMPLE_OUTPUT_FORMAT)
             sys.exit(0)
             
     except Exception as e:
-        logger.error(f"Fatal error in main execution: {str(e)}")
+        logger.error("Fatal error in main execution: %s", e)
         print(f"\n❌ Fatal error: {str(e)}")
         print("Please check the logs and try again")
         sys.exit(1)
@@ -11,7 +11,28 @@ from dataclasses import dataclass
 from .exceptions import ConfigurationError
 
 
-@dataclass
+SUPPORTED_PATTERNS: Dict[str, List[str]] = {
+    'en': [
+        # H1 patterns - Major sections
+        'abstract', 'introduction', 'conclusion', 'summary', 'overview',
+        'background', 'methodology', 'results', 'discussion', 'references',
+        'about', 'experience', 'education', 'skills', 'projects', 'contact',
+        'objective', 'profile', 'qualifications', 'achievements', 'awards'
+    ],
+    'academic': [
+        # Academic-specific patterns
+        'literature review', 'data analysis', 'findings', 'implications',
+        'future work', 'acknowledgments', 'appendix', 'bibliography'
+    ],
+    'business': [
+        # Business document patterns
+        'executive summary', 'market analysis', 'financial overview',
+        'recommendations', 'action items', 'next steps'
+    ]
+}
+
+
+@dataclass(slots=True)
 class ProcessingLimits:
     """Processing limits and thresholds."""
     max_file_size_mb: int = 100  # Maximum PDF file size in MB
@@ -19,12 +40,15 @@ class ProcessingLimits:
     max_processing_time_seconds: int = 300  # 5 minutes timeout
     max_headings_per_document: int = 50     # Maximum headings to extract
     max_text_blocks: int = 10000            # Maximum text blocks to process
+    max_workers: int = min(os.cpu_count() or 1, 4)  # Worker processes for batch processing
+    page_workers: int = 1        # Worker processes extracting the pages of one large document (1 = in-process)
 
 
-@dataclass
+@dataclass(slots=True)
 class HeadingConfig:
     """Heading detection configuration."""
     score_threshold: int = 25               # Minimum score for heading candidates
+    prefer_metadata_title: bool = False     # Use a usable PDF metadata title instead of scoring text blocks
     font_size_ratios: Dict[str, float] = None
     pattern_weights: Dict[str, int] = None
     
@@ -47,18 +71,22 @@ class HeadingConfig:
             }
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
-    format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"  # File log format
+    stdout_format: str = "%(message)s"      # Console format (no per-record timestamp formatting)
     enable_file_logging: bool = False
     log_file_path: str = "/app/logs/docudots.log"
+    verbose: bool = False                   # Print per-file progress and heading previews to the console
 
 
 class Config:
     """Main configuration class for DocuDots."""
     
+    __slots__ = ('processing_limits', 'heading_config', 'logging_config')
+    
     def __init__(self):
         self.processing_limits = ProcessingLimits()
         self.heading_config = HeadingConfig()
@@ -79,38 +107,32 @@ class Config:
         if timeout := os.getenv('DOCUDOTS_PROCESSING_TIMEOUT'):
             self.processing_limits.max_processing_time_seconds = int(timeout)
         
+        if max_workers := os.getenv('DOCUDOTS_MAX_WORKERS'):
+            self.processing_limits.max_workers = int(max_workers)
+        
+        if page_workers := os.getenv('DOCUDOTS_PAGE_WORKERS'):
+            self.processing_limits.page_workers = int(page_workers)
+        
         # Heading detection
         if threshold := os.getenv('DOCUDOTS_HEADING_THRESHOLD'):
             self.heading_config.score_threshold = int(threshold)
         
+        if prefer_metadata_title := os.getenv('DOCUDOTS_PREFER_METADATA_TITLE'):
+            self.heading_config.prefer_metadata_title = prefer_metadata_title.lower() == 'true'
+        
         # Logging
         if log_level := os.getenv('DOCUDOTS_LOG_LEVEL'):
             self.logging_config.level = log_level.upper()
         
         if enable_file_log := os.getenv('DOCUDOTS_ENABLE_FILE_LOGGING'):
             self.logging_config.enable_file_logging = enable_file_log.lower() == 'true'
+        
+        if verbose := os.getenv('DOCUDOTS_VERBOSE'):
+            self.logging_config.verbose = verbose.lower() == 'true'
     
     def get_supported_patterns(self) -> Dict[str, List[str]]:
         """Get supported heading patterns by language."""
-        return {
-            'en': [
-                # H1 patterns - Major sections
-                'abstract', 'introduction', 'conclusion', 'summary', 'overview',
-                'background', 'methodology', 'results', 'discussion', 'references',
-                'about', 'experience', 'education', 'skills', 'projects', 'contact',
-                'objective', 'profile', 'qualifications', 'achievements', 'awards'
-            ],
-            'academic': [
-                # Academic-specific patterns
-                'literature review', 'data analysis', 'findings', 'implications',
-                'future work', 'acknowledgments', 'appendix', 'bibliography'
-            ],
-            'business': [
-                # Business document patterns
-                'executive summary', 'market analysis', 'financial overview',
-                'recommendations', 'action items', 'next steps'
-            ]
-        }
+        return {language: list(patterns) for language, patterns in SUPPORTED_PATTERNS.items()}
     
     def validate(self) -> bool:
         """Validate the configuration."""
@@ -119,6 +141,8 @@ class Config:
             assert self.processing_limits.max_file_size_mb > 0, "Max file size must be positive"
             assert self.processing_limits.max_pages > 0, "Max pages must be positive"
             assert self.processing_limits.max_processing_time_seconds > 0, "Timeout must be positive"
+            assert self.processing_limits.max_workers > 0, "Max workers must be positive"
+            assert self.processing_limits.page_workers > 0, "Page workers must be positive"
             
             # Validate heading config
             assert self.heading_config.score_threshold >= 0, "Score threshold must be non-negative"
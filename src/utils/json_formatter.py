@@ -5,7 +5,67 @@ Utility functions for JSON formatting and validation
 
 import json
 from typing import Dict, Any, List
-from jsonschema import validate, ValidationError
+
+try:
+    import orjson
+except ImportError:
+    # orjson not available, use the standard library encoder
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    # fastjsonschema not available, validate with jsonschema
+    fastjsonschema = None
+    from jsonschema import validate, ValidationError
+
+
+OUTPUT_SCHEMA = {
+    "type": "object",
+    "required": ["document_info", "structural_outline"],
+    "properties": {
+        "document_info": {
+            "type": "object",
+            "required": ["filename", "total_pages", "title"],
+            "properties": {
+                "filename": {"type": "string"},
+                "total_pages": {"type": "integer", "minimum": 0},
+                "title": {"type": "string"},
+                "processing_timestamp": {"type": ["string", "null"]},
+                "error": {"type": "string"}
+            }
+        },
+        "structural_outline": {
+            "type": "object",
+            "required": ["title", "headings"],
+            "properties": {
+                "title": {"type": "string"},
+                "headings": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "required": ["level", "text", "page"],
+                        "properties": {
+                            "level": {"type": "string", "enum": ["H1", "H2", "H3"]},
+                            "text": {"type": "string"},
+                            "page": {"type": "integer", "minimum": 1},
+                            "position": {
+                                "type": "object",
+                                "properties": {
+                                    "x": {"type": "number"},
+                                    "y": {"type": "number"}
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+# Compiled once at import; validation is then a call to generated Python code
+_output_validator = fastjsonschema.compile(OUTPUT_SCHEMA) if fastjsonschema is not None else None
 
 
 def format_json_output(data: Dict[str, Any], indent: int = 2) -> str:
@@ -19,6 +79,9 @@ def format_json_output(data: Dict[str, Any], indent: int = 2) -> str:
     Returns:
         Formatted JSON string
     """
+    # orjson only supports 2-space indentation
+    if orjson is not None and indent == 2:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
     return json.dumps(data, indent=indent, ensure_ascii=False)
 
 
@@ -32,52 +95,15 @@ def validate_output_schema(data: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    schema = {
-        "type": "object",
-        "required": ["document_info", "structural_outline"],
-        "properties": {
-            "document_info": {
-                "type": "object",
-                "required": ["filename", "total_pages", "title"],
-                "properties": {
-                    "filename": {"type": "string"},
-                    "total_pages": {"type": "integer", "minimum": 0},
-                    "title": {"type": "string"},
-                    "processing_timestamp": {"type": ["string", "null"]},
-                    "error": {"type": "string"}
-                }
-            },
-            "structural_outline": {
-                "type": "object",
-                "required": ["title", "headings"],
-                "properties": {
-                    "title": {"type": "string"},
-                    "headings": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "required": ["level", "text", "page"],
-                            "properties": {
-                                "level": {"type": "string", "enum": ["H1", "H2", "H3"]},
-                                "text": {"type": "string"},
-                                "page": {"type": "integer", "minimum": 1},
-                                "position": {
-                                    "type": "object",
-                                    "properties": {
-                                        "x": {"type": "number"},
-                                        "y": {"type": "number"}
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-    }
+    if _output_validator is not None:
+        try:
+            _output_validator(data)
+            return True
+        except fastjsonschema.JsonSchemaException:
+            return False
     
     try:
-        validate(instance=data, schema=schema)
+        validate(instance=data, schema=OUTPUT_SCHEMA)
         return True
     except ValidationError:
         return False
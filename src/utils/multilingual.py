@@ -4,9 +4,227 @@ Handles text extraction and normalization across different languages.
 """
 
 import re
-from typing import Dict, List, Set, Optional
+from typing import Dict, Iterable, List, Set, Optional, Tuple
 import unicodedata
 
+# Common heading patterns across languages
+HEADING_PATTERNS = {
+    'english': (
+        r'\b(chapter|section|part|introduction|conclusion|summary|overview|abstract)\b',
+        r'\b(table of contents|contents|index|references|bibliography|appendix)\b',
+        r'\b\d+\.\s*[A-Z]',  # Numbered sections like "1. Introduction"
+    ),
+    'spanish': (
+        r'\b(capítulo|sección|parte|introducción|conclusión|resumen|índice)\b',
+        r'\b(contenido|referencias|bibliografía|apéndice)\b',
+    ),
+    'french': (
+        r'\b(chapitre|section|partie|introduction|conclusion|résumé|index)\b',
+        r'\b(contenu|références|bibliographie|annexe)\b',
+    ),
+    'german': (
+        r'\b(kapitel|abschnitt|teil|einführung|fazit|zusammenfassung|index)\b',
+        r'\b(inhalt|verzeichnis|literatur|anhang)\b',
+    ),
+    'chinese': (
+        r'第[一二三四五六七八九十\d]+章',  # Chapter markers
+        r'(?:目录|索引|摘要|总结|结论|附录)',
+    ),
+    'japanese': (
+        r'第[一二三四五六七八九十\d]+章',
+        r'(?:目次|索引|要約|結論|付録)',
+    ),
+    'arabic': (
+        r'الفصل\s+[\d\u0660-\u0669]+',  # Arabic numerals
+        r'(?:المحتويات|الفهرس|الملخص|الخاتمة|المراجع)',
+    ),
+    'hindi': (
+        r'अध्याय\s+[\d०-९]+',
+        r'(?:सूची|सारांश|निष्कर्ष|संदर्भ)',
+    ),
+}
+
+# Script detection patterns
+SCRIPT_PATTERNS = {
+    'latin': r'[A-Za-z]',
+    'cyrillic': r'[\u0400-\u04FF]',
+    'arabic': r'[\u0600-\u06FF]',
+    'chinese': r'[\u4e00-\u9fff]',
+    'japanese_hiragana': r'[\u3040-\u309f]',
+    'japanese_katakana': r'[\u30a0-\u30ff]',
+    'korean': r'[\uac00-\ud7af]',
+    'thai': r'[\u0e00-\u0e7f]',
+    'devanagari': r'[\u0900-\u097f]',
+}
+
+# Common stop words across languages (for better title detection)
+STOP_WORDS = {
+    'english': frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with'}),
+    'spanish': frozenset({'el', 'la', 'los', 'las', 'un', 'una', 'y', 'o', 'pero', 'en', 'de', 'con', 'para'}),
+    'french': frozenset({'le', 'la', 'les', 'un', 'une', 'et', 'ou', 'mais', 'en', 'de', 'avec', 'pour'}),
+    'german': frozenset({'der', 'die', 'das', 'ein', 'eine', 'und', 'oder', 'aber', 'in', 'von', 'mit', 'für'}),
+    'chinese': frozenset({'的', '了', '在', '是', '和', '有', '也', '不', '这', '那'}),
+    'japanese': frozenset({'の', 'に', 'は', 'を', 'が', 'で', 'と', 'から', 'まで', 'より'}),
+    'arabic': frozenset({'في', 'من', 'إلى', 'على', 'عن', 'مع', 'هذا', 'هذه', 'ذلك', 'تلك'}),
+    'hindi': frozenset({'का', 'की', 'के', 'में', 'से', 'को', 'पर', 'और', 'है', 'हैं'}),
+}
+
+# Script-based language mapping, used by detect_language
+SCRIPT_LANGUAGES = {
+    'latin': 'english',  # Default to English for Latin script
+    'cyrillic': 'russian',
+    'arabic': 'arabic',
+    'chinese': 'chinese',
+    'japanese_hiragana': 'japanese',
+    'japanese_katakana': 'japanese',
+    'korean': 'korean',
+    'thai': 'thai',
+    'devanagari': 'hindi',
+}
+
+# Language-specific text processing configuration, see get_language_config
+LANGUAGE_CONFIGS = {
+    'english': {
+        'reading_direction': 'ltr',
+        'word_separator': ' ',
+        'punctuation': r'[.!?;:]',
+        'case_sensitive': False,
+    },
+    'arabic': {
+        'reading_direction': 'rtl',
+        'word_separator': ' ',
+        'punctuation': r'[.!?؟;:]',
+        'case_sensitive': False,
+    },
+    'chinese': {
+        'reading_direction': 'ltr',
+        'word_separator': '',
+        'punctuation': r'[。！？；：]',
+        'case_sensitive': False,
+    },
+    'japanese': {
+        'reading_direction': 'ltr',
+        'word_separator': '',
+        'punctuation': r'[。！？；：]',
+        'case_sensitive': False,
+    },
+}
+
+# Arabic diacritics (harakat and Quranic marks), removed by normalize_text
+# with a single str.translate pass
+ARABIC_DIACRITICS_TRANSLATION = {
+    **dict.fromkeys(range(0x064B, 0x0660)),
+    0x0670: None,
+    **dict.fromkeys(range(0x06D6, 0x06EE)),
+}
+
+# Code point ranges of each script, in detect_script's tie-breaking order
+# (the same ranges as SCRIPT_PATTERNS)
+SCRIPT_RANGES = {
+    'latin': ((0x41, 0x5A), (0x61, 0x7A)),
+    'cyrillic': ((0x0400, 0x04FF),),
+    'arabic': ((0x0600, 0x06FF),),
+    'chinese': ((0x4E00, 0x9FFF),),
+    'japanese_hiragana': ((0x3040, 0x309F),),
+    'japanese_katakana': ((0x30A0, 0x30FF),),
+    'korean': ((0xAC00, 0xD7AF),),
+    'thai': ((0x0E00, 0x0E7F),),
+    'devanagari': ((0x0900, 0x097F),),
+}
+
+# One private-use marker character per script. str.translate replaces every
+# character of a script by its marker (and drops markers already in the text),
+# so the script histogram is a few C-level str.count calls.
+SCRIPT_MARKERS = tuple(chr(0xE000 + index) for index in range(len(SCRIPT_RANGES)))
+SCRIPT_NAMES = tuple(SCRIPT_RANGES)
+SCRIPT_TRANSLATION = {ord(marker): None for marker in SCRIPT_MARKERS}
+for marker, ranges in zip(SCRIPT_MARKERS, SCRIPT_RANGES.values()):
+    for first, last in ranges:
+        SCRIPT_TRANSLATION.update(dict.fromkeys(range(first, last + 1), marker))
+
+LATIN_LETTER_RE = re.compile(r'[A-Za-z]')
+
+# Latin-script languages recognized by their heading patterns, in priority order
+LATIN_LANGUAGES = ('spanish', 'french', 'german')
+
+
+# A heading pattern that is a group of literal keywords, e.g. r'\b(chapter|section)\b'
+KEYWORD_GROUP_RE = re.compile(r'\\b\(([^()\[\]\\.*+?{}^$]+)\)\\b')
+
+# Substrings required by the other heading patterns that have an ASCII quick check
+PATTERN_REQUIRED_SUBSTRINGS = {
+    # An ASCII digit right before the dot; a lone '.' occurs in nearly all body text
+    r'\b\d+\.\s*[A-Z]': tuple(f'{digit}.' for digit in '0123456789'),
+}
+
+
+def _alternation(patterns: Iterable[str], flags: int = 0) -> re.Pattern:
+    """Compile patterns into one regex that matches wherever any of them does."""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), flags)
+
+
+def _ascii_quick_check(patterns: Iterable[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Get substrings of which lowercased ASCII text must contain at least one
+    to match any of the given (case-insensitive) patterns.
+    
+    Returns:
+        The substrings, or None if some pattern has no known requirement
+    """
+    required = []
+    for pattern in patterns:
+        keyword_group = KEYWORD_GROUP_RE.fullmatch(pattern)
+        if keyword_group:
+            required.extend(keyword_group.group(1).split('|'))
+        elif pattern in PATTERN_REQUIRED_SUBSTRINGS:
+            required.extend(PATTERN_REQUIRED_SUBSTRINGS[pattern])
+        else:
+            return None
+    # Substrings with non-ASCII characters never occur in ASCII text
+    return tuple(dict.fromkeys(substring for substring in required if substring.isascii()))
+
+
+# Heading patterns compiled once, so per-block checks skip the re module's pattern
+# cache; each language's heading patterns are fused into a single regex
+HEADING_REGEXES = {
+    language: _alternation(patterns, re.IGNORECASE)
+    for language, patterns in HEADING_PATTERNS.items()
+}
+
+# All Latin-language patterns in one regex, so most Latin text is ruled out in one scan
+LATIN_LANGUAGES_RE = _alternation(
+    [pattern for language in LATIN_LANGUAGES for pattern in HEADING_PATTERNS[language]],
+    re.IGNORECASE
+)
+
+# ASCII quick checks: plain substring tests that rule out most ASCII text before
+# any regex runs (for ASCII, case-insensitive matching of lowercased text is exact)
+HEADING_QUICK_CHECKS = {
+    language: _ascii_quick_check(patterns)
+    for language, patterns in HEADING_PATTERNS.items()
+}
+LATIN_LANGUAGES_QUICK_CHECK = _ascii_quick_check(
+    [pattern for language in LATIN_LANGUAGES for pattern in HEADING_PATTERNS[language]]
+)
+
+
+def _may_match(text_lower: str, quick_check: Optional[Tuple[str, ...]]) -> bool:
+    """Check whether lowercased text passes a quick check (non-ASCII text always does)."""
+    if quick_check is None or not text_lower.isascii():
+        return True
+    for substring in quick_check:
+        if substring in text_lower:
+            return True
+    return False
+
+
+# Universal heading indicators, checked after the language-specific patterns
+UNIVERSAL_HEADING_RE = _alternation([
+    r'^\d+\.?\s*[A-Z\u00C0-\u017F\u0400-\u04FF\u4e00-\u9fff]',  # Numbered sections
+    r'^[IVX]+\.?\s*[A-Z\u00C0-\u017F\u0400-\u04FF\u4e00-\u9fff]',  # Roman numerals
+    r'^[A-Z\u00C0-\u017F\u0400-\u04FF\u4e00-\u9fff][A-Z\u00C0-\u017F\u0400-\u04FF\u4e00-\u9fff\s]{2,}$',  # All caps
+])
+
 
 class MultilingualSupport:
     """
@@ -15,67 +233,10 @@ class MultilingualSupport:
     """
     
     def __init__(self):
-        # Common heading patterns across languages
-        self.heading_patterns = {
-            'english': [
-                r'\b(chapter|section|part|introduction|conclusion|summary|overview|abstract)\b',
-                r'\b(table of contents|contents|index|references|bibliography|appendix)\b',
-                r'\b\d+\.\s*[A-Z]',  # Numbered sections like "1. Introduction"
-            ],
-            'spanish': [
-                r'\b(capítulo|sección|parte|introducción|conclusión|resumen|índice)\b',
-                r'\b(contenido|referencias|bibliografía|apéndice)\b',
-            ],
-            'french': [
-                r'\b(chapitre|section|partie|introduction|conclusion|résumé|index)\b',
-                r'\b(contenu|références|bibliographie|annexe)\b',
-            ],
-            'german': [
-                r'\b(kapitel|abschnitt|teil|einführung|fazit|zusammenfassung|index)\b',
-                r'\b(inhalt|verzeichnis|literatur|anhang)\b',
-            ],
-            'chinese': [
-                r'第[一二三四五六七八九十\d]+章',  # Chapter markers
-                r'[目录|索引|摘要|总结|结论|附录]',
-            ],
-            'japanese': [
-                r'第[一二三四五六七八九十\d]+章',
-                r'[目次|索引|要約|結論|付録]',
-            ],
-            'arabic': [
-                r'الفصل\s+[\d\u0660-\u0669]+',  # Arabic numerals
-                r'[المحتويات|الفهرس|الملخص|الخاتمة|المراجع]',
-            ],
-            'hindi': [
-                r'अध्याय\s+[\d०-९]+',
-                r'[सूची|सारांश|निष्कर्ष|संदर्भ]',
-            ],
-        }
-        
-        # Script detection patterns
-        self.script_patterns = {
-            'latin': r'[A-Za-z]',
-            'cyrillic': r'[\u0400-\u04FF]',
-            'arabic': r'[\u0600-\u06FF]',
-            'chinese': r'[\u4e00-\u9fff]',
-            'japanese_hiragana': r'[\u3040-\u309f]',
-            'japanese_katakana': r'[\u30a0-\u30ff]',
-            'korean': r'[\uac00-\ud7af]',
-            'thai': r'[\u0e00-\u0e7f]',
-            'devanagari': r'[\u0900-\u097f]',
-        }
-        
-        # Common stop words across languages (for better title detection)
-        self.stop_words = {
-            'english': {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with'},
-            'spanish': {'el', 'la', 'los', 'las', 'un', 'una', 'y', 'o', 'pero', 'en', 'de', 'con', 'para'},
-            'french': {'le', 'la', 'les', 'un', 'une', 'et', 'ou', 'mais', 'en', 'de', 'avec', 'pour'},
-            'german': {'der', 'die', 'das', 'ein', 'eine', 'und', 'oder', 'aber', 'in', 'von', 'mit', 'für'},
-            'chinese': {'的', '了', '在', '是', '和', '有', '也', '不', '这', '那'},
-            'japanese': {'の', 'に', 'は', 'を', 'が', 'で', 'と', 'から', 'まで', 'より'},
-            'arabic': {'في', 'من', 'إلى', 'على', 'عن', 'مع', 'هذا', 'هذه', 'ذلك', 'تلك'},
-            'hindi': {'का', 'की', 'के', 'में', 'से', 'को', 'पर', 'और', 'है', 'हैं'},
-        }
+        # Patterns and word lists are module constants shared by every instance
+        self.heading_patterns = HEADING_PATTERNS
+        self.script_patterns = SCRIPT_PATTERNS
+        self.stop_words = STOP_WORDS
     
     def normalize_text(self, text: str) -> str:
         """
@@ -87,24 +248,62 @@ class MultilingualSupport:
         Returns:
             Normalized text string
         """
+        return self._normalize_text(text)[0]
+    
+    def _normalize_text(self, text: str) -> Tuple[str, Optional[str]]:
+        """
+        Normalize text, also returning the script of the result when it was detected on the way.
+        
+        Args:
+            text: Raw text to normalize
+            
+        Returns:
+            Tuple of (normalized text, its script or None if not detected)
+        """
         if not text:
-            return ""
+            return "", None
         
-        # Unicode normalization (NFC form)
-        text = unicodedata.normalize('NFC', text)
+        # Unicode normalization (NFC form); ASCII text is always normalized, and
+        # the quick check skips the full normalization for most other text
+        is_ascii = text.isascii()
+        if not is_ascii and not unicodedata.is_normalized('NFC', text):
+            text = unicodedata.normalize('NFC', text)
         
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Remove excessive whitespace and strip leading/trailing whitespace
+        # (str.split splits on the same characters as the regex \s)
+        text = ' '.join(text.split())
         
-        # Strip leading/trailing whitespace
-        text = text.strip()
+        # Handle right-to-left languages (Arabic, Hebrew); ASCII text cannot be Arabic
+        if is_ascii:
+            return text, None
         
-        # Handle right-to-left languages (Arabic, Hebrew)
-        if self.detect_script(text) == 'arabic':
-            # Remove Arabic diacritics for better matching
-            text = re.sub(r'[\u064B-\u065F\u0670\u06D6-\u06ED]', '', text)
+        script = self.detect_script(text)
+        if script == 'arabic':
+            # Remove Arabic diacritics for better matching (which can change the script)
+            return text.translate(ARABIC_DIACRITICS_TRANSLATION), None
+        
+        return text, script
+    
+    def _analyze(self, text: str) -> Tuple[str, str, str, bool]:
+        """
+        Normalize a text and detect its script, language and heading likelihood.
+        
+        The script is detected, and the text lowercased, only once, and shared
+        by the other steps.
+        
+        Args:
+            text: Raw text to analyze
+            
+        Returns:
+            Tuple of (normalized_text, language, script, is_heading_candidate)
+        """
+        normalized_text, script = self._normalize_text(text)
+        if script is None:
+            script = self.detect_script(normalized_text)
+        text_lower = normalized_text.lower()
+        language = self.detect_language(normalized_text, script, text_lower)
         
-        return text
+        return normalized_text, language, script, self.is_heading_text(normalized_text, language, text_lower)
     
     def detect_script(self, text: str) -> str:
         """
@@ -119,66 +318,60 @@ class MultilingualSupport:
         if not text:
             return 'unknown'
         
-        script_counts = {}
+        # ASCII text can only contain Latin letters
+        if text.isascii():
+            return 'latin' if LATIN_LETTER_RE.search(text) else 'unknown'
         
-        for script, pattern in self.script_patterns.items():
-            matches = len(re.findall(pattern, text))
-            if matches > 0:
-                script_counts[script] = matches
+        # Count the characters of each script in a single translation pass
+        marked_text = text.translate(SCRIPT_TRANSLATION)
+        script_counts = [marked_text.count(marker) for marker in SCRIPT_MARKERS]
         
-        if not script_counts:
+        highest_count = max(script_counts)
+        if not highest_count:
             return 'unknown'
         
-        # Return script with highest count
-        return max(script_counts, key=script_counts.get)
+        # Return script with highest count (the first one on ties)
+        return SCRIPT_NAMES[script_counts.index(highest_count)]
     
-    def detect_language(self, text: str) -> str:
+    def detect_language(self, text: str, script: str = None, text_lower: str = None) -> str:
         """
         Simple language detection based on script and patterns.
         
         Args:
             text: Text to analyze
+            script: Script of the text, if already detected
+            text_lower: Lowercased text, if already computed
             
         Returns:
             Detected language code
         """
-        script = self.detect_script(text)
+        if not script:
+            script = self.detect_script(text)
         
-        # Script-based language mapping
-        script_language_map = {
-            'latin': 'english',  # Default to English for Latin script
-            'cyrillic': 'russian',
-            'arabic': 'arabic',
-            'chinese': 'chinese',
-            'japanese_hiragana': 'japanese',
-            'japanese_katakana': 'japanese',
-            'korean': 'korean',
-            'thai': 'thai',
-            'devanagari': 'hindi',
-        }
-        
-        base_language = script_language_map.get(script, 'english')
+        base_language = SCRIPT_LANGUAGES.get(script, 'english')
         
         # For Latin script, try to detect specific language
         if script == 'latin':
-            text_lower = text.lower()
+            if text_lower is None:
+                text_lower = text.lower()
             
-            # Check for language-specific patterns
-            for lang, patterns in self.heading_patterns.items():
-                if lang in ['spanish', 'french', 'german']:
-                    for pattern in patterns:
-                        if re.search(pattern, text_lower, re.IGNORECASE):
-                            return lang
+            # Check for language-specific patterns (the first language that matches wins,
+            # wherever in the text its match is)
+            if _may_match(text_lower, LATIN_LANGUAGES_QUICK_CHECK) and LATIN_LANGUAGES_RE.search(text_lower):
+                for lang in LATIN_LANGUAGES:
+                    if HEADING_REGEXES[lang].search(text_lower):
+                        return lang
         
         return base_language
     
-    def is_heading_text(self, text: str, language: str = None) -> bool:
+    def is_heading_text(self, text: str, language: str = None, text_lower: str = None) -> bool:
         """
         Check if text appears to be a heading based on language patterns.
         
         Args:
             text: Text to check
             language: Language to use for pattern matching
+            text_lower: Lowercased text, if already computed
             
         Returns:
             True if text appears to be a heading
@@ -186,30 +379,20 @@ class MultilingualSupport:
         if not text:
             return False
         
-        if not language:
-            language = self.detect_language(text)
+        if text_lower is None:
+            text_lower = text.lower()
         
-        text_lower = text.lower()
+        if not language:
+            language = self.detect_language(text, text_lower=text_lower)
         
         # Check language-specific heading patterns
-        patterns = self.heading_patterns.get(language, self.heading_patterns['english'])
-        
-        for pattern in patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                return True
+        if language not in HEADING_REGEXES:
+            language = 'english'
+        if _may_match(text_lower, HEADING_QUICK_CHECKS[language]) and HEADING_REGEXES[language].search(text_lower):
+            return True
         
         # Universal heading indicators
-        universal_patterns = [
-            r'^\d+\.?\s*[A-Z\u00C0-\u017F\u0400-\u04FF\u4e00-\u9fff]',  # Numbered sections
-            r'^[IVX]+\.?\s*[A-Z\u00C0-\u017F\u0400-\u04FF\u4e00-\u9fff]',  # Roman numerals
-            r'^[A-Z\u00C0-\u017F\u0400-\u04FF\u4e00-\u9fff][A-Z\u00C0-\u017F\u0400-\u04FF\u4e00-\u9fff\s]{2,}$',  # All caps
-        ]
-        
-        for pattern in universal_patterns:
-            if re.search(pattern, text):
-                return True
-        
-        return False
+        return UNIVERSAL_HEADING_RE.search(text) is not None
     
     def enhance_text_extraction(self, text_blocks: List[Dict]) -> List[Dict]:
         """
@@ -226,30 +409,56 @@ class MultilingualSupport:
         for block in text_blocks:
             text = block.get('text', '')
             
-            # Normalize text
-            normalized_text = self.normalize_text(text)
-            
-            # Detect language and script
-            language = self.detect_language(normalized_text)
-            script = self.detect_script(normalized_text)
-            
-            # Check if it's likely a heading
-            is_heading_candidate = self.is_heading_text(normalized_text, language)
+            # Normalize text, detect language and script, and check if it's likely a heading
+            normalized_text, language, script, is_heading_candidate = self._analyze(text)
             
             # Create enhanced block
-            enhanced_block = block.copy()
-            enhanced_block.update({
+            enhanced_blocks.append({
+                **block,
                 'text': text,  # Keep original text
                 'normalized_text': normalized_text,
                 'detected_language': language,
                 'detected_script': script,
                 'is_heading_candidate': is_heading_candidate,
             })
-            
-            enhanced_blocks.append(enhanced_block)
         
         return enhanced_blocks
     
+    def process_texts(self, texts: List[str]) -> Tuple[List[str], List[str], List[str], List[bool]]:
+        """
+        Apply language-aware processing to a column of texts.
+        
+        Column-oriented counterpart of enhance_text_extraction for callers that
+        keep block properties in parallel arrays instead of dictionaries.
+        
+        Args:
+            texts: List of block texts
+            
+        Returns:
+            Tuple of (normalized_texts, languages, scripts, heading_flags)
+        """
+        normalized_texts = []
+        languages = []
+        scripts = []
+        heading_flags = []
+        
+        # Headers, footers and page numbers repeat across pages; process each
+        # distinct text once per call
+        processed = {}
+        
+        for text in texts:
+            text_info = processed.get(text)
+            if text_info is None:
+                text_info = processed[text] = self._analyze(text)
+            
+            normalized_text, language, script, is_heading_candidate = text_info
+            normalized_texts.append(normalized_text)
+            languages.append(language)
+            scripts.append(script)
+            heading_flags.append(is_heading_candidate)
+        
+        return normalized_texts, languages, scripts, heading_flags
+    
     def get_language_config(self, language: str) -> Dict:
         """
         Get language-specific configuration for text processing.
@@ -260,31 +469,4 @@ class MultilingualSupport:
         Returns:
             Configuration dictionary
         """
-        configs = {
-            'english': {
-                'reading_direction': 'ltr',
-                'word_separator': ' ',
-                'punctuation': r'[.!?;:]',
-                'case_sensitive': False,
-            },
-            'arabic': {
-                'reading_direction': 'rtl',
-                'word_separator': ' ',
-                'punctuation': r'[.!?؟;:]',
-                'case_sensitive': False,
-            },
-            'chinese': {
-                'reading_direction': 'ltr',
-                'word_separator': '',
-                'punctuation': r'[。！？；：]',
-                'case_sensitive': False,
-            },
-            'japanese': {
-                'reading_direction': 'ltr',
-                'word_separator': '',
-                'punctuation': r'[。！？；：]',
-                'case_sensitive': False,
-            },
-        }
-        
-        return configs.get(language, configs['english'])
+        return LANGUAGE_CONFIGS.get(language, LANGUAGE_CONFIGS['english'])
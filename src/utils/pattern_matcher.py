@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Multi-pattern substring matching for DocuDots PDF Structure Analysis Tool
+Adobe India Hackathon - Challenge 1A
+"""
+
+from typing import FrozenSet, Iterable
+
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick not available, fall back to one substring test per pattern
+    ahocorasick = None
+
+
+class SubstringMatcher:
+    """
+    Finds which of a fixed set of substrings occur in a text.
+    
+    With pyahocorasick installed, all patterns are matched in a single pass
+    over the text by an Aho-Corasick automaton built once, up front.
+    Otherwise each pattern is tested with ``in``.
+    """
+    
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Initialize the matcher.
+        
+        Args:
+            patterns: Substrings to look for (duplicates are ignored)
+        """
+        self.patterns = tuple(dict.fromkeys(patterns))
+        self._automaton = None
+        
+        if ahocorasick is not None and self.patterns:
+            self._automaton = ahocorasick.Automaton()
+            for pattern in self.patterns:
+                self._automaton.add_word(pattern, pattern)
+            self._automaton.make_automaton()
+    
+    def matches(self, text: str) -> FrozenSet[str]:
+        """
+        Get the patterns that occur in a text.
+        
+        Args:
+            text: Text to search
+        
+        Returns:
+            Set of distinct patterns found (each counted once, however often it occurs)
+        """
+        if self._automaton is not None:
+            return frozenset(pattern for _, pattern in self._automaton.iter(text))
+        return frozenset(pattern for pattern in self.patterns if pattern in text)
+    
+    def count(self, text: str) -> int:
+        """
+        Count the distinct patterns that occur in a text.
+        
+        Args:
+            text: Text to search
+        
+        Returns:
+            Number of distinct patterns found
+        """
+        return len(self.matches(text))
+    
+    def contains_any(self, text: str) -> bool:
+        """
+        Check whether any pattern occurs in a text.
+        
+        Args:
+            text: Text to search
+        
+        Returns:
+            True if at least one pattern is found
+        """
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        return any(pattern in text for pattern in self.patterns)
@@ -5,8 +5,11 @@ Adobe India Hackathon - Challenge 1A
 """
 
 import time
+import signal
 import functools
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from typing import Callable, Any, Type, Tuple, Optional
 
 from .exceptions import PDFProcessingError, ResourceLimitError
@@ -37,6 +40,9 @@ def retry(
             # Your processing code here
             pass
     """
+    # Exponential backoff schedule, computed once for every call of the decorated function
+    wait_times = tuple(backoff_factor ** attempt for attempt in range(max(max_attempts - 1, 0)))
+    
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
@@ -59,8 +65,8 @@ def retry(
                         logger.error(f"All {max_attempts} attempts failed for {func.__name__}: {e}")
                         break
                     
-                    # Calculate wait time with exponential backoff
-                    wait_time = backoff_factor ** attempt
+                    # Wait time with exponential backoff
+                    wait_time = wait_times[attempt]
                     logger.warning(f"Attempt {attempt + 1}/{max_attempts} failed for {func.__name__}: {e}. "
                                  f"Retrying in {wait_time:.1f}s...")
                     
@@ -91,6 +97,11 @@ def timeout(seconds: int = 300):
     """
     Timeout decorator for long-running operations.
     
+    On the main thread of a POSIX process the call is interrupted with SIGALRM.
+    Elsewhere (other threads, Windows) it runs in a helper thread and the caller
+    stops waiting for it after the timeout; the abandoned call keeps running in
+    the background, so the decorated function must tolerate that.
+    
     Args:
         seconds: Timeout in seconds (default: 5 minutes)
     
@@ -103,7 +114,9 @@ def timeout(seconds: int = 300):
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            import signal
+            # Signals can only be handled on the main thread, and SIGALRM is POSIX-only
+            if not hasattr(signal, 'SIGALRM') or threading.current_thread() is not threading.main_thread():
+                return _call_with_thread_timeout(func, seconds, args, kwargs)
             
             class TimeoutError(Exception):
                 pass
@@ -134,6 +147,29 @@ def timeout(seconds: int = 300):
     return decorator
 
 
+def _call_with_thread_timeout(func: Callable, seconds: int, args: tuple, kwargs: dict) -> Any:
+    """
+    Run a function in a helper thread and wait for its result at most ``seconds``.
+    
+    Raises:
+        ResourceLimitError: If the function did not finish in time
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"timeout-{func.__name__}")
+    try:
+        future = executor.submit(func, *args, **kwargs)
+        return future.result(timeout=seconds)
+    except FuturesTimeoutError as e:
+        logger.error(f"Timeout in {func.__name__}: timed out after {seconds} seconds")
+        raise ResourceLimitError(
+            f"Processing timed out after {seconds} seconds",
+            resource_type="processing_time",
+            limit=f"{seconds}s"
+        ) from e
+    finally:
+        # Do not wait for a call that timed out
+        executor.shutdown(wait=False)
+
+
 def log_performance(func: Callable) -> Callable:
     """
     Decorator to log function performance metrics.
@@ -149,11 +185,11 @@ def log_performance(func: Callable) -> Callable:
     """
     @functools.wraps(func)
     def wrapper(*args, **kwargs) -> Any:
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             result = func(*args, **kwargs)
-            end_time = time.time()
+            end_time = time.perf_counter()
             execution_time = end_time - start_time
             
             logger.info(f"Performance: {func.__name__} completed in {execution_time:.2f}s")
@@ -161,7 +197,7 @@ def log_performance(func: Callable) -> Callable:
             return result
             
         except Exception as e:
-            end_time = time.time()
+            end_time = time.perf_counter()
             execution_time = end_time - start_time
             
             logger.error(f"Performance: {func.__name__} failed after {execution_time:.2f}s: {e}")
@@ -191,36 +227,43 @@ class CircuitBreaker:
         self.failure_count = 0
         self.last_failure_time = None
         self.state = 'CLOSED'  # CLOSED, OPEN, HALF_OPEN
+        # Guards state transitions and failure counting; the CLOSED fast path
+        # only reads self.state and never takes it
+        self._lock = threading.Lock()
     
     def __call__(self, func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            if self.state == 'OPEN':
-                if self._should_attempt_reset():
-                    self.state = 'HALF_OPEN'
-                    logger.info(f"Circuit breaker for {func.__name__} moving to HALF_OPEN")
-                else:
-                    raise PDFProcessingError(
-                        f"Circuit breaker is OPEN for {func.__name__}. "
-                        f"Too many recent failures ({self.failure_count}/{self.failure_threshold})",
-                        stage="circuit_breaker"
-                    )
+            state = self.state
+            if state == 'OPEN':
+                with self._lock:
+                    if self.state == 'OPEN':
+                        if not self._should_attempt_reset():
+                            raise PDFProcessingError(
+                                f"Circuit breaker is OPEN for {func.__name__}. "
+                                f"Too many recent failures ({self.failure_count}/{self.failure_threshold})",
+                                stage="circuit_breaker"
+                            )
+                        self.state = 'HALF_OPEN'
+                        logger.info(f"Circuit breaker for {func.__name__} moving to HALF_OPEN")
+                    state = self.state
             
             try:
                 result = func(*args, **kwargs)
-                
-                # Success - reset circuit breaker
-                if self.state == 'HALF_OPEN':
-                    self.state = 'CLOSED'
-                    self.failure_count = 0
-                    logger.info(f"Circuit breaker for {func.__name__} reset to CLOSED")
-                
-                return result
-                
             except Exception as e:
                 self._record_failure()
                 logger.warning(f"Circuit breaker recorded failure for {func.__name__}: {e}")
                 raise
+            
+            # Success - reset circuit breaker
+            if state == 'HALF_OPEN':
+                with self._lock:
+                    if self.state == 'HALF_OPEN':
+                        self.state = 'CLOSED'
+                        self.failure_count = 0
+                        logger.info(f"Circuit breaker for {func.__name__} reset to CLOSED")
+            
+            return result
         
         return wrapper
     
@@ -229,16 +272,17 @@ class CircuitBreaker:
         if self.last_failure_time is None:
             return True
         
-        return time.time() - self.last_failure_time >= self.recovery_timeout
+        return time.monotonic() - self.last_failure_time >= self.recovery_timeout
     
     def _record_failure(self):
         """Record a failure and update circuit breaker state."""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-        
-        if self.failure_count >= self.failure_threshold:
-            self.state = 'OPEN'
-            logger.warning(f"Circuit breaker opened due to {self.failure_count} failures")
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.monotonic()
+            
+            if self.failure_count >= self.failure_threshold:
+                self.state = 'OPEN'
+                logger.warning(f"Circuit breaker opened due to {self.failure_count} failures")
 
 
 # Pre-configured retry decorators for common scenarios
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Heading and title scoring kernels for DocuDots PDF Structure Analysis Tool
+Adobe India Hackathon - Challenge 1A
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+# Candidate lists shorter than this never pay numba's import and JIT/cache-load cost
+COMPILED_MIN_CANDIDATES = 2048
+
+# Compiled kernels by name: None until first needed, False if numba is unavailable
+_compiled_kernels = None
+
+# Loop kernels iterate with prange: plain range in Python, numba.prange once compiled
+prange = range
+
+
+# (h1, h2, h3) score of each tier of a feature, tiers in the order of the
+# cascade in _score_levels_loop
+
+# Position: very top of page, upper portion, middle portion, lower portion
+POSITION_TIER_SCORES = ((20, 0, 0), (10, 15, 0), (0, 10, 5), (0, 0, 10))
+
+# Text length: single words, short phrases, medium phrases, long phrases
+LENGTH_TIER_SCORES = ((15, 10, 0), (10, 15, 5), (0, 10, 10), (0, 0, 5))
+
+# Size ratio: >= 2.0, >= 1.6, >= 1.3, >= 1.1, smaller
+SIZE_TIER_SCORES = ((20, 0, 0), (15, 10, 0), (5, 15, 5), (0, 10, 10), (0, 0, 15))
+
+# Bold formatting: regular, bold
+BOLD_SCORES = ((0, 0, 0), (15, 15, 10))
+
+# Summed (h1, h2, h3) score of every (size tier, bold, length tier, position tier) key
+SCORE_TABLE = np.array([
+    [size[level] + bold[level] + length[level] + position[level] for level in range(3)]
+    for size in SIZE_TIER_SCORES
+    for bold in BOLD_SCORES
+    for length in LENGTH_TIER_SCORES
+    for position in POSITION_TIER_SCORES
+], dtype=np.int64)
+H1_TABLE, H2_TABLE, H3_TABLE = (SCORE_TABLE[:, level].copy() for level in range(3))
+
+
+def _score_levels_numpy(font_sizes: np.ndarray, is_bold: np.ndarray, word_counts: np.ndarray,
+                        position_y: np.ndarray, body_font_size: float
+                        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Table-driven implementation: pack each candidate's tiers into a key, then gather its scores."""
+    # Tiers are counted from comparisons so that NaN falls into the same
+    # (final) branch of the cascade as in the loop implementation
+    size_ratios = font_sizes / body_font_size
+    size_tier = 4 - ((size_ratios >= 1.1).astype(np.int64) + (size_ratios >= 1.3)
+                     + (size_ratios >= 1.6) + (size_ratios >= 2.0))
+    length_tier = (word_counts != 1).astype(np.int64) + (word_counts > 3) + (word_counts > 6)
+    position_tier = 3 - ((position_y < 150).astype(np.int64) + (position_y < 300) + (position_y < 500))
+    
+    key = ((size_tier * 2 + is_bold) * 4 + length_tier) * 4 + position_tier
+    return H1_TABLE[key], H2_TABLE[key], H3_TABLE[key]
+
+
+def _score_levels_loop(font_sizes, is_bold, word_counts, position_y, body_font_size):
+    """Single-pass loop implementation of the scoring tiers, compiled with numba."""
+    n = font_sizes.shape[0]
+    h1_scores = np.zeros(n, dtype=np.int64)
+    h2_scores = np.zeros(n, dtype=np.int64)
+    h3_scores = np.zeros(n, dtype=np.int64)
+    
+    for i in prange(n):
+        position = position_y[i]
+        if position < 150:
+            h1_scores[i] += 20
+        elif position < 300:
+            h1_scores[i] += 10
+            h2_scores[i] += 15
+        elif position < 500:
+            h2_scores[i] += 10
+            h3_scores[i] += 5
+        else:
+            h3_scores[i] += 10
+        
+        word_count = word_counts[i]
+        if word_count == 1:
+            h1_scores[i] += 15
+            h2_scores[i] += 10
+        elif word_count <= 3:
+            h1_scores[i] += 10
+            h2_scores[i] += 15
+            h3_scores[i] += 5
+        elif word_count <= 6:
+            h2_scores[i] += 10
+            h3_scores[i] += 10
+        else:
+            h3_scores[i] += 5
+        
+        size_ratio = font_sizes[i] / body_font_size
+        if size_ratio >= 2.0:
+            h1_scores[i] += 20
+        elif size_ratio >= 1.6:
+            h1_scores[i] += 15
+            h2_scores[i] += 10
+        elif size_ratio >= 1.3:
+            h1_scores[i] += 5
+            h2_scores[i] += 15
+            h3_scores[i] += 5
+        elif size_ratio >= 1.1:
+            h2_scores[i] += 10
+            h3_scores[i] += 10
+        else:
+            h3_scores[i] += 15
+        
+        if is_bold[i]:
+            h1_scores[i] += 15
+            h2_scores[i] += 15
+            h3_scores[i] += 10
+    
+    return h1_scores, h2_scores, h3_scores
+
+
+def _title_scores_numpy(font_sizes: np.ndarray, is_bold: np.ndarray, page_numbers: np.ndarray,
+                        y_positions: np.ndarray, word_counts: np.ndarray) -> np.ndarray:
+    """Vectorized implementation of the numeric title score bonuses, added in cascade order."""
+    # Font size (0-40 points); fmin keeps the 40 cap for NaN sizes like min() does
+    title_scores = np.fmin(40, font_sizes * 2)
+    
+    # Bold text bonus (0-20 points)
+    title_scores += np.where(is_bold, 20, 0)
+    
+    # Page position bonus (0-20 points)
+    title_scores += np.select([page_numbers == 1, page_numbers == 2], [20, 10], 0)
+    
+    # Y-position bonus (higher on page = better, 0-15 points): top of page, upper portion
+    title_scores += np.select([y_positions < 200, y_positions < 400], [15, 10], 0)
+    
+    # Text characteristics (0-15 points): reasonable title length
+    title_scores += np.where((word_counts >= 2) & (word_counts <= 12), 15 - np.abs(word_counts - 6), 0)
+    
+    return title_scores
+
+
+def _title_scores_loop(font_sizes, is_bold, page_numbers, y_positions, word_counts):
+    """Single-pass loop implementation of the title score bonuses, compiled with numba."""
+    n = font_sizes.shape[0]
+    title_scores = np.empty(n, dtype=np.float64)
+    
+    for i in prange(n):
+        score = font_sizes[i] * 2
+        if not score < 40:
+            score = 40.0
+        
+        if is_bold[i]:
+            score += 20
+        
+        if page_numbers[i] == 1:
+            score += 20
+        elif page_numbers[i] == 2:
+            score += 10
+        
+        if y_positions[i] < 200:
+            score += 15
+        elif y_positions[i] < 400:
+            score += 10
+        
+        word_count = word_counts[i]
+        if 2 <= word_count <= 12:
+            score += 15 - abs(word_count - 6)
+        
+        title_scores[i] = score
+    
+    return title_scores
+
+
+def _get_compiled_kernels():
+    """Import numba and compile the loop kernels on first use."""
+    global _compiled_kernels, prange
+    
+    if _compiled_kernels is None:
+        try:
+            import numba
+            prange = numba.prange
+            compile_kernel = numba.njit(cache=True, boundscheck=False, nogil=True, parallel=True)
+            _compiled_kernels = {
+                'heading_levels': compile_kernel(_score_levels_loop),
+                'title_scores': compile_kernel(_title_scores_loop),
+            }
+        except ImportError:
+            # numba not available, use the NumPy implementations
+            _compiled_kernels = False
+    
+    return _compiled_kernels
+
+
+def score_heading_levels(font_sizes: np.ndarray, is_bold: np.ndarray, word_counts: np.ndarray,
+                         position_y: np.ndarray, body_font_size: float
+                         ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the position, length, size and weight parts of the H1/H2/H3 scores.
+    
+    Args:
+        font_sizes: Font size of each candidate
+        is_bold: Whether each candidate is bold
+        word_counts: Number of whitespace-separated words of each candidate
+        position_y: Top coordinate of each candidate
+        body_font_size: Body text font size
+    
+    Returns:
+        Tuple of (h1_scores, h2_scores, h3_scores) int64 arrays
+    """
+    if font_sizes.shape[0] >= COMPILED_MIN_CANDIDATES:
+        compiled_kernels = _get_compiled_kernels()
+        if compiled_kernels:
+            return compiled_kernels['heading_levels'](
+                font_sizes, is_bold, word_counts, position_y, float(body_font_size)
+            )
+    
+    return _score_levels_numpy(font_sizes, is_bold, word_counts, position_y, body_font_size)
+
+
+def score_title_candidates(font_sizes: np.ndarray, is_bold: np.ndarray, page_numbers: np.ndarray,
+                           y_positions: np.ndarray, word_counts: np.ndarray) -> np.ndarray:
+    """
+    Compute the font size, bold, page, position and length parts of the title scores.
+    
+    Args:
+        font_sizes: Font size of each candidate
+        is_bold: Whether each candidate is bold
+        page_numbers: Page number of each candidate
+        y_positions: Top coordinate of each candidate, rounded to 2 decimals
+        word_counts: Number of whitespace-separated words of each candidate
+    
+    Returns:
+        float64 array of partial title scores
+    """
+    if font_sizes.shape[0] >= COMPILED_MIN_CANDIDATES:
+        compiled_kernels = _get_compiled_kernels()
+        if compiled_kernels:
+            return compiled_kernels['title_scores'](font_sizes, is_bold, page_numbers, y_positions, word_counts)
+    
+    return _title_scores_numpy(font_sizes, is_bold, page_numbers, y_positions, word_counts)
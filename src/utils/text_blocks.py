@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Columnar text block storage for DocuDots PDF Structure Analysis Tool
+Adobe India Hackathon - Challenge 1A
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+def round2(values: np.ndarray) -> np.ndarray:
+    """
+    Round an array to 2 decimals, giving exactly what Python's round(value, 2) gives.
+    
+    np.round scales by 100 and rounds to an integer, which can pick the other
+    neighbour when the scaled value lands within floating point error of a
+    .5 tie; those few elements are rounded with round() instead.
+    
+    Args:
+        values: Float array
+    
+    Returns:
+        New array of rounded values
+    """
+    scaled = values * 100
+    rounded = np.rint(scaled) / 100
+    
+    with np.errstate(invalid='ignore'):  # inf/nan never count as near a tie
+        near_tie = np.abs(scaled - np.floor(scaled) - 0.5) <= 1e-9 * np.maximum(np.abs(scaled), 1.0)
+    for index in np.flatnonzero(near_tie).tolist():
+        rounded[index] = round(values[index].item(), 2)
+    return rounded
+
+
+@dataclass(slots=True)
+class HeadingCandidate:
+    """A text block that passed heading filtering, with the fields used to classify it."""
+    text: str
+    font_size: float
+    is_bold: bool
+    page_number: int
+    position: Dict[str, float]
+    heading_score: float
+    detected_language: str
+    text_lower: str
+    word_count: int
+
+
+class TextBlocks:
+    """
+    Struct-of-arrays container for the text spans extracted from a PDF.
+    
+    Numeric span properties live in parallel NumPy arrays, texts and font
+    names in plain lists. Block dictionaries are only built on request
+    (see to_dict) for the few blocks that need one, e.g. heading candidates.
+    
+    The bounding box is stored once, unrounded; the rounded coordinates,
+    width and height of a block's position are derived when it is read.
+    """
+    
+    def __init__(self, texts: List[str], font_names: List[str], font_sizes: np.ndarray,
+                 is_bold: np.ndarray, page_numbers: np.ndarray, bboxes: np.ndarray):
+        """
+        Initialize a block store from its columns.
+        
+        Args:
+            texts: Stripped text of each block
+            font_names: Font name of each block
+            font_sizes: Font size of each block, rounded to 2 decimals (see round2)
+            is_bold: Whether each block is bold
+            page_numbers: 0-indexed page number of each block
+            bboxes: (N, 4) unrounded bounding box (x0, y0, x1, y1) of each block
+        """
+        self.texts = texts
+        self.font_names = font_names
+        self.font_sizes = font_sizes
+        self.is_bold = is_bold
+        self.page_numbers = page_numbers
+        self.bboxes = bboxes
+        
+        # Language information, set by set_language_info
+        self.normalized_texts: Optional[List[str]] = None
+        self.languages: Optional[List[str]] = None
+        self.scripts: Optional[List[str]] = None
+        self.heading_flags: Optional[np.ndarray] = None
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    def y_position(self, index: int) -> float:
+        """Top coordinate of a block, rounded to 2 decimals."""
+        return round(self.bboxes[index, 1].item(), 2)
+    
+    @classmethod
+    def from_spans(cls, spans: Iterable[Sequence[Any]]) -> "TextBlocks":
+        """
+        Build a block store from a stream of spans.
+        
+        The spans are consumed one at a time straight into the column arrays,
+        so no per-span list of rows is kept alongside them.
+        
+        Args:
+            spans: (text, font_name, font_size, is_bold, page_number, x0, y0, x1, y1)
+                of each block, unrounded
+        
+        Returns:
+            TextBlocks: New block store
+        """
+        texts = []
+        font_names = []
+        
+        def numeric_rows():
+            for text, font_name, *row in spans:
+                texts.append(text)
+                font_names.append(font_name)
+                yield row
+        
+        table = np.fromiter(numeric_rows(), dtype=np.dtype((np.float64, 7)))
+        return cls(
+            texts, font_names,
+            font_sizes=round2(table[:, 0]),
+            is_bold=table[:, 1].astype(bool),
+            page_numbers=table[:, 2].astype(np.int32),
+            bboxes=table[:, 3:7].copy()
+        )
+    
+    @classmethod
+    def concatenate(cls, parts: Sequence["TextBlocks"]) -> "TextBlocks":
+        """
+        Merge several block stores, in order, into a new one.
+        
+        Args:
+            parts: Block stores to merge (without language information)
+        
+        Returns:
+            TextBlocks: Merged block store
+        """
+        return cls(
+            [text for part in parts for text in part.texts],
+            [font_name for part in parts for font_name in part.font_names],
+            font_sizes=np.concatenate([part.font_sizes for part in parts]),
+            is_bold=np.concatenate([part.is_bold for part in parts]),
+            page_numbers=np.concatenate([part.page_numbers for part in parts]),
+            bboxes=np.concatenate([part.bboxes for part in parts])
+        )
+    
+    def set_language_info(self, normalized_texts: List[str], languages: List[str],
+                          scripts: List[str], heading_flags: Iterable[bool]) -> None:
+        """
+        Attach per-block language information.
+        
+        Args:
+            normalized_texts: Normalized text of each block
+            languages: Detected language of each block
+            scripts: Detected script of each block
+            heading_flags: Whether each block matches a multilingual heading pattern
+        """
+        self.normalized_texts = normalized_texts
+        self.languages = languages
+        self.scripts = scripts
+        self.heading_flags = np.fromiter(heading_flags, dtype=bool, count=len(self))
+    
+    def truncate(self, max_blocks: int) -> None:
+        """
+        Drop every block after the first ``max_blocks``.
+        
+        Args:
+            max_blocks: Number of blocks to keep
+        """
+        self.texts = self.texts[:max_blocks]
+        self.font_names = self.font_names[:max_blocks]
+        self.font_sizes = self.font_sizes[:max_blocks]
+        self.is_bold = self.is_bold[:max_blocks]
+        self.page_numbers = self.page_numbers[:max_blocks]
+        self.bboxes = self.bboxes[:max_blocks]
+        if self.normalized_texts is not None:
+            self.normalized_texts = self.normalized_texts[:max_blocks]
+            self.languages = self.languages[:max_blocks]
+            self.scripts = self.scripts[:max_blocks]
+            self.heading_flags = self.heading_flags[:max_blocks]
+    
+    def position(self, index: int) -> Dict[str, float]:
+        """
+        Build the position dictionary of a single block.
+        
+        Args:
+            index: Block index
+        
+        Returns:
+            Rounded x, y, width and height of the block
+        """
+        x0, y0, x1, y1 = self.bboxes[index].tolist()
+        return {
+            "x": round(x0, 2),
+            "y": round(y0, 2),
+            "width": round(x1 - x0, 2),
+            "height": round(y1 - y0, 2)
+        }
+    
+    def to_dict(self, index: int) -> Dict[str, Any]:
+        """
+        Build the dictionary form of a single block.
+        
+        Args:
+            index: Block index
+        
+        Returns:
+            Dictionary with the same keys as a block from the dict-based pipeline
+        """
+        x0, y0, x1, y1 = self.bboxes[index].tolist()
+        block = {
+            "text": self.texts[index],
+            "font_size": self.font_sizes[index].item(),
+            "font_name": self.font_names[index],
+            "is_bold": bool(self.is_bold[index]),
+            "page_number": int(self.page_numbers[index]),
+            "position": self.position(index),
+            "bbox": [round(x0, 2), round(y0, 2), round(x1, 2), round(y1, 2)]
+        }
+        
+        if self.normalized_texts is not None:
+            block.update({
+                "normalized_text": self.normalized_texts[index],
+                "detected_language": self.languages[index],
+                "detected_script": self.scripts[index],
+                "is_heading_candidate": bool(self.heading_flags[index]),
+            })
+        
+        return block
+    
+    def to_dicts(self, indices: Iterable[int]) -> List[Dict[str, Any]]:
+        """
+        Build the dictionary form of several blocks.
+        
+        Args:
+            indices: Block indices
+        
+        Returns:
+            List of block dictionaries
+        """
+        return [self.to_dict(index) for index in indices]
@@ -5,30 +5,136 @@ Adobe India Hackathon - Challenge 1A
 """
 
 import os
+import stat
+import functools
+import time
 import tempfile
+import multiprocessing
 from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
 import logging
 import fitz  # PyMuPDF
 
-from .exceptions import PDFValidationError, ResourceLimitError
+from .exceptions import DocuDotsError, PDFValidationError, ResourceLimitError
 from .config import config
 
 logger = logging.getLogger(__name__)
 
+# Smallest number of files worth starting validation worker processes for
+MIN_PARALLEL_VALIDATION_FILES = 4
+
+# Maximum number of file versions remembered by each structure check cache
+VALIDATION_CACHE_SIZE = 1024
+
+# Seconds for which a failed structure check is reused
+NEGATIVE_CACHE_TTL_SECONDS = 300
+
+# Seconds for which a system resource check is reused
+RESOURCE_CHECK_TTL_SECONDS = 5
+
+# File versions, keyed on (absolute path, st_mtime_ns, st_size), whose structure
+# check passed; a modified file gets a new key and is checked again
+_valid_structures: Dict[Tuple[str, int, int], None] = {}
+
+# File versions whose structure check failed, with the error raised and when
+_invalid_structures: Dict[Tuple[str, int, int], Tuple[DocuDotsError, float]] = {}
+
+
+def _remember_structure(cache: Dict[Tuple[str, int, int], Any], cache_key: Tuple[str, int, int],
+                        value: Any = None) -> None:
+    """Add a file version to a structure check cache, evicting the oldest one when full."""
+    if len(cache) >= VALIDATION_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[cache_key] = value
+
+
+# psutil module, imported by _get_psutil on first use (False if not installed)
+_psutil = None
+
+
+def _get_psutil():
+    """Get the psutil module, importing it only once; None if it is not installed."""
+    global _psutil
+    if _psutil is None:
+        try:
+            import psutil
+            _psutil = psutil
+        except ImportError:
+            _psutil = False
+    return _psutil or None
+
+
+@functools.lru_cache(maxsize=1)
+def _resources_snapshot(epoch: int) -> Dict[str, Any]:
+    """
+    Check available system resources.
+    
+    Args:
+        epoch: Current RESOURCE_CHECK_TTL_SECONDS time slot; a new slot measures again
+    
+    Returns:
+        Dictionary with the available memory and disk space
+    """
+    psutil = _get_psutil()
+    if psutil is None:
+        logger.warning("psutil not available for resource checking")
+        return {
+            'memory_available_mb': 'unknown',
+            'disk_available_gb': 'unknown',
+            'memory_sufficient': True,  # Assume sufficient
+            'disk_sufficient': True
+        }
+    
+    try:
+        # Check available memory
+        memory = psutil.virtual_memory()
+        available_mb = memory.available / (1024 * 1024)
+        
+        # Check available disk space
+        disk = psutil.disk_usage('/')
+        available_gb = disk.free / (1024 * 1024 * 1024)
+        
+        return {
+            'memory_available_mb': round(available_mb),
+            'disk_available_gb': round(available_gb, 1),
+            'memory_sufficient': available_mb > 500,  # Minimum 500MB
+            'disk_sufficient': available_gb > 1.0     # Minimum 1GB
+        }
+    
+    except Exception as e:
+        logger.warning("Could not check system resources: %s", e)
+        return {
+            'memory_available_mb': 'error',
+            'disk_available_gb': 'error',
+            'memory_sufficient': True,
+            'disk_sufficient': True
+        }
+
+
+def clear_negative_cache() -> None:
+    """Forget all failed structure checks, so invalid files are opened again."""
+    _invalid_structures.clear()
+
 
 class PDFValidator:
     """Comprehensive PDF file validator."""
     
     def __init__(self):
         self.config = config
+        # File limits, resolved once instead of on every validated file
+        limits = config.processing_limits
+        self._max_file_size_mb = limits.max_file_size_mb
+        self._max_size_bytes = limits.max_file_size_mb * 1024 * 1024
+        self._max_pages = limits.max_pages
     
-    def validate_pdf_file(self, pdf_path: Path) -> Tuple[bool, Optional[str]]:
+    def validate_pdf_file(self, pdf_path: Path, data: Optional[bytes] = None) -> Tuple[bool, Optional[str]]:
         """
         Comprehensive PDF file validation.
         
         Args:
             pdf_path: Path to the PDF file
+            data: Contents of the file, if already read into memory
             
         Returns:
             Tuple of (is_valid, error_message)
@@ -36,16 +142,35 @@ class PDFValidator:
         Raises:
             PDFValidationError: If validation fails with details
         """
+        is_valid, error_msg, _ = self._validate_pdf_file(pdf_path, data)
+        return is_valid, error_msg
+    
+    def _validate_pdf_file(self, pdf_path: Path, data: Optional[bytes] = None
+                           ) -> Tuple[bool, Optional[str], Optional[Tuple[str, int, int]]]:
+        """
+        Validate a PDF file, as validate_pdf_file does.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            data: Contents of the file, if already read into memory
+            
+        Returns:
+            Tuple of (is_valid, error_message, cache_key), where cache_key is the
+            structure check cache key of the file, or None if it was not checked
+        """
+        cache_key = None
         try:
-            # Check if file exists
-            if not pdf_path.exists():
+            # Check if file exists; a single stat call also answers the type and size checks
+            try:
+                file_stat = pdf_path.stat()
+            except (FileNotFoundError, NotADirectoryError):
                 raise PDFValidationError(
                     f"PDF file does not exist: {pdf_path}",
                     filename=pdf_path.name
                 )
             
             # Check if it's a file (not directory)
-            if not pdf_path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 raise PDFValidationError(
                     f"Path is not a file: {pdf_path}",
                     filename=pdf_path.name
@@ -60,8 +185,7 @@ class PDFValidator:
                 )
             
             # Check file size
-            file_size = pdf_path.stat().st_size
-            max_size_bytes = self.config.processing_limits.max_file_size_mb * 1024 * 1024
+            file_size = file_stat.st_size
             
             if file_size == 0:
                 raise PDFValidationError(
@@ -70,37 +194,67 @@ class PDFValidator:
                     details={'file_size': file_size}
                 )
             
-            if file_size > max_size_bytes:
+            if file_size > self._max_size_bytes:
                 raise ResourceLimitError(
                     f"PDF file too large: {file_size / (1024*1024):.1f}MB > "
-                    f"{self.config.processing_limits.max_file_size_mb}MB",
+                    f"{self._max_file_size_mb}MB",
                     resource_type="file_size",
-                    limit=f"{self.config.processing_limits.max_file_size_mb}MB"
+                    limit=f"{self._max_file_size_mb}MB"
                 )
             
-            # Validate PDF structure and content
-            self._validate_pdf_structure(pdf_path)
+            # Validate PDF structure and content, unless this version of the file
+            # already passed (the directory scan and the analysis both validate it)
+            cache_key = (os.path.abspath(pdf_path), file_stat.st_mtime_ns, file_size)
+            if cache_key not in _valid_structures:
+                self._validate_cached_failure(cache_key)
+                try:
+                    self._validate_pdf_structure(pdf_path, data)
+                except (PDFValidationError, ResourceLimitError) as e:
+                    _remember_structure(_invalid_structures, cache_key, (e, time.monotonic()))
+                    raise
+                _remember_structure(_valid_structures, cache_key)
             
-            logger.info(f"PDF validation passed: {pdf_path.name} "
-                       f"({file_size / (1024*1024):.1f}MB)")
+            logger.info("PDF validation passed: %s (%.1fMB)", pdf_path.name, file_size / (1024*1024))
             
-            return True, None
+            return True, None, cache_key
             
         except (PDFValidationError, ResourceLimitError) as e:
-            logger.error(f"PDF validation failed for {pdf_path.name}: {e}")
-            return False, str(e)
+            logger.error("PDF validation failed for %s: %s", pdf_path.name, e)
+            return False, str(e), cache_key
         
         except Exception as e:
             error_msg = f"Unexpected validation error: {e}"
-            logger.error(f"PDF validation failed for {pdf_path.name}: {error_msg}")
-            return False, error_msg
+            logger.error("PDF validation failed for %s: %s", pdf_path.name, error_msg)
+            return False, error_msg, cache_key
+    
+    def _validate_cached_failure(self, cache_key: Tuple[str, int, int]) -> None:
+        """
+        Re-raise the error of a recent failed structure check of the same file version.
+        
+        Args:
+            cache_key: (absolute path, st_mtime_ns, st_size) of the file
+            
+        Raises:
+            PDFValidationError: If the file failed the check less than
+                NEGATIVE_CACHE_TTL_SECONDS ago
+            ResourceLimitError: Likewise, for a file over a resource limit
+        """
+        cached_failure = _invalid_structures.get(cache_key)
+        if cached_failure is None:
+            return
+        
+        error, failed_at = cached_failure
+        if time.monotonic() - failed_at < NEGATIVE_CACHE_TTL_SECONDS:
+            raise error.with_traceback(None)
+        del _invalid_structures[cache_key]
     
-    def _validate_pdf_structure(self, pdf_path: Path) -> None:
+    def _validate_pdf_structure(self, pdf_path: Path, data: Optional[bytes] = None) -> None:
         """
         Validate internal PDF structure using PyMuPDF.
         
         Args:
             pdf_path: Path to the PDF file
+            data: Contents of the file, opened from memory instead of the path if given
             
         Raises:
             PDFValidationError: If PDF structure is invalid
@@ -108,7 +262,10 @@ class PDFValidator:
         doc = None
         try:
             # Try to open the PDF
-            doc = fitz.open(pdf_path)
+            if data is not None:
+                doc = fitz.open(stream=data, filetype="pdf")
+            else:
+                doc = fitz.open(pdf_path)
             
             # Check if PDF is encrypted (we can't process password-protected PDFs)
             if doc.needs_pass:
@@ -127,42 +284,26 @@ class PDFValidator:
                     details={'page_count': page_count}
                 )
             
-            if page_count > self.config.processing_limits.max_pages:
+            if page_count > self._max_pages:
                 raise ResourceLimitError(
                     f"PDF has too many pages: {page_count} > "
-                    f"{self.config.processing_limits.max_pages}",
+                    f"{self._max_pages}",
                     resource_type="page_count",
-                    limit=str(self.config.processing_limits.max_pages)
+                    limit=str(self._max_pages)
                 )
             
-            # Try to extract text from first page to ensure it's readable
+            # Try to extract text from first page to ensure it's readable; its plain
+            # text is enough to tell whether it has any visible text
             first_page = doc[0]
-            text_dict = first_page.get_text("dict")
-            
-            # Check if we can extract any text blocks
-            text_blocks_found = 0
-            for block in text_dict.get("blocks", []):
-                if "lines" in block:
-                    for line in block["lines"]:
-                        for span in line["spans"]:
-                            if span.get("text", "").strip():
-                                text_blocks_found += 1
-                                break
-                        if text_blocks_found > 0:
-                            break
-                if text_blocks_found > 0:
-                    break
-            
-            if text_blocks_found == 0:
-                logger.warning(f"No text found in first page of {pdf_path.name} "
-                             "(might be image-only PDF)")
+            if not first_page.get_text("text").strip():
+                logger.warning("No text found in first page of %s (might be image-only PDF)", pdf_path.name)
             
-            # Check document metadata
-            metadata = doc.metadata
-            if metadata:
-                logger.debug(f"PDF metadata for {pdf_path.name}: "
-                           f"Title='{metadata.get('title', 'N/A')}', "
-                           f"Author='{metadata.get('author', 'N/A')}'")
+            # Check document metadata (only logged, so only read for debug logging)
+            if logger.isEnabledFor(logging.DEBUG):
+                metadata = doc.metadata
+                if metadata:
+                    logger.debug("PDF metadata for %s: Title='%s', Author='%s'", pdf_path.name,
+                                 metadata.get('title', 'N/A'), metadata.get('author', 'N/A'))
             
         except fitz.FileDataError as e:
             raise PDFValidationError(
@@ -198,13 +339,16 @@ class PDFValidator:
         if not input_dir.is_dir():
             raise PDFValidationError(f"Input path is not a directory: {input_dir}")
         
-        # Find all PDF files
-        pdf_files = list(input_dir.glob("*.pdf"))
+        # Find all PDF files, using the file type cached in each directory entry
+        with os.scandir(input_dir) as entries:
+            pdf_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.lower().endswith('.pdf') and entry.is_file()
+            ]
         valid_files = []
         invalid_files = []
         
-        for pdf_file in pdf_files:
-            is_valid, error_msg = self.validate_pdf_file(pdf_file)
+        for pdf_file, (is_valid, error_msg) in zip(pdf_files, self._validate_pdf_files(pdf_files)):
             if is_valid:
                 valid_files.append(pdf_file)
             else:
@@ -221,10 +365,45 @@ class PDFValidator:
             'invalid_file_details': invalid_files
         }
         
-        logger.info(f"Input validation summary: {summary['valid_files']}/{summary['total_files']} files valid")
+        logger.info("Input validation summary: %d/%d files valid", summary['valid_files'], summary['total_files'])
         
         return summary
     
+    def _validate_pdf_files(self, pdf_files: List[Path]) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Validate several PDF files, in worker processes when there are enough of them.
+        
+        Each file is opened and checked by PyMuPDF, so the checks of different
+        files are spread over up to max_workers processes. The outcome of each
+        check is recorded in this process's structure check caches, so later
+        validations of the same file versions do not open them again.
+        
+        Args:
+            pdf_files: Paths to the PDF files
+            
+        Returns:
+            Tuple of (is_valid, error_message) for each file, in order
+        """
+        workers = min(self.config.processing_limits.max_workers, len(pdf_files))
+        # Batch worker processes validate the input directory as well; they do so in-process
+        if (workers < 2 or len(pdf_files) < MIN_PARALLEL_VALIDATION_FILES
+                or multiprocessing.parent_process() is not None):
+            return [self.validate_pdf_file(pdf_file) for pdf_file in pdf_files]
+        
+        chunksize = max(1, len(pdf_files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_validate_one, map(str, pdf_files), chunksize=chunksize))
+        
+        results = []
+        for is_valid, error_msg, cache_key, cached_failure in outcomes:
+            if cache_key is not None:
+                if is_valid:
+                    _remember_structure(_valid_structures, cache_key)
+                elif cached_failure is not None:
+                    _remember_structure(_invalid_structures, cache_key, cached_failure)
+            results.append((is_valid, error_msg))
+        return results
+    
     def validate_output_directory(self, output_dir: Path) -> bool:
         """
         Validate and prepare output directory.
@@ -239,23 +418,43 @@ class PDFValidator:
             # Create directory if it doesn't exist
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            # Check if we can write to the directory
-            test_file = output_dir / '.docudots_write_test'
+            # Check if we can write to the directory. os.access is a single system call,
+            # but can be wrong under ACLs or on network file systems, so when it denies
+            # access a real (self-deleting) test file has the final say
             try:
-                test_file.write_text('test')
-                test_file.unlink()  # Delete test file
+                if not os.access(output_dir, os.W_OK):
+                    with tempfile.NamedTemporaryFile(dir=output_dir, prefix='.docudots_write_test'):
+                        pass
             except PermissionError:
                 raise PDFValidationError(
                     f"No write permission for output directory: {output_dir}"
                 )
             
-            logger.info(f"Output directory validated: {output_dir}")
+            logger.info("Output directory validated: %s", output_dir)
             return True
             
         except Exception as e:
             raise PDFValidationError(f"Output directory validation failed: {e}")
 
 
+def _validate_one(pdf_path: str) -> Tuple[bool, Optional[str], Optional[Tuple[str, int, int]],
+                                          Optional[Tuple[DocuDotsError, float]]]:
+    """
+    Validate a single PDF file in a validation worker process.
+    
+    Args:
+        pdf_path: Path to the PDF file (paths pickle cheaply)
+        
+    Returns:
+        Tuple of (is_valid, error_message, cache_key, cached_failure), where
+        cache_key and cached_failure are what the parent process records in its
+        structure check caches
+    """
+    is_valid, error_msg, cache_key = PDFValidator()._validate_pdf_file(Path(pdf_path))
+    cached_failure = _invalid_structures.get(cache_key) if cache_key is not None else None
+    return is_valid, error_msg, cache_key, cached_failure
+
+
 class InputValidator:
     """High-level input validation coordinator."""
     
@@ -293,44 +492,15 @@ class InputValidator:
             'ready_for_processing': input_summary['valid_files'] > 0
         }
         
-        logger.info(f"Environment validation complete. Ready: {environment_summary['ready_for_processing']}")
+        logger.info("Environment validation complete. Ready: %s", environment_summary['ready_for_processing'])
         
         return environment_summary
     
+    def clear_negative_cache(self) -> None:
+        """Forget failed PDF structure checks, e.g. after the page limit was raised."""
+        clear_negative_cache()
+        logger.info("Cleared negative validation cache")
+    
     def _check_system_resources(self) -> Dict[str, Any]:
-        """Check available system resources."""
-        try:
-            import psutil
-            
-            # Check available memory
-            memory = psutil.virtual_memory()
-            available_mb = memory.available / (1024 * 1024)
-            
-            # Check available disk space
-            disk = psutil.disk_usage('/')
-            available_gb = disk.free / (1024 * 1024 * 1024)
-            
-            return {
-                'memory_available_mb': round(available_mb),
-                'disk_available_gb': round(available_gb, 1),
-                'memory_sufficient': available_mb > 500,  # Minimum 500MB
-                'disk_sufficient': available_gb > 1.0     # Minimum 1GB
-            }
-            
-        except ImportError:
-            logger.warning("psutil not available for resource checking")
-            return {
-                'memory_available_mb': 'unknown',
-                'disk_available_gb': 'unknown',
-                'memory_sufficient': True,  # Assume sufficient
-                'disk_sufficient': True
-            }
-        
-        except Exception as e:
-            logger.warning(f"Could not check system resources: {e}")
-            return {
-                'memory_available_mb': 'error',
-                'disk_available_gb': 'error',
-                'memory_sufficient': True,
-                'disk_sufficient': True
-            }
+        """Check available system resources (measured at most once per RESOURCE_CHECK_TTL_SECONDS)."""
+        return dict(_resources_snapshot(int(time.monotonic() // RESOURCE_CHECK_TTL_SECONDS)))